@@ -76,6 +76,7 @@ CREATE TABLE companies (
     created_at      TIMESTAMPTZ DEFAULT NOW(),
     updated_at      TIMESTAMPTZ DEFAULT NOW(),
     sync_status     sync_status DEFAULT 'pending',
+    sync_hash       TEXT,                   -- hash of the last synced Procore values (unchanged rows are skipped)
     
     -- Full-text search
     search_vector   TSVECTOR GENERATED ALWAYS AS (
@@ -100,6 +101,7 @@ CREATE TABLE contacts (
     created_at      TIMESTAMPTZ DEFAULT NOW(),
     updated_at      TIMESTAMPTZ DEFAULT NOW(),
     sync_status     sync_status DEFAULT 'pending',
+    sync_hash       TEXT,
     
     search_vector   TSVECTOR GENERATED ALWAYS AS (
         setweight(to_tsvector('english', coalesce(first_name || ' ' || last_name, '')), 'A') ||
@@ -131,6 +133,7 @@ CREATE TABLE projects (
     procore_project_id BIGINT,
     last_synced_at  TIMESTAMPTZ,
     sync_status     sync_status DEFAULT 'pending',
+    sync_hash       TEXT,
     
     is_deleted      BOOLEAN DEFAULT FALSE,
     created_at      TIMESTAMPTZ DEFAULT NOW(),
@@ -216,6 +219,7 @@ CREATE TABLE drawings (
     created_at      TIMESTAMPTZ DEFAULT NOW(),
     updated_at      TIMESTAMPTZ DEFAULT NOW(),
     sync_status     sync_status DEFAULT 'pending',
+    sync_hash       TEXT,
     
     search_vector   TSVECTOR GENERATED ALWAYS AS (
         setweight(to_tsvector('english', coalesce(number, '')), 'A') ||
@@ -287,6 +291,7 @@ CREATE TABLE submittals (
     created_at      TIMESTAMPTZ DEFAULT NOW(),
     updated_at      TIMESTAMPTZ DEFAULT NOW(),
     sync_status     sync_status DEFAULT 'pending',
+    sync_hash       TEXT,
     
     search_vector   TSVECTOR GENERATED ALWAYS AS (
         setweight(to_tsvector('english', coalesce(number, '')), 'A') ||
@@ -363,6 +368,7 @@ CREATE TABLE rfis (
     created_at      TIMESTAMPTZ DEFAULT NOW(),
     updated_at      TIMESTAMPTZ DEFAULT NOW(),
     sync_status     sync_status DEFAULT 'pending',
+    sync_hash       TEXT,
     
     search_vector   TSVECTOR GENERATED ALWAYS AS (
         setweight(to_tsvector('english', coalesce(number, '')), 'A') ||
@@ -636,6 +642,7 @@ CREATE TABLE documents (
     created_at      TIMESTAMPTZ DEFAULT NOW(),
     updated_at      TIMESTAMPTZ DEFAULT NOW(),
     sync_status     sync_status DEFAULT 'pending',
+    sync_hash       TEXT,
     
     search_vector   TSVECTOR GENERATED ALWAYS AS (
         setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
@@ -726,8 +733,11 @@ CREATE TABLE document_chunks (
 -- SYNC TRACKING
 -- =============================================================================
 
+-- Range-partitioned by day: sync_agent creates sync_log_YYYYMMDD partitions
+-- ahead of time and drops them after SYNC_LOG_RETENTION_DAYS; the default
+-- partition only fills if that maintenance stops running
 CREATE TABLE sync_log (
-    id              UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id              UUID NOT NULL DEFAULT uuid_generate_v4(),
     entity_type     TEXT NOT NULL,          -- 'project', 'submittal', 'rfi', etc.
     entity_id       UUID NOT NULL,
     procore_id      BIGINT,
@@ -738,19 +748,112 @@ CREATE TABLE sync_log (
     status          TEXT DEFAULT 'success', -- 'success', 'conflict', 'error'
     error_message   TEXT,
     payload_hash    TEXT,                   -- hash of the synced payload for change detection
-    created_at      TIMESTAMPTZ DEFAULT NOW()
+    created_at      TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE sync_log_default PARTITION OF sync_log DEFAULT;
+
+-- One summary row per sync pass (per shard in sharded mode)
+CREATE TABLE sync_passes (
+    id              BIGSERIAL PRIMARY KEY,
+    scope           TEXT,                   -- shard key; NULL = all of PROCORE_PROJECT_IDS
+    full_listing    BOOLEAN NOT NULL DEFAULT FALSE,
+    started_at      TIMESTAMPTZ NOT NULL,
+    finished_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created         INTEGER NOT NULL DEFAULT 0,
+    updated         INTEGER NOT NULL DEFAULT 0,
+    unchanged       INTEGER NOT NULL DEFAULT 0,
+    deleted         INTEGER NOT NULL DEFAULT 0,
+    errors          INTEGER NOT NULL DEFAULT 0, -- entity passes that failed
+    entities        JSONB NOT NULL          -- {"rfis": {"created": 3, "updated": 12, ...}, ...}
 );
 
 CREATE TABLE sync_cursors (
     id              UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    entity_type     TEXT NOT NULL UNIQUE,   -- 'submittals', 'rfis', etc.
+    entity_type     TEXT NOT NULL UNIQUE,   -- 'submittals', 'rfis', etc.; sharded: 'rfis@project:316469'
     project_id      UUID REFERENCES projects(id),
-    last_synced_at  TIMESTAMPTZ NOT NULL,
+    last_synced_at  TIMESTAMPTZ NOT NULL,   -- start of the last pass; next delta fetches updated_at >= this
+    last_full_sync_at TIMESTAMPTZ,          -- last full listing (deletes are only detected on these)
     last_procore_id BIGINT,
-    cursor_token    TEXT,                   -- Procore pagination cursor
+    cursor_token    TEXT,                   -- Procore pagination cursor / in-progress crawl start
     updated_at      TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Procore webhook queue: one row per delivered event, drained by sync_agent's webhook worker
+CREATE TABLE procore_webhook_events (
+    id              BIGSERIAL PRIMARY KEY,
+    event_key       TEXT NOT NULL UNIQUE,   -- Procore ulid/id; redeliveries collapse here
+    entity_type     TEXT NOT NULL,          -- sync_agent entity: 'rfis', 'submittals', 'drawing_revisions'
+    event_type      TEXT NOT NULL,          -- 'create', 'update', 'delete'
+    procore_project_id BIGINT NOT NULL,
+    resource_id     BIGINT NOT NULL,
+    payload         JSONB NOT NULL,
+    received_at     TIMESTAMPTZ DEFAULT NOW(),
+    locked_until    TIMESTAMPTZ,            -- worker lease, or retry backoff after a failure
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    last_error      TEXT,
+    processed_at    TIMESTAMPTZ             -- NULL = pending
+);
+
+-- Change feed: RFIs/submittals sync_agent wrote, consumed (and deleted) by
+-- nerv-interface's targeted signal sweeps; NOTIFY eva00_changes carries the project UUID
+CREATE TABLE sync_changes (
+    id              BIGSERIAL PRIMARY KEY,
+    entity_type     TEXT NOT NULL,          -- 'rfi', 'submittal'
+    project_id      UUID NOT NULL,
+    entity_id       UUID NOT NULL,
+    action          TEXT NOT NULL,          -- 'create', 'update', 'delete'
+    created_at      TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Sharded sync (sync_agent.py --sharded): units of work leased by worker processes
+CREATE TABLE sync_shards (
+    shard_key       TEXT PRIMARY KEY,       -- 'company:4281379' or 'project:316469'
+    company_id      BIGINT NOT NULL,        -- Procore company ID
+    procore_project_id BIGINT,              -- NULL = company shard (project list, company directory)
+    enabled         BOOLEAN NOT NULL DEFAULT TRUE,
+    assigned_to     TEXT,                   -- sync_workers.worker_id chosen by the coordinator
+    lease_owner     TEXT,                   -- worker currently allowed to sync it
+    lease_expires_at TIMESTAMPTZ,           -- renewed by the owner's heartbeat; lapsed = free
+    last_pass_at    TIMESTAMPTZ,
+    created_at      TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE sync_workers (
+    worker_id       TEXT PRIMARY KEY,       -- 'host:pid:nonce'
+    hostname        TEXT NOT NULL,
+    pid             INTEGER NOT NULL,
+    started_at      TIMESTAMPTZ DEFAULT NOW(),
+    heartbeat_at    TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Document tree crawl checkpoints: one row per Procore folder seen
+CREATE TABLE document_folders (
+    project_id      UUID NOT NULL REFERENCES projects(id),
+    procore_id      BIGINT NOT NULL,
+    parent_procore_id BIGINT,               -- NULL = top level
+    name            TEXT,
+    procore_updated_at TIMESTAMPTZ,         -- updated_at from the parent's latest listing
+    listed_updated_at  TIMESTAMPTZ,         -- procore_updated_at when this folder's children were last listed
+    listed_at       TIMESTAMPTZ,            -- NULL = never listed
+    PRIMARY KEY (project_id, procore_id)
+);
+
+-- =============================================================================
+-- PROJECT ROW COUNTERS
+-- =============================================================================
+-- Rows per (project, table) for get_project_stats, kept current by the
+-- statement-level count_project_rows() triggers below so stats reads never
+-- scan the entity tables. Existing databases: see SCHEMA-UPGRADES.sql.
+
+CREATE TABLE project_row_counts (
+    project_id      UUID NOT NULL,
+    table_name      TEXT NOT NULL,          -- 'submittals', 'rfis', ...
+    row_count       BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (project_id, table_name)
+);
+
 -- =============================================================================
 -- AUDIT LOG
 -- =============================================================================
@@ -791,11 +894,26 @@ CREATE INDEX idx_chunks_embedding ON document_chunks
     USING ivfflat (embedding vector_cosine_ops)
     WITH (lists = 300);
 
+-- HNSW indexes for EVA-00's local hashing embeddings (similar RFIs/submittals);
+-- one per source_type, so a walk never wastes its ef_search candidates on the
+-- other type or on vectors from a different model
+CREATE INDEX idx_chunks_embedding_hash_rfi_hnsw ON document_chunks
+    USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64)
+    WHERE embedding_model = 'eva00-hash-v1' AND source_type = 'rfi';
+CREATE INDEX idx_chunks_embedding_hash_submittal_hnsw ON document_chunks
+    USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64)
+    WHERE embedding_model = 'eva00-hash-v1' AND source_type = 'submittal';
+
 -- Trigram indexes for fuzzy matching on key fields
 CREATE INDEX idx_companies_name_trgm ON companies USING GIN (name gin_trgm_ops);
 CREATE INDEX idx_drawings_number_trgm ON drawings USING GIN (number gin_trgm_ops);
 CREATE INDEX idx_submittals_number_trgm ON submittals USING GIN (number gin_trgm_ops);
 CREATE INDEX idx_rfis_number_trgm ON rfis USING GIN (number gin_trgm_ops);
+CREATE INDEX idx_submittals_title_trgm ON submittals USING GIN (title gin_trgm_ops);
+CREATE INDEX idx_rfis_subject_trgm ON rfis USING GIN (subject gin_trgm_ops);
+CREATE INDEX idx_drawings_title_trgm ON drawings USING GIN (title gin_trgm_ops);
 
 -- Foreign key & query pattern indexes
 CREATE INDEX idx_contacts_company ON contacts(company_id);
@@ -850,21 +968,24 @@ CREATE INDEX idx_chunks_spec ON document_chunks(spec_section) WHERE spec_section
 -- Sync tracking
 CREATE INDEX idx_sync_log_entity ON sync_log(entity_type, entity_id);
 CREATE INDEX idx_sync_log_created ON sync_log(created_at DESC);
+CREATE INDEX idx_sync_passes_started ON sync_passes(started_at DESC);
 CREATE INDEX idx_sync_cursors_type ON sync_cursors(entity_type);
+CREATE INDEX idx_webhook_events_pending ON procore_webhook_events(received_at) WHERE processed_at IS NULL;
+CREATE INDEX idx_sync_shards_assigned ON sync_shards(assigned_to) WHERE enabled;
 
 -- Audit log (time-series, recent queries)
 CREATE INDEX idx_audit_log_created ON audit_log(created_at DESC);
 CREATE INDEX idx_audit_log_agent ON audit_log(agent, created_at DESC);
 
 -- Procore ID lookups (for sync)
-CREATE INDEX idx_drawings_procore ON drawings(procore_id) WHERE procore_id IS NOT NULL;
-CREATE INDEX idx_submittals_procore ON submittals(procore_id) WHERE procore_id IS NOT NULL;
-CREATE INDEX idx_rfis_procore ON rfis(procore_id) WHERE procore_id IS NOT NULL;
+CREATE UNIQUE INDEX idx_drawings_procore ON drawings(procore_id) WHERE procore_id IS NOT NULL;
+CREATE UNIQUE INDEX idx_submittals_procore ON submittals(procore_id) WHERE procore_id IS NOT NULL;
+CREATE UNIQUE INDEX idx_rfis_procore ON rfis(procore_id) WHERE procore_id IS NOT NULL;
 CREATE INDEX idx_daily_reports_procore ON daily_reports(procore_id) WHERE procore_id IS NOT NULL;
 CREATE INDEX idx_meetings_procore ON meetings(procore_id) WHERE procore_id IS NOT NULL;
 CREATE INDEX idx_change_orders_procore ON change_orders(procore_id) WHERE procore_id IS NOT NULL;
 CREATE INDEX idx_photos_procore ON photos(procore_id) WHERE procore_id IS NOT NULL;
-CREATE INDEX idx_documents_procore ON documents(procore_id) WHERE procore_id IS NOT NULL;
+CREATE UNIQUE INDEX idx_documents_procore ON documents(procore_id) WHERE procore_id IS NOT NULL;
 
 -- =============================================================================
 -- FUNCTIONS
@@ -897,13 +1018,52 @@ BEGIN
 END;
 $$;
 
+-- Per-project row counters: one upsert per statement, not per row
+CREATE OR REPLACE FUNCTION count_project_rows()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO project_row_counts (project_id, table_name, row_count)
+    SELECT project_id, TG_TABLE_NAME,
+           CASE TG_OP WHEN 'INSERT' THEN count(*) ELSE -count(*) END
+    FROM changed_rows
+    GROUP BY project_id
+    ON CONFLICT (project_id, table_name) DO UPDATE
+        SET row_count = project_row_counts.row_count + EXCLUDED.row_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- project_id never changes on these tables, so UPDATEs need no trigger
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOR t IN SELECT unnest(ARRAY[
+        'submittals', 'rfis', 'drawings', 'daily_reports', 'change_orders', 'meetings', 'photos'
+    ]) LOOP
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_count_ins AFTER INSERT ON %I REFERENCING NEW TABLE AS changed_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION count_project_rows()',
+            t, t
+        );
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_count_del AFTER DELETE ON %I REFERENCING OLD TABLE AS changed_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION count_project_rows()',
+            t, t
+        );
+    END LOOP;
+END;
+$$;
+
 -- =============================================================================
 -- COMMENTS
 -- =============================================================================
 
 COMMENT ON TABLE document_chunks IS 'Chunked text with vector embeddings for semantic search across all document types';
 COMMENT ON COLUMN document_chunks.source_type IS 'Polymorphic ref: document, submittal, rfi, daily_report, meeting_item, spec_section, drawing, change_order';
-COMMENT ON COLUMN document_chunks.embedding IS '768-dim vector from nomic-embed-text-v1.5 via Ollama (local inference)';
+COMMENT ON COLUMN document_chunks.embedding IS '768-dim vector from nomic-embed-text-v1.5 via Ollama (local inference), or eva00-hash-v1 hashing vectorizer for RFI/submittal similarity (see embedding_model)';
 COMMENT ON TABLE sync_log IS 'Tracks every Procore sync operation for debugging and conflict resolution';
+COMMENT ON TABLE sync_passes IS 'Per-pass sync summary (counts per entity type); kept as long as sync_log';
+COMMENT ON TABLE project_row_counts IS 'Trigger-maintained row counts per project and table (get_project_stats)';
 COMMENT ON TABLE sync_cursors IS 'Stores last-synced position per entity type for incremental polling';
 COMMENT ON TABLE audit_log IS 'Records all data access by EVA agents for compliance and debugging';
@@ -257,6 +257,86 @@ CREATE TRIGGER trg_radar_items_updated_at
     BEFORE UPDATE ON radar_items
     FOR EACH ROW EXECUTE FUNCTION update_updated_at();
 
+-- =============================================================================
+-- SYNTHESIS JOBS TABLE
+-- =============================================================================
+-- Durable synthesis job queue. Workers claim with FOR UPDATE SKIP LOCKED and
+-- hold a per-project advisory lock while a cycle runs. At most one job per
+-- (project, cycle_type, escalation item) may be queued; duplicate requests
+-- coalesce into it.
+
+CREATE TYPE synthesis_job_status AS ENUM ('queued', 'running', 'completed', 'failed', 'cancelled');
+
+CREATE TABLE synthesis_jobs (
+    id                      UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    project_id              UUID NOT NULL REFERENCES projects(id),
+    cycle_type              synthesis_cycle_type NOT NULL,
+    escalation_item_id      UUID REFERENCES intelligence_items(id),
+    priority                SMALLINT NOT NULL DEFAULT 50,   -- higher runs first: deep-dive 100, manual 50, scheduled 10
+    status                  synthesis_job_status NOT NULL DEFAULT 'queued',
+    attempts                SMALLINT NOT NULL DEFAULT 0,
+    max_attempts            SMALLINT NOT NULL DEFAULT 3,
+    coalesced_count         INTEGER NOT NULL DEFAULT 0,
+    coalesced_into          UUID REFERENCES synthesis_jobs(id),
+    requested_by            VARCHAR(50) NOT NULL DEFAULT 'api',
+    run_after               TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_until            TIMESTAMPTZ,            -- lease; expired running jobs are reclaimed
+    worker_id               VARCHAR(200),
+    cycle_id                UUID REFERENCES synthesis_cycles(id),
+    error                   TEXT,
+    created_at              TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at              TIMESTAMPTZ,
+    completed_at            TIMESTAMPTZ
+);
+
+-- =============================================================================
+-- SYNTHESIS SCHEDULE TABLES
+-- =============================================================================
+-- Per-project overrides for the built-in cycle scheduler (missing row = env
+-- defaults), and a ledger with one row per (project, cycle, local date) so each
+-- scheduled cycle fires at most once even with several API processes running.
+
+CREATE TABLE synthesis_schedules (
+    project_id              UUID PRIMARY KEY REFERENCES projects(id) ON DELETE CASCADE,
+    timezone                VARCHAR(64),            -- IANA name, e.g. America/Chicago
+    enabled                 BOOLEAN NOT NULL DEFAULT TRUE,
+    morning_at              TIME,
+    midday_at               TIME,
+    end_of_day_at           TIME,
+    updated_at              TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE synthesis_schedule_runs (
+    project_id              UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    cycle_type              synthesis_cycle_type NOT NULL,
+    local_date              DATE NOT NULL,
+    scheduled_for           TIMESTAMPTZ NOT NULL,
+    outcome                 VARCHAR(30) NOT NULL,   -- pending, queued, skipped_no_signals, missed
+    job_id                  UUID REFERENCES synthesis_jobs(id),
+    created_at              TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (project_id, cycle_type, local_date)
+);
+
+-- =============================================================================
+-- LLM SIGNAL CACHE TABLE
+-- =============================================================================
+-- Parsed Ollama outputs for webhook/document signal evaluation, keyed on a hash
+-- of (model, prompt version, project, normalized event payload) plus a digest
+-- of the active signal IDs, excluding signals the same event wrote. Replays and
+-- re-fires reuse the stored output; bump the prompt version to invalidate.
+
+CREATE TABLE llm_signal_cache (
+    cache_key               CHAR(64) PRIMARY KEY,   -- sha256 hex
+    project_id              UUID REFERENCES projects(id) ON DELETE CASCADE,
+    model                   VARCHAR(100) NOT NULL,
+    prompt_version          VARCHAR(20) NOT NULL,
+    parsed_json             JSONB NOT NULL,
+    hit_count               INTEGER NOT NULL DEFAULT 0,
+    created_at              TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_hit_at             TIMESTAMPTZ,
+    expires_at              TIMESTAMPTZ NOT NULL
+);
+
 -- =============================================================================
 -- INDEXES
 -- =============================================================================
@@ -308,6 +388,21 @@ CREATE INDEX idx_working_memory_project ON working_memory_state(project_id, snap
 -- Working memory: JSONB GIN index
 CREATE INDEX idx_working_memory_state_gin ON working_memory_state USING GIN (state_json);
 
+-- Synthesis jobs: claim order, one queued job per key, per-project lookups
+CREATE INDEX idx_synthesis_jobs_claim ON synthesis_jobs(priority DESC, run_after, created_at)
+    WHERE status IN ('queued', 'running');
+CREATE UNIQUE INDEX uq_synthesis_jobs_queued
+    ON synthesis_jobs(project_id, cycle_type, (COALESCE(escalation_item_id, project_id)))
+    WHERE status = 'queued';
+CREATE INDEX idx_synthesis_jobs_project ON synthesis_jobs(project_id, created_at DESC);
+
+-- Synthesis schedule ledger
+CREATE INDEX idx_schedule_runs_created ON synthesis_schedule_runs(created_at DESC);
+
+-- LLM signal cache: TTL sweep and LRU trim
+CREATE INDEX idx_llm_cache_expires ON llm_signal_cache(expires_at);
+CREATE INDEX idx_llm_cache_lru ON llm_signal_cache((COALESCE(last_hit_at, created_at)));
+
 -- Reinforcement candidates
 CREATE INDEX idx_reinforcement_target ON reinforcement_candidates(target_signal_id, status);
 CREATE INDEX idx_reinforcement_source ON reinforcement_candidates(source_signal_id);
@@ -323,6 +418,11 @@ CREATE TRIGGER trg_intelligence_items_updated_at
     BEFORE UPDATE ON intelligence_items
     FOR EACH ROW EXECUTE FUNCTION update_updated_at();
 
+-- Auto-update updated_at on synthesis_schedules
+CREATE TRIGGER trg_synthesis_schedules_updated_at
+    BEFORE UPDATE ON synthesis_schedules
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
 -- =============================================================================
 -- COMMENTS
 -- =============================================================================
@@ -333,5 +433,9 @@ COMMENT ON TABLE intelligence_items IS 'First-class outputs of the synthesis pip
 COMMENT ON TABLE intelligence_item_evidence IS 'Evidence chain linking intelligence items to the signals that produced them.';
 COMMENT ON TABLE working_memory_state IS 'Point-in-time snapshot of project intelligence state for synthesis trend tracking.';
 COMMENT ON TABLE reinforcement_candidates IS 'Potential reinforcement links between signals. Written by signal generation, evaluated by synthesis.';
+COMMENT ON TABLE synthesis_jobs IS 'Durable synthesis job queue. SKIP LOCKED claims, per-project advisory locks, coalesced duplicate requests, retries with backoff.';
+COMMENT ON TABLE synthesis_schedules IS 'Per-project time zone and cycle times for the built-in synthesis scheduler.';
+COMMENT ON TABLE synthesis_schedule_runs IS 'One row per scheduled (project, cycle, local date): queued, skipped (no new signals) or missed.';
+COMMENT ON TABLE llm_signal_cache IS 'Parsed LLM signal outputs keyed on model, prompt version, project, normalized event payload and active-signal digest. TTL + LRU evicted.';
 COMMENT ON COLUMN signals.effective_weight IS 'Computed: confidence * strength * source_multiplier * decay_factor. Updated at write time and during decay sweeps.';
 COMMENT ON COLUMN signals.decay_profile IS 'Controls how quickly the signal loses weight: fast_24h, medium_72h, slow_7d, persistent.';
@@ -0,0 +1,108 @@
+-- =============================================================================
+-- STEELSYNC INTELLIGENCE LAYER: Upgrades for databases created from an older
+-- INTELLIGENCE-LAYER-SCHEMA.sql
+-- =============================================================================
+--
+-- Fresh installs get all of this from INTELLIGENCE-LAYER-SCHEMA.sql. Every
+-- statement is idempotent; scripts/init-intelligence-layer.py applies this file
+-- when the intelligence layer already exists, and re-running it is safe.
+-- =============================================================================
+
+-- =============================================================================
+-- SYNTHESIS JOBS
+-- =============================================================================
+
+DO $$
+BEGIN
+    CREATE TYPE synthesis_job_status AS ENUM ('queued', 'running', 'completed', 'failed', 'cancelled');
+EXCEPTION
+    WHEN duplicate_object THEN NULL;
+END
+$$;
+
+CREATE TABLE IF NOT EXISTS synthesis_jobs (
+    id                      UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    project_id              UUID NOT NULL REFERENCES projects(id),
+    cycle_type              synthesis_cycle_type NOT NULL,
+    escalation_item_id      UUID REFERENCES intelligence_items(id),
+    priority                SMALLINT NOT NULL DEFAULT 50,   -- higher runs first: deep-dive 100, manual 50, scheduled 10
+    status                  synthesis_job_status NOT NULL DEFAULT 'queued',
+    attempts                SMALLINT NOT NULL DEFAULT 0,
+    max_attempts            SMALLINT NOT NULL DEFAULT 3,
+    coalesced_count         INTEGER NOT NULL DEFAULT 0,
+    coalesced_into          UUID REFERENCES synthesis_jobs(id),
+    requested_by            VARCHAR(50) NOT NULL DEFAULT 'api',
+    run_after               TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    locked_until            TIMESTAMPTZ,            -- lease; expired running jobs are reclaimed
+    worker_id               VARCHAR(200),
+    cycle_id                UUID REFERENCES synthesis_cycles(id),
+    error                   TEXT,
+    created_at              TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at              TIMESTAMPTZ,
+    completed_at            TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_synthesis_jobs_claim ON synthesis_jobs(priority DESC, run_after, created_at)
+    WHERE status IN ('queued', 'running');
+CREATE UNIQUE INDEX IF NOT EXISTS uq_synthesis_jobs_queued
+    ON synthesis_jobs(project_id, cycle_type, (COALESCE(escalation_item_id, project_id)))
+    WHERE status = 'queued';
+CREATE INDEX IF NOT EXISTS idx_synthesis_jobs_project ON synthesis_jobs(project_id, created_at DESC);
+
+COMMENT ON TABLE synthesis_jobs IS 'Durable synthesis job queue. SKIP LOCKED claims, per-project advisory locks, coalesced duplicate requests, retries with backoff.';
+
+-- =============================================================================
+-- SYNTHESIS SCHEDULES
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS synthesis_schedules (
+    project_id              UUID PRIMARY KEY REFERENCES projects(id) ON DELETE CASCADE,
+    timezone                VARCHAR(64),            -- IANA name, e.g. America/Chicago
+    enabled                 BOOLEAN NOT NULL DEFAULT TRUE,
+    morning_at              TIME,
+    midday_at               TIME,
+    end_of_day_at           TIME,
+    updated_at              TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS synthesis_schedule_runs (
+    project_id              UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    cycle_type              synthesis_cycle_type NOT NULL,
+    local_date              DATE NOT NULL,
+    scheduled_for           TIMESTAMPTZ NOT NULL,
+    outcome                 VARCHAR(30) NOT NULL,   -- pending, queued, skipped_no_signals, missed
+    job_id                  UUID REFERENCES synthesis_jobs(id),
+    created_at              TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (project_id, cycle_type, local_date)
+);
+
+CREATE INDEX IF NOT EXISTS idx_schedule_runs_created ON synthesis_schedule_runs(created_at DESC);
+
+DROP TRIGGER IF EXISTS trg_synthesis_schedules_updated_at ON synthesis_schedules;
+CREATE TRIGGER trg_synthesis_schedules_updated_at
+    BEFORE UPDATE ON synthesis_schedules
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+COMMENT ON TABLE synthesis_schedules IS 'Per-project time zone and cycle times for the built-in synthesis scheduler.';
+COMMENT ON TABLE synthesis_schedule_runs IS 'One row per scheduled (project, cycle, local date): queued, skipped (no new signals) or missed.';
+
+-- =============================================================================
+-- LLM SIGNAL CACHE
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS llm_signal_cache (
+    cache_key               CHAR(64) PRIMARY KEY,   -- sha256 hex
+    project_id              UUID REFERENCES projects(id) ON DELETE CASCADE,
+    model                   VARCHAR(100) NOT NULL,
+    prompt_version          VARCHAR(20) NOT NULL,
+    parsed_json             JSONB NOT NULL,
+    hit_count               INTEGER NOT NULL DEFAULT 0,
+    created_at              TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_hit_at             TIMESTAMPTZ,
+    expires_at              TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_signal_cache(expires_at);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_lru ON llm_signal_cache((COALESCE(last_hit_at, created_at)));
+
+COMMENT ON TABLE llm_signal_cache IS 'Parsed LLM signal outputs keyed on model, prompt version, project, normalized event payload and active-signal digest. TTL + LRU evicted.';
@@ -0,0 +1,334 @@
+-- =============================================================================
+-- EVA-00: Upgrades for databases created from an older DATABASE-SCHEMA.sql
+-- =============================================================================
+--
+-- Fresh installs get all of this from DATABASE-SCHEMA.sql. Every section is
+-- idempotent: run the whole file (psql -f, not in a single transaction) after
+-- deploying a new sync_agent/eva00_tool; re-running it is safe.
+-- =============================================================================
+
+-- =============================================================================
+-- SYNC COLUMNS
+-- =============================================================================
+-- sync_hash: hash of the last synced Procore values; sync_agent skips rows
+-- whose hash is unchanged. It refuses to start without these columns.
+
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS sync_hash TEXT;
+ALTER TABLE companies ADD COLUMN IF NOT EXISTS sync_hash TEXT;
+ALTER TABLE contacts ADD COLUMN IF NOT EXISTS sync_hash TEXT;
+ALTER TABLE drawings ADD COLUMN IF NOT EXISTS sync_hash TEXT;
+ALTER TABLE submittals ADD COLUMN IF NOT EXISTS sync_hash TEXT;
+ALTER TABLE rfis ADD COLUMN IF NOT EXISTS sync_hash TEXT;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS sync_hash TEXT;
+
+-- last_full_sync_at: last full listing per cursor; deletes are only detected on those
+ALTER TABLE sync_cursors ADD COLUMN IF NOT EXISTS last_full_sync_at TIMESTAMPTZ;
+
+-- =============================================================================
+-- SYNC TABLES
+-- =============================================================================
+
+-- Document tree crawl checkpoints: one row per Procore folder seen
+CREATE TABLE IF NOT EXISTS document_folders (
+    project_id      UUID NOT NULL REFERENCES projects(id),
+    procore_id      BIGINT NOT NULL,
+    parent_procore_id BIGINT,               -- NULL = top level
+    name            TEXT,
+    procore_updated_at TIMESTAMPTZ,         -- updated_at from the parent's latest listing
+    listed_updated_at  TIMESTAMPTZ,         -- procore_updated_at when this folder's children were last listed
+    listed_at       TIMESTAMPTZ,            -- NULL = never listed
+    PRIMARY KEY (project_id, procore_id)
+);
+
+-- Procore webhook queue: one row per delivered event, drained by sync_agent's webhook worker
+CREATE TABLE IF NOT EXISTS procore_webhook_events (
+    id              BIGSERIAL PRIMARY KEY,
+    event_key       TEXT NOT NULL UNIQUE,   -- Procore ulid/id; redeliveries collapse here
+    entity_type     TEXT NOT NULL,          -- sync_agent entity: 'rfis', 'submittals', 'drawing_revisions'
+    event_type      TEXT NOT NULL,          -- 'create', 'update', 'delete'
+    procore_project_id BIGINT NOT NULL,
+    resource_id     BIGINT NOT NULL,
+    payload         JSONB NOT NULL,
+    received_at     TIMESTAMPTZ DEFAULT NOW(),
+    locked_until    TIMESTAMPTZ,            -- worker lease, or retry backoff after a failure
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    last_error      TEXT,
+    processed_at    TIMESTAMPTZ             -- NULL = pending
+);
+CREATE INDEX IF NOT EXISTS idx_webhook_events_pending ON procore_webhook_events(received_at) WHERE processed_at IS NULL;
+
+-- Change feed: RFIs/submittals sync_agent wrote, consumed (and deleted) by
+-- nerv-interface's targeted signal sweeps; NOTIFY eva00_changes carries the project UUID
+CREATE TABLE IF NOT EXISTS sync_changes (
+    id              BIGSERIAL PRIMARY KEY,
+    entity_type     TEXT NOT NULL,          -- 'rfi', 'submittal'
+    project_id      UUID NOT NULL,
+    entity_id       UUID NOT NULL,
+    action          TEXT NOT NULL,          -- 'create', 'update', 'delete'
+    created_at      TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Sharded sync (sync_agent.py --sharded): units of work leased by worker processes
+CREATE TABLE IF NOT EXISTS sync_shards (
+    shard_key       TEXT PRIMARY KEY,       -- 'company:4281379' or 'project:316469'
+    company_id      BIGINT NOT NULL,        -- Procore company ID
+    procore_project_id BIGINT,              -- NULL = company shard (project list, company directory)
+    enabled         BOOLEAN NOT NULL DEFAULT TRUE,
+    assigned_to     TEXT,                   -- sync_workers.worker_id chosen by the coordinator
+    lease_owner     TEXT,                   -- worker currently allowed to sync it
+    lease_expires_at TIMESTAMPTZ,           -- renewed by the owner's heartbeat; lapsed = free
+    last_pass_at    TIMESTAMPTZ,
+    created_at      TIMESTAMPTZ DEFAULT NOW()
+);
+CREATE INDEX IF NOT EXISTS idx_sync_shards_assigned ON sync_shards(assigned_to) WHERE enabled;
+
+CREATE TABLE IF NOT EXISTS sync_workers (
+    worker_id       TEXT PRIMARY KEY,       -- 'host:pid:nonce'
+    hostname        TEXT NOT NULL,
+    pid             INTEGER NOT NULL,
+    started_at      TIMESTAMPTZ DEFAULT NOW(),
+    heartbeat_at    TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- =============================================================================
+-- PROJECT ROW COUNTERS (get_project_stats estimates)
+-- =============================================================================
+-- Installs the counter triggers and seeds the counts under a lock that blocks
+-- writers to the counted tables, so no insert lands between seed and trigger.
+-- Re-running re-seeds the counters from scratch.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS project_row_counts (
+    project_id      UUID NOT NULL,
+    table_name      TEXT NOT NULL,
+    row_count       BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (project_id, table_name)
+);
+
+CREATE OR REPLACE FUNCTION count_project_rows()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO project_row_counts (project_id, table_name, row_count)
+    SELECT project_id, TG_TABLE_NAME,
+           CASE TG_OP WHEN 'INSERT' THEN count(*) ELSE -count(*) END
+    FROM changed_rows
+    GROUP BY project_id
+    ON CONFLICT (project_id, table_name) DO UPDATE
+        SET row_count = project_row_counts.row_count + EXCLUDED.row_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+LOCK TABLE submittals, rfis, drawings, daily_reports, change_orders, meetings, photos
+    IN SHARE ROW EXCLUSIVE MODE;
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOR t IN SELECT unnest(ARRAY[
+        'submittals', 'rfis', 'drawings', 'daily_reports', 'change_orders', 'meetings', 'photos'
+    ]) LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_count_ins ON %I', t, t);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_count_del ON %I', t, t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_count_ins AFTER INSERT ON %I REFERENCING NEW TABLE AS changed_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION count_project_rows()',
+            t, t
+        );
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_count_del AFTER DELETE ON %I REFERENCING OLD TABLE AS changed_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION count_project_rows()',
+            t, t
+        );
+    END LOOP;
+END;
+$$;
+
+TRUNCATE project_row_counts;
+INSERT INTO project_row_counts (project_id, table_name, row_count)
+          SELECT project_id, 'submittals', count(*) FROM submittals GROUP BY project_id
+UNION ALL SELECT project_id, 'rfis', count(*) FROM rfis GROUP BY project_id
+UNION ALL SELECT project_id, 'drawings', count(*) FROM drawings GROUP BY project_id
+UNION ALL SELECT project_id, 'daily_reports', count(*) FROM daily_reports GROUP BY project_id
+UNION ALL SELECT project_id, 'change_orders', count(*) FROM change_orders GROUP BY project_id
+UNION ALL SELECT project_id, 'meetings', count(*) FROM meetings GROUP BY project_id
+UNION ALL SELECT project_id, 'photos', count(*) FROM photos GROUP BY project_id;
+
+COMMIT;
+
+-- =============================================================================
+-- UNIQUE PROCORE ID INDEXES (sync_agent bulk upserts)
+-- =============================================================================
+-- bulk_upsert's ON CONFLICT (procore_id) WHERE procore_id IS NOT NULL needs
+-- partial UNIQUE indexes on drawings, submittals, rfis and documents; older
+-- schemas created plain ones and sync_agent refuses to start until this runs.
+-- Stop sync_agent (and its --workers) first. Uses \gexec, so run with psql.
+
+-- Duplicates: keep the most recently updated row per procore_id. The others
+-- keep their data (construction records are never hard-deleted) but lose
+-- their procore_id and are soft-deleted.
+UPDATE drawings t SET procore_id = NULL, is_deleted = TRUE
+FROM (SELECT id, row_number() OVER (PARTITION BY procore_id ORDER BY updated_at DESC NULLS LAST, created_at DESC, id) AS rn
+      FROM drawings WHERE procore_id IS NOT NULL) d
+WHERE t.id = d.id AND d.rn > 1;
+
+UPDATE submittals t SET procore_id = NULL, is_deleted = TRUE
+FROM (SELECT id, row_number() OVER (PARTITION BY procore_id ORDER BY updated_at DESC NULLS LAST, created_at DESC, id) AS rn
+      FROM submittals WHERE procore_id IS NOT NULL) d
+WHERE t.id = d.id AND d.rn > 1;
+
+UPDATE rfis t SET procore_id = NULL, is_deleted = TRUE
+FROM (SELECT id, row_number() OVER (PARTITION BY procore_id ORDER BY updated_at DESC NULLS LAST, created_at DESC, id) AS rn
+      FROM rfis WHERE procore_id IS NOT NULL) d
+WHERE t.id = d.id AND d.rn > 1;
+
+UPDATE documents t SET procore_id = NULL, is_deleted = TRUE
+FROM (SELECT id, row_number() OVER (PARTITION BY procore_id ORDER BY updated_at DESC NULLS LAST, created_at DESC, id) AS rn
+      FROM documents WHERE procore_id IS NOT NULL) d
+WHERE t.id = d.id AND d.rn > 1;
+
+-- An interrupted CREATE INDEX CONCURRENTLY leaves an invalid index behind
+SELECT format('DROP INDEX CONCURRENTLY %I', c.relname)
+FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid
+WHERE c.relname IN ('idx_drawings_procore_uniq', 'idx_submittals_procore_uniq',
+                    'idx_rfis_procore_uniq', 'idx_documents_procore_uniq')
+  AND NOT i.indisvalid
+\gexec
+
+-- Build the unique index alongside the old one without blocking writes
+SELECT format('CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS %I ON %I (procore_id) WHERE procore_id IS NOT NULL',
+              'idx_' || t || '_procore_uniq', t)
+FROM unnest(ARRAY['drawings', 'submittals', 'rfis', 'documents']) AS t
+WHERE NOT EXISTS (
+    SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid
+    WHERE c.relname = 'idx_' || t || '_procore' AND i.indisunique AND i.indisvalid
+)
+\gexec
+
+-- Swap it in under the old name
+SELECT format('DROP INDEX CONCURRENTLY %I', 'idx_' || t || '_procore')
+FROM unnest(ARRAY['drawings', 'submittals', 'rfis', 'documents']) AS t
+WHERE to_regclass('idx_' || t || '_procore_uniq') IS NOT NULL
+  AND to_regclass('idx_' || t || '_procore') IS NOT NULL
+\gexec
+
+SELECT format('ALTER INDEX %I RENAME TO %I', 'idx_' || t || '_procore_uniq', 'idx_' || t || '_procore')
+FROM unnest(ARRAY['drawings', 'submittals', 'rfis', 'documents']) AS t
+WHERE to_regclass('idx_' || t || '_procore_uniq') IS NOT NULL
+  AND to_regclass('idx_' || t || '_procore') IS NULL
+\gexec
+
+-- =============================================================================
+-- PER-SOURCE-TYPE HNSW INDEXES (embeddings.nearest)
+-- =============================================================================
+-- Replaces the single eva00-hash-v1 HNSW index with one per source_type so
+-- the similar-RFI/submittal walk only visits vectors it can return. Built
+-- concurrently; uses \gexec, so run with psql.
+
+-- An interrupted CREATE INDEX CONCURRENTLY leaves an invalid index behind
+SELECT format('DROP INDEX CONCURRENTLY %I', c.relname)
+FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid
+WHERE c.relname IN ('idx_chunks_embedding_hash_rfi_hnsw', 'idx_chunks_embedding_hash_submittal_hnsw')
+  AND NOT i.indisvalid
+\gexec
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_embedding_hash_rfi_hnsw ON document_chunks
+    USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64)
+    WHERE embedding_model = 'eva00-hash-v1' AND source_type = 'rfi';
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_embedding_hash_submittal_hnsw ON document_chunks
+    USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64)
+    WHERE embedding_model = 'eva00-hash-v1' AND source_type = 'submittal';
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_embedding_hash_hnsw;
+
+-- =============================================================================
+-- DAY-PARTITIONED SYNC_LOG + SYNC_PASSES
+-- =============================================================================
+-- Swaps a plain sync_log for the day-partitioned one. The old table is
+-- renamed, the partitioned parent is created with partitions for the retained
+-- days, rows still inside retention are copied, and the old table is dropped.
+-- Stop sync_agent first: the copy holds an exclusive lock on sync_log. Until
+-- this runs, sync_agent trims the plain table with batched DELETEs.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS sync_passes (
+    id              BIGSERIAL PRIMARY KEY,
+    scope           TEXT,
+    full_listing    BOOLEAN NOT NULL DEFAULT FALSE,
+    started_at      TIMESTAMPTZ NOT NULL,
+    finished_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created         INTEGER NOT NULL DEFAULT 0,
+    updated         INTEGER NOT NULL DEFAULT 0,
+    unchanged       INTEGER NOT NULL DEFAULT 0,
+    deleted         INTEGER NOT NULL DEFAULT 0,
+    errors          INTEGER NOT NULL DEFAULT 0,
+    entities        JSONB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sync_passes_started ON sync_passes(started_at DESC);
+
+DO $$
+DECLARE
+    retention_days INTEGER := 90;  -- keep in step with SYNC_LOG_RETENTION_DAYS
+    today DATE := (NOW() AT TIME ZONE 'UTC')::date;
+    d DATE;
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_class WHERE oid = to_regclass('sync_log') AND relkind = 'r') THEN
+        RETURN;  -- already partitioned (or no sync_log at all)
+    END IF;
+
+    LOCK TABLE sync_log IN ACCESS EXCLUSIVE MODE;
+    ALTER TABLE sync_log RENAME TO sync_log_unpartitioned;
+    IF EXISTS (SELECT 1 FROM pg_constraint
+               WHERE conname = 'sync_log_pkey' AND conrelid = 'sync_log_unpartitioned'::regclass) THEN
+        ALTER TABLE sync_log_unpartitioned RENAME CONSTRAINT sync_log_pkey TO sync_log_unpartitioned_pkey;
+    END IF;
+    ALTER INDEX IF EXISTS idx_sync_log_entity RENAME TO idx_sync_log_unpartitioned_entity;
+    ALTER INDEX IF EXISTS idx_sync_log_created RENAME TO idx_sync_log_unpartitioned_created;
+
+    CREATE TABLE sync_log (
+        id              UUID NOT NULL DEFAULT uuid_generate_v4(),
+        entity_type     TEXT NOT NULL,
+        entity_id       UUID NOT NULL,
+        procore_id      BIGINT,
+        action          TEXT NOT NULL,
+        procore_updated_at TIMESTAMPTZ,
+        local_updated_at TIMESTAMPTZ,
+        sync_direction  TEXT,
+        status          TEXT DEFAULT 'success',
+        error_message   TEXT,
+        payload_hash    TEXT,
+        created_at      TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at);
+    CREATE TABLE sync_log_default PARTITION OF sync_log DEFAULT;
+    CREATE INDEX idx_sync_log_entity ON sync_log(entity_type, entity_id);
+    CREATE INDEX idx_sync_log_created ON sync_log(created_at DESC);
+
+    -- Same names and UTC day bounds as sync_agent.maintain_sync_log
+    FOR d IN SELECT generate_series(today - retention_days, today + 3, INTERVAL '1 day')::date LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF sync_log FOR VALUES FROM (%L) TO (%L)',
+            'sync_log_' || to_char(d, 'YYYYMMDD'),
+            d::timestamp AT TIME ZONE 'UTC', (d + 1)::timestamp AT TIME ZONE 'UTC'
+        );
+    END LOOP;
+
+    INSERT INTO sync_log (id, entity_type, entity_id, procore_id, action, procore_updated_at,
+                          local_updated_at, sync_direction, status, error_message, payload_hash, created_at)
+    SELECT id, entity_type, entity_id, procore_id, action, procore_updated_at,
+           local_updated_at, sync_direction, status, error_message, payload_hash, COALESCE(created_at, NOW())
+    FROM sync_log_unpartitioned
+    WHERE created_at IS NULL OR created_at >= (today - retention_days)::timestamp AT TIME ZONE 'UTC';
+
+    DROP TABLE sync_log_unpartitioned;
+END;
+$$;
+
+COMMENT ON TABLE sync_log IS 'Tracks every Procore sync operation for debugging and conflict resolution';
+
+COMMIT;
@@ -5,24 +5,233 @@ Provides structured query functions that return data with full references.
 """
 
 import os
+import re
 import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import psycopg2
+import psycopg2.pool
 import psycopg2.extras
 
+import embeddings
+
+logger = logging.getLogger("eva00.db")
+
 DB_NAME = os.environ.get("EVA00_DB", "nerv_eva00")
 DB_USER = os.environ.get("EVA00_DB_USER", "moby")
 DB_HOST = os.environ.get("EVA00_DB_HOST", "localhost")
 DB_PORT = os.environ.get("EVA00_DB_PORT", "5432")
+DB_POOL_MIN = int(os.environ.get("EVA00_DB_POOL_MIN", "2"))
+DB_POOL_MAX = int(os.environ.get("EVA00_DB_POOL_MAX", "10"))
+# "fts" (ranked full-text + trigram fallback) or "ilike" (legacy substring scan)
+SEARCH_MODE = os.environ.get("EVA00_SEARCH_MODE", "fts")
+TRGM_THRESHOLD = float(os.environ.get("EVA00_TRGM_THRESHOLD", "0.5"))
+SEARCH_ALL_DEADLINE_MS = int(os.environ.get("EVA00_SEARCH_DEADLINE_MS", "1500"))
+
+_pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+# ThreadedConnectionPool raises when exhausted; callers wait for a slot instead
+_pool_slots = threading.BoundedSemaphore(DB_POOL_MAX)
+DB_POOL_WAIT_SECONDS = float(os.environ.get("EVA00_DB_POOL_WAIT_SECONDS", "10"))
+
+
+def get_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """Get or create the shared connection pool."""
+    global _pool
+    if _pool is None or _pool.closed:
+        with _pool_lock:
+            if _pool is None or _pool.closed:
+                _pool = psycopg2.pool.ThreadedConnectionPool(
+                    minconn=DB_POOL_MIN,
+                    maxconn=DB_POOL_MAX,
+                    dbname=DB_NAME, user=DB_USER, host=DB_HOST, port=DB_PORT,
+                    cursor_factory=psycopg2.extras.RealDictCursor,
+                )
+                logger.info(f"EVA-00 pool created: {DB_NAME}@{DB_HOST}:{DB_PORT} "
+                            f"({DB_POOL_MIN}-{DB_POOL_MAX} connections)")
+    return _pool
+
+
+@contextmanager
+def get_conn(statement_timeout_ms: Optional[int] = None):
+    """Borrow a pooled connection; commit on success, roll back on error.
+
+    Callers keep the `with get_conn() as conn:` form. The connection goes back
+    to the pool on exit instead of being left open for the GC to close.
+    statement_timeout_ms caps every statement in this transaction.
+    """
+    if not _pool_slots.acquire(timeout=DB_POOL_WAIT_SECONDS):
+        raise psycopg2.pool.PoolError(f"no EVA-00 connection free after {DB_POOL_WAIT_SECONDS:.0f}s")
+    try:
+        pool = get_pool()
+        conn = pool.getconn()
+    except Exception:
+        _pool_slots.release()
+        raise
+    try:
+        if statement_timeout_ms:
+            with conn.cursor() as cur:
+                cur.execute("SET LOCAL statement_timeout = %s", (int(statement_timeout_ms),))
+        yield conn
+        conn.commit()
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        # Broken connections (server restart, network drop) are discarded
+        pool.putconn(conn, close=bool(conn.closed))
+        _pool_slots.release()
+
+
+def close_pool():
+    """Close every pooled connection (service shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and not _pool.closed:
+            _pool.closeall()
+        _pool = None
+
+
+# =============================================================================
+# SEARCH ENGINE
+# =============================================================================
+# Keyword search over the generated search_vector columns (GIN indexed):
+# websearch_to_tsquery for parsing ("quoted phrases", -exclusions, OR),
+# ts_rank_cd for ranking and ts_headline for highlighted snippets. Identifiers
+# ("A-201", "03 30 00", "RFI 12") and typos go through pg_trgm word similarity
+# instead, which the *_trgm GIN indexes serve.
+
+SEARCH_TARGETS = {
+    "submittals": {
+        "alias": "s",
+        "document": "concat_ws(' ', s.title, s.description)",
+        "fuzzy": ["s.number", "s.title"],
+        "ilike": ["s.title", "s.description"],
+    },
+    "rfis": {
+        "alias": "r",
+        "document": "concat_ws(' ', r.subject, r.question)",
+        "fuzzy": ["r.number", "r.subject"],
+        "ilike": ["r.subject", "r.question"],
+    },
+    "drawings": {
+        "alias": "d",
+        "document": "concat_ws(' ', d.title, d.ocr_text)",
+        "fuzzy": ["d.number", "d.title"],
+        "ilike": ["d.title", "d.ocr_text"],
+    },
+    "companies": {
+        "alias": "c",
+        "document": "concat_ws(' ', c.name, c.trade)",
+        "fuzzy": ["c.name"],
+        "ilike": ["c.name"],
+    },
+    "daily_reports": {
+        "alias": "dr",
+        "document": "concat_ws(' ', dr.work_performed, dr.delays, dr.general_notes)",
+        "fuzzy": [],
+        "ilike": ["dr.work_performed", "dr.delays", "dr.general_notes"],
+    },
+}
+
+HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=18, MinWords=6, StartSel=**, StopSel=**"
+
+# Short tokens with a digit: sheet numbers, spec sections, log numbers
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z]{0,4}[\s.\-#]*\d[\w\s.\-]{0,12}$")
+
+
+def _looks_like_identifier(keyword: str) -> bool:
+    return bool(_IDENTIFIER_RE.match(keyword.strip()))
+
+
+def _keyword_match(target: str, keyword: str, mode: str) -> Optional[Dict]:
+    """Score/highlight columns and WHERE predicate for one match mode."""
+    spec = SEARCH_TARGETS[target]
+    alias = spec["alias"]
+
+    if mode == "fts":
+        tsquery = "websearch_to_tsquery('english', %s)"
+        return {
+            "columns": (
+                f", ts_rank_cd({alias}.search_vector, {tsquery}, 32) AS score"
+                f", ts_headline('english', {spec['document']}, {tsquery}, '{HEADLINE_OPTIONS}') AS highlight"
+                f", 'fts' AS match_mode"
+            ),
+            "column_params": [keyword, keyword],
+            "condition": f"{alias}.search_vector @@ {tsquery}",
+            "condition_params": [keyword],
+        }
+
+    if not spec["fuzzy"]:
+        return None
+    scores = ", ".join(f"word_similarity(%s, {col})" for col in spec["fuzzy"])
+    return {
+        "columns": (
+            f", GREATEST({scores}) AS score"
+            f", left({spec['document']}, 200) AS highlight"
+            f", 'trigram' AS match_mode"
+        ),
+        "column_params": [keyword] * len(spec["fuzzy"]),
+        "condition": "(" + " OR ".join(f"%s <%% {col}" for col in spec["fuzzy"]) + ")",
+        "condition_params": [keyword] * len(spec["fuzzy"]),
+    }
+
+
+def _run_search(
+    cur, sql: str, target: str, conditions: List[str], params: List,
+    keyword: Optional[str], limit: int, order: str,
+) -> List[Dict]:
+    """Execute a search template, ranked by relevance when a keyword is given.
 
+    `sql` has {columns}, {where} and {order} placeholders. Keyword searches try
+    full-text first and fall back to trigram similarity when it finds nothing
+    (identifier-looking keywords try trigram first). Every returned row carries
+    `score`, `highlight` and `match_mode` when a keyword was given.
+    """
+    def where_clause(extra: List[str]) -> str:
+        clauses = conditions + extra
+        return "WHERE " + " AND ".join(clauses) if clauses else ""
 
-def get_conn():
-    """Get a database connection."""
-    return psycopg2.connect(
-        dbname=DB_NAME, user=DB_USER, host=DB_HOST, port=DB_PORT,
-        cursor_factory=psycopg2.extras.RealDictCursor
-    )
+    if keyword:
+        keyword = keyword.strip()
+
+    if not keyword or SEARCH_MODE == "ilike":
+        extra, extra_params = [], []
+        if keyword:
+            cols = SEARCH_TARGETS[target]["ilike"]
+            extra.append("(" + " OR ".join(f"{col} ILIKE %s" for col in cols) + ")")
+            extra_params = [f"%{keyword}%"] * len(cols)
+        cur.execute(
+            sql.format(columns="", where=where_clause(extra), order=order),
+            params + extra_params + [limit],
+        )
+        return cur.fetchall()
+
+    modes = ["trigram", "fts"] if _looks_like_identifier(keyword) else ["fts", "trigram"]
+    for mode in modes:
+        match = _keyword_match(target, keyword, mode)
+        if match is None:
+            continue
+        if mode == "trigram":
+            cur.execute("SET LOCAL pg_trgm.word_similarity_threshold = %s", (TRGM_THRESHOLD,))
+        cur.execute(
+            sql.format(
+                columns=match["columns"],
+                where=where_clause([match["condition"]]),
+                order=f"score DESC, {order}",
+            ),
+            match["column_params"] + params + match["condition_params"] + [limit],
+        )
+        rows = cur.fetchall()
+        if rows:
+            return rows
+    return []
 
 
 # =============================================================================
@@ -57,23 +266,18 @@ def get_project(project_id: int = None, name: str = None) -> Optional[Dict]:
             return cur.fetchone()
 
 
-def get_project_stats(project_id: int) -> Dict:
-    """Get summary stats for a project — submittals, RFIs, drawings, etc."""
-    with get_conn() as conn:
-        with conn.cursor() as cur:
-            stats = {}
-            for table, label in [
-                ("submittals", "submittals"),
-                ("rfis", "rfis"),
-                ("drawings", "drawings"),
-                ("daily_reports", "daily_reports"),
-                ("change_orders", "change_orders"),
-                ("meetings", "meetings"),
-                ("photos", "photos"),
-            ]:
-                cur.execute(f"SELECT count(*) as cnt FROM {table} WHERE project_id = %s", (project_id,))
-                stats[label] = cur.fetchone()["cnt"]
-            return stats
+def get_project_stats(project_id: int, exact: bool = False) -> Dict:
+    """Get summary stats for a project — submittals, RFIs, drawings, etc.
+
+    Served from the trigger-maintained project_row_counts table by default;
+    exact=True (or a database without that table) counts this project's rows.
+    Never cached.
+    """
+    if not exact:
+        counts = _counted_project_rows(project_id)
+        if counts is not None:
+            return counts
+    return _exact_project_counts(project_id)
 
 
 # =============================================================================
@@ -86,7 +290,8 @@ def search_submittals(
     keyword: str = None,
     status: str = None,
     number: str = None,
-    limit: int = 25
+    limit: int = 25,
+    statement_timeout_ms: int = None
 ) -> List[Dict]:
     """Search submittals with flexible filters."""
     conditions = []
@@ -98,9 +303,6 @@ def search_submittals(
     if spec_section:
         conditions.append("(ss.number ILIKE %s OR ss.title ILIKE %s)")
         params.extend([f"%{spec_section}%", f"%{spec_section}%"])
-    if keyword:
-        conditions.append("(s.title ILIKE %s OR s.description ILIKE %s)")
-        params.extend([f"%{keyword}%", f"%{keyword}%"])
     if status:
         conditions.append("s.status ILIKE %s")
         params.append(f"%{status}%")
@@ -108,44 +310,59 @@ def search_submittals(
         conditions.append("s.number ILIKE %s")
         params.append(f"%{number}%")
 
-    where = "WHERE " + " AND ".join(conditions) if conditions else ""
-
-    with get_conn() as conn:
+    with get_conn(statement_timeout_ms) as conn:
         with conn.cursor() as cur:
-            cur.execute(f"""
+            return _run_search(cur, """
                 SELECT s.id, s.number, s.title, s.status, s.revision,
                        s.received_date, s.required_date, s.submitted_date,
                        s.description,
                        ss.number as spec_number, ss.title as spec_title,
                        p.name as project_name, p.number as project_number,
                        c.name as responsible_contractor
+                       {columns}
                 FROM submittals s
                 LEFT JOIN spec_sections ss ON s.spec_section_id = ss.id
                 LEFT JOIN projects p ON s.project_id = p.id
                 LEFT JOIN companies c ON s.responsible_contractor_id = c.id
                 {where}
-                ORDER BY s.number
+                ORDER BY {order}
                 LIMIT %s
-            """, params + [limit])
-            return cur.fetchall()
+            """, "submittals", conditions, params, keyword, limit, "s.number")
 
 
 def get_submittal_history(submittal_id: int) -> List[Dict]:
     """Get workflow history for a specific submittal."""
+    return get_submittal_histories([submittal_id]).get(str(submittal_id), [])
+
+
+def get_submittal_histories(submittal_ids: List) -> Dict[str, List[Dict]]:
+    """Workflow history for several submittals in one query, keyed by submittal id."""
+    if not submittal_ids:
+        return {}
     with get_conn() as conn:
         with conn.cursor() as cur:
             cur.execute("""
-                SELECT swh.*, c.name as actor_name
+                SELECT swh.*,
+                       concat_ws(' ', c.first_name, c.last_name) as actor_name,
+                       co.name as actor_company
                 FROM submittal_workflow_history swh
-                LEFT JOIN contacts c ON swh.actor_id = c.id
-                WHERE swh.submittal_id = %s
-                ORDER BY swh.action_date
-            """, (submittal_id,))
-            return cur.fetchall()
-
-
-def get_submittal_with_similar(submittal_id: int) -> Dict:
-    """Get a submittal and find similar ones from other projects (cross-reference)."""
+                LEFT JOIN contacts c ON swh.actor_contact_id = c.id
+                LEFT JOIN companies co ON swh.actor_company_id = co.id
+                WHERE swh.submittal_id = ANY(%s::uuid[])
+                ORDER BY swh.submittal_id, swh.created_at
+            """, ([str(i) for i in submittal_ids],))
+            histories = {str(i): [] for i in submittal_ids}
+            for row in cur.fetchall():
+                histories.setdefault(str(row["submittal_id"]), []).append(row)
+            return histories
+
+
+def get_submittal_with_similar(submittal_id: int, limit: int = 20) -> Dict:
+    """Get a submittal and find similar ones from other projects (cross-reference).
+
+    Ranked by embedding similarity; restricted to the same spec section when
+    the submittal has one.
+    """
     with get_conn() as conn:
         with conn.cursor() as cur:
             # Get the submittal
@@ -158,27 +375,53 @@ def get_submittal_with_similar(submittal_id: int) -> Dict:
                 WHERE s.id = %s
             """, (submittal_id,))
             submittal = cur.fetchone()
-
-            if not submittal or not submittal.get("spec_section_id"):
+            if not submittal:
+                return {"submittal": None, "similar": []}
+
+            vector = embeddings.source_vector(cur, "submittal", submittal_id)
+            if vector is None:
+                vec = embeddings.embed_text(" ".join(
+                    str(submittal.get(k) or "") for k in ("title", "spec_section_number", "description")
+                ))
+                if vec is None:
+                    return {"submittal": submittal, "similar": []}
+                vector = embeddings.to_pgvector(vec)
+
+            matches = embeddings.nearest(
+                cur, "submittal", vector, limit=limit, exclude_id=submittal_id,
+                spec_section=submittal.get("spec_number") or submittal.get("spec_section_number"),
+                exclude_project_id=submittal["project_id"],
+            )
+            if not matches:
                 return {"submittal": submittal, "similar": []}
 
-            # Find similar submittals from OTHER projects with same spec section
             cur.execute("""
-                SELECT s.number, s.title, s.status, s.revision,
+                SELECT s.id, s.number, s.title, s.status, s.revision,
                        p.name as project_name, p.number as project_number,
-                       ss.number as spec_number,
+                       coalesce(ss.number, s.spec_section_number) as spec_number,
                        s.description
                 FROM submittals s
-                JOIN spec_sections ss ON s.spec_section_id = ss.id
+                LEFT JOIN spec_sections ss ON s.spec_section_id = ss.id
                 JOIN projects p ON s.project_id = p.id
-                WHERE ss.number = %s AND s.project_id != %s
-                ORDER BY p.start_date DESC
-            """, (submittal["spec_number"], submittal["project_id"]))
-            similar = cur.fetchall()
+                WHERE s.id = ANY(%s::uuid[])
+            """, ([str(m["source_id"]) for m in matches],))
+            similar = _in_similarity_order(cur.fetchall(), matches)
 
             return {"submittal": submittal, "similar": similar}
 
 
+def _in_similarity_order(rows: List[Dict], matches: List[Dict]) -> List[Dict]:
+    """Attach `similarity` to hydrated rows and keep the ANN ranking."""
+    by_id = {str(r["id"]): r for r in rows}
+    ordered = []
+    for m in matches:
+        row = by_id.get(str(m["source_id"]))
+        if row is not None:
+            row["similarity"] = round(float(m["similarity"]), 4)
+            ordered.append(row)
+    return ordered
+
+
 # =============================================================================
 # RFI QUERIES
 # =============================================================================
@@ -188,7 +431,8 @@ def search_rfis(
     keyword: str = None,
     status: str = None,
     number: str = None,
-    limit: int = 25
+    limit: int = 25,
+    statement_timeout_ms: int = None
 ) -> List[Dict]:
     """Search RFIs with flexible filters."""
     conditions = []
@@ -197,9 +441,6 @@ def search_rfis(
     if project_id:
         conditions.append("r.project_id = %s")
         params.append(project_id)
-    if keyword:
-        conditions.append("(r.subject ILIKE %s OR r.question ILIKE %s)")
-        params.extend([f"%{keyword}%", f"%{keyword}%"])
     if status:
         conditions.append("r.status ILIKE %s")
         params.append(f"%{status}%")
@@ -207,89 +448,114 @@ def search_rfis(
         conditions.append("r.number ILIKE %s")
         params.append(f"%{number}%")
 
-    where = "WHERE " + " AND ".join(conditions) if conditions else ""
-
-    with get_conn() as conn:
+    with get_conn(statement_timeout_ms) as conn:
         with conn.cursor() as cur:
-            cur.execute(f"""
+            return _run_search(cur, """
                 SELECT r.id, r.number, r.subject, r.question, r.status,
                        r.due_date, r.date_initiated,
                        r.cost_impact, r.schedule_impact,
                        p.name as project_name, p.number as project_number
+                       {columns}
                 FROM rfis r
                 LEFT JOIN projects p ON r.project_id = p.id
                 {where}
-                ORDER BY r.number
+                ORDER BY {order}
                 LIMIT %s
-            """, params + [limit])
-            return cur.fetchall()
+            """, "rfis", conditions, params, keyword, limit, "r.number")
 
 
 def get_rfi_with_responses(rfi_id: int) -> Dict:
     """Get an RFI with all its responses."""
+    found = get_rfis_with_responses([rfi_id])
+    return found[0] if found else {"rfi": None, "responses": []}
+
+
+def get_rfis_with_responses(rfi_ids: List) -> List[Dict]:
+    """Several RFIs with their responses in two queries, in the order requested."""
+    if not rfi_ids:
+        return []
+    ids = [str(i) for i in rfi_ids]
     with get_conn() as conn:
         with conn.cursor() as cur:
             cur.execute("""
                 SELECT r.*, p.name as project_name
                 FROM rfis r
                 LEFT JOIN projects p ON r.project_id = p.id
-                WHERE r.id = %s
-            """, (rfi_id,))
-            rfi = cur.fetchone()
+                WHERE r.id = ANY(%s::uuid[])
+            """, (ids,))
+            rfis = {str(r["id"]): r for r in cur.fetchall()}
 
             cur.execute("""
-                SELECT rr.*, c.name as responder_name
+                SELECT rr.*,
+                       concat_ws(' ', c.first_name, c.last_name) as responder_name,
+                       co.name as responder_company
                 FROM rfi_responses rr
-                LEFT JOIN contacts c ON rr.responder_id = c.id
-                WHERE rr.rfi_id = %s
-                ORDER BY rr.response_date
-            """, (rfi_id,))
-            responses = cur.fetchall()
+                LEFT JOIN contacts c ON rr.responder_contact_id = c.id
+                LEFT JOIN companies co ON rr.responder_company_id = co.id
+                WHERE rr.rfi_id = ANY(%s::uuid[])
+                ORDER BY rr.rfi_id, rr.created_at
+            """, (ids,))
+            responses: Dict[str, List[Dict]] = {}
+            for row in cur.fetchall():
+                responses.setdefault(str(row["rfi_id"]), []).append(row)
+
+            return [
+                {"rfi": rfis[i], "responses": responses.get(i, [])}
+                for i in ids if i in rfis
+            ]
 
-            return {"rfi": rfi, "responses": responses}
 
+def find_similar_rfis(
+    rfi_id: int = None, keyword: str = None, spec_section: str = None, limit: int = 10
+) -> List[Dict]:
+    """Find similar RFIs across ALL projects — the cross-reference power.
 
-def find_similar_rfis(rfi_id: int = None, keyword: str = None, spec_section: str = None) -> List[Dict]:
-    """Find similar RFIs across ALL projects — the cross-reference power."""
+    Nearest neighbours in the local embedding index (see embeddings.py),
+    optionally restricted to one spec section.
+    """
     with get_conn() as conn:
         with conn.cursor() as cur:
+            vector = None
+            text = keyword
             if rfi_id:
-                cur.execute("SELECT subject, location FROM rfis WHERE id = %s", (rfi_id,))
-                rfi = cur.fetchone()
-                if not rfi:
+                vector = embeddings.source_vector(cur, "rfi", rfi_id)
+                if vector is None:
+                    # Not embedded yet — embed its text on the fly
+                    cur.execute("""
+                        SELECT concat_ws(' ', subject, question, official_answer) AS text
+                        FROM rfis WHERE id = %s
+                    """, (rfi_id,))
+                    rfi = cur.fetchone()
+                    if not rfi:
+                        return []
+                    text = rfi["text"]
+
+            if vector is None:
+                vec = embeddings.embed_text(text or "")
+                if vec is None:
                     return []
-                keyword = rfi.get("subject", "")
-
-            conditions = []
-            params = []
-            if keyword:
-                # Split keywords for broader matching
-                words = [w for w in keyword.split() if len(w) > 3]
-                if words:
-                    conditions.append("(" + " OR ".join(["r.subject ILIKE %s" for _ in words]) + ")")
-                    params.extend([f"%{w}%" for w in words])
-
-            if not conditions:
-                return []
+                vector = embeddings.to_pgvector(vec)
 
-            where = "WHERE " + " AND ".join(conditions)
-            if rfi_id:
-                where += " AND r.id != %s"
-                params.append(rfi_id)
+            matches = embeddings.nearest(
+                cur, "rfi", vector, limit=limit, exclude_id=rfi_id, spec_section=spec_section
+            )
+            if not matches:
+                return []
 
-            cur.execute(f"""
-                SELECT r.number, r.subject, r.question, r.status,
-                       r.location,
+            cur.execute("""
+                SELECT r.id, r.number, r.subject, r.question, r.status,
+                       r.location, r.spec_section_number,
                        p.name as project_name, p.number as project_number,
-                       (SELECT rr.body FROM rfi_responses rr 
-                        WHERE rr.rfi_id = r.id ORDER BY rr.created_at DESC LIMIT 1) as latest_response
+                       lr.body as latest_response
                 FROM rfis r
                 LEFT JOIN projects p ON r.project_id = p.id
-                {where}
-                ORDER BY r.date_initiated DESC
-                LIMIT 10
-            """, params)
-            return cur.fetchall()
+                LEFT JOIN LATERAL (
+                    SELECT rr.body FROM rfi_responses rr
+                    WHERE rr.rfi_id = r.id ORDER BY rr.created_at DESC LIMIT 1
+                ) lr ON TRUE
+                WHERE r.id = ANY(%s::uuid[])
+            """, ([str(m["source_id"]) for m in matches],))
+            return _in_similarity_order(cur.fetchall(), matches)
 
 
 # =============================================================================
@@ -301,7 +567,8 @@ def search_drawings(
     discipline: str = None,
     number: str = None,
     keyword: str = None,
-    limit: int = 25
+    limit: int = 25,
+    statement_timeout_ms: int = None
 ) -> List[Dict]:
     """Search drawings."""
     conditions = []
@@ -316,56 +583,48 @@ def search_drawings(
     if number:
         conditions.append("d.number ILIKE %s")
         params.append(f"%{number}%")
-    if keyword:
-        conditions.append("(d.title ILIKE %s OR d.ocr_text ILIKE %s)")
-        params.extend([f"%{keyword}%", f"%{keyword}%"])
 
-    where = "WHERE " + " AND ".join(conditions) if conditions else ""
-
-    with get_conn() as conn:
+    with get_conn(statement_timeout_ms) as conn:
         with conn.cursor() as cur:
-            cur.execute(f"""
+            return _run_search(cur, """
                 SELECT d.id, d.number, d.title, d.discipline,
                        d.revision, d.set_name,
                        p.name as project_name,
                        (SELECT count(*) FROM drawing_revisions dr WHERE dr.drawing_id = d.id) as revision_count
+                       {columns}
                 FROM drawings d
                 LEFT JOIN projects p ON d.project_id = p.id
                 {where}
-                ORDER BY d.discipline, d.number
+                ORDER BY {order}
                 LIMIT %s
-            """, params + [limit])
-            return cur.fetchall()
+            """, "drawings", conditions, params, keyword, limit, "d.discipline, d.number")
 
 
 # =============================================================================
 # COMPANY / CONTACT QUERIES
 # =============================================================================
 
-def search_companies(name: str = None, trade: str = None) -> List[Dict]:
+def search_companies(
+    name: str = None, trade: str = None, limit: int = 25, statement_timeout_ms: int = None
+) -> List[Dict]:
     """Search companies/subcontractors."""
     conditions = []
     params = []
-    if name:
-        conditions.append("c.name ILIKE %s")
-        params.append(f"%{name}%")
     if trade:
         conditions.append("c.trade ILIKE %s")
         params.append(f"%{trade}%")
 
-    where = "WHERE " + " AND ".join(conditions) if conditions else ""
-
-    with get_conn() as conn:
+    with get_conn(statement_timeout_ms) as conn:
         with conn.cursor() as cur:
-            cur.execute(f"""
+            return _run_search(cur, """
                 SELECT c.id, c.name, c.trade, c.address, c.phone, c.email,
                        (SELECT count(*) FROM project_companies pc WHERE pc.company_id = c.id) as project_count
+                       {columns}
                 FROM companies c
                 {where}
-                ORDER BY c.name
-                LIMIT 25
-            """, params)
-            return cur.fetchall()
+                ORDER BY {order}
+                LIMIT %s
+            """, "companies", conditions, params, name, limit, "c.name")
 
 
 def get_company_history(company_id: int) -> Dict:
@@ -406,27 +665,90 @@ def get_company_history(company_id: int) -> Dict:
 # CROSS-REFERENCE / SEARCH-ALL
 # =============================================================================
 
-def search_all(query: str, project_id: int = None, limit: int = 10) -> Dict:
+# One leg per entity type; each runs on its own pooled connection
+_search_executor = ThreadPoolExecutor(max_workers=DB_POOL_MAX, thread_name_prefix="eva00-search")
+
+# entity type -> (title column, number column) for the merged ranking
+_RANKED_FIELDS = {
+    "submittals": ("title", "number"),
+    "rfis": ("subject", "number"),
+    "drawings": ("title", "number"),
+    "companies": ("name", None),
+}
+
+
+def search_all(query: str, project_id: int = None, limit: int = 10, deadline_ms: int = None) -> Dict:
     """Search across ALL tables — the EVA-00 power query.
-    Returns categorized results from submittals, RFIs, drawings, companies, etc.
+    Returns categorized results from submittals, RFIs, drawings, companies, etc.,
+    plus a single list ranked across entity types by relevance score.
+
+    Both match modes score on 0..1 (ts_rank_cd with normalization 32, and
+    trigram word_similarity), so the merged list sorts on each hit's own
+    score, breaking ties on its rank within its leg.
+
+    Legs run concurrently on pooled connections. Legs still running at the
+    deadline are reported in summary["timed_out"] and their lists are empty;
+    their statement_timeout releases the connection shortly after.
     """
+    deadline_ms = deadline_ms or SEARCH_ALL_DEADLINE_MS
+    started = time.monotonic()
+
+    legs = {
+        "submittals": lambda: search_submittals(
+            project_id=project_id, keyword=query, limit=limit, statement_timeout_ms=deadline_ms
+        ),
+        "rfis": lambda: search_rfis(
+            project_id=project_id, keyword=query, limit=limit, statement_timeout_ms=deadline_ms
+        ),
+        "drawings": lambda: search_drawings(
+            project_id=project_id, keyword=query, limit=limit, statement_timeout_ms=deadline_ms
+        ),
+        "companies": lambda: search_companies(
+            name=query, limit=limit, statement_timeout_ms=deadline_ms
+        ),
+    }
+    futures = {_search_executor.submit(fn): entity for entity, fn in legs.items()}
+    done, pending = wait(futures, timeout=deadline_ms / 1000)
+
     results = {}
-    
-    results["submittals"] = search_submittals(
-        project_id=project_id, keyword=query, limit=limit
-    )
-    results["rfis"] = search_rfis(
-        project_id=project_id, keyword=query, limit=limit
-    )
-    results["drawings"] = search_drawings(
-        project_id=project_id, keyword=query, limit=limit
-    )
-    results["companies"] = search_companies(name=query)
+    errors = {}
+    for future, entity in futures.items():
+        results[entity] = []
+        if future in done:
+            try:
+                results[entity] = future.result()
+            except Exception as e:
+                errors[entity] = str(e)
+    timed_out = sorted(futures[f] for f in pending)
+    for f in pending:
+        f.cancel()
+
+    ranked = []
+    for entity, (title_col, number_col) in _RANKED_FIELDS.items():
+        rows = results[entity]
+        for rank, row in enumerate(rows, start=1):
+            score = float(row.get("score") or 0.0)
+            ranked.append(((score, -rank), {
+                "type": entity,
+                "id": row.get("id"),
+                "number": row.get(number_col) if number_col else None,
+                "title": row.get(title_col),
+                "project_name": row.get("project_name"),
+                "score": round(score, 6),
+                "match_mode": row.get("match_mode"),
+                "highlight": row.get("highlight"),
+            }))
+    ranked.sort(key=lambda r: r[0], reverse=True)
+    results["ranked"] = [item for _, item in ranked[:limit]]
 
     # Summary
     results["summary"] = {
         "query": query,
-        "total_results": sum(len(v) for v in results.values() if isinstance(v, list)),
+        "total_results": sum(len(results[entity]) for entity in legs),
+        "partial": bool(timed_out or errors),
+        "timed_out": timed_out,
+        "errors": errors,
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
         "searched_at": datetime.now().isoformat()
     }
 
@@ -457,45 +779,148 @@ def search_daily_reports(
     if date_to:
         conditions.append("dr.report_date <= %s")
         params.append(date_to)
-    if keyword:
-        conditions.append("(dr.notes ILIKE %s OR dr.weather_notes ILIKE %s)")
-        params.extend([f"%{keyword}%", f"%{keyword}%"])
-
-    where = "WHERE " + " AND ".join(conditions) if conditions else ""
 
     with get_conn() as conn:
         with conn.cursor() as cur:
-            cur.execute(f"""
-                SELECT dr.id, dr.report_date, dr.weather, dr.weather_notes,
-                       dr.notes, dr.workers_on_site, dr.visitors,
+            return _run_search(cur, """
+                SELECT dr.id, dr.report_date, dr.weather,
+                       dr.work_performed, dr.delays, dr.general_notes,
+                       dr.total_workers, dr.visitors,
                        p.name as project_name
+                       {columns}
                 FROM daily_reports dr
                 LEFT JOIN projects p ON dr.project_id = p.id
                 {where}
-                ORDER BY dr.report_date DESC
+                ORDER BY {order}
                 LIMIT %s
-            """, params + [limit])
-            return cur.fetchall()
+            """, "daily_reports", conditions, params, keyword, limit, "dr.report_date DESC")
 
 
 # =============================================================================
 # DATABASE STATS
 # =============================================================================
 
-def get_database_stats() -> Dict:
-    """Get overall database statistics — how much data EVA-00 knows about."""
+DATABASE_STAT_TABLES = [
+    "projects", "submittals", "rfis", "drawings", "drawing_revisions",
+    "daily_reports", "companies", "contacts", "meetings", "photos",
+    "change_orders", "documents", "spec_sections"
+]
+
+PROJECT_STAT_TABLES = [
+    "submittals", "rfis", "drawings", "daily_reports", "change_orders", "meetings", "photos",
+]
+
+STATS_CACHE_SECONDS = float(os.environ.get("EVA00_STATS_CACHE_SECONDS", "30"))
+
+_stats_cache: Dict[str, tuple] = {}
+_stats_lock = threading.Lock()
+
+
+def _cached(key: str, compute):
+    """Return a cached value younger than STATS_CACHE_SECONDS, else recompute."""
+    now = time.monotonic()
+    with _stats_lock:
+        entry = _stats_cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+    value = compute()
+    with _stats_lock:
+        _stats_cache[key] = (now + STATS_CACHE_SECONDS, value)
+    return value
+
+
+def _existing_tables(cur, tables: List[str]) -> List[str]:
+    cur.execute("""
+        SELECT relname FROM pg_class
+        WHERE relname = ANY(%s) AND relkind IN ('r', 'p')
+          AND relnamespace = 'public'::regnamespace
+    """, (tables,))
+    found = {r["relname"] for r in cur.fetchall()}
+    return [t for t in tables if t in found]
+
+
+def _estimated_table_counts() -> Dict[str, int]:
+    """Row estimates from the statistics collector — O(1) regardless of size.
+
+    n_live_tup tracks inserts/deletes as they commit; reltuples (last
+    ANALYZE/VACUUM) is the fallback. Tables never analyzed are counted exactly.
+    """
     with get_conn() as conn:
         with conn.cursor() as cur:
-            stats = {}
-            tables = [
-                "projects", "submittals", "rfis", "drawings", "drawing_revisions",
-                "daily_reports", "companies", "contacts", "meetings", "photos",
-                "change_orders", "documents", "spec_sections"
-            ]
-            for table in tables:
-                try:
-                    cur.execute(f"SELECT count(*) as cnt FROM {table}")
-                    stats[table] = cur.fetchone()["cnt"]
-                except:
-                    stats[table] = 0
+            cur.execute("""
+                SELECT c.relname,
+                       COALESCE(s.n_live_tup, 0) AS live,
+                       c.reltuples
+                FROM pg_class c
+                LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+                WHERE c.relname = ANY(%s) AND c.relkind IN ('r', 'p')
+                  AND c.relnamespace = 'public'::regnamespace
+            """, (DATABASE_STAT_TABLES,))
+            stats = {t: 0 for t in DATABASE_STAT_TABLES}
+            unanalyzed = []
+            for row in cur.fetchall():
+                if row["live"] > 0:
+                    stats[row["relname"]] = int(row["live"])
+                elif row["reltuples"] > 0:
+                    stats[row["relname"]] = int(row["reltuples"])
+                elif row["reltuples"] < 0:
+                    unanalyzed.append(row["relname"])
+            for table in unanalyzed:
+                cur.execute(f"SELECT count(*) as cnt FROM {table}")
+                stats[table] = cur.fetchone()["cnt"]
             return stats
+
+
+def _exact_table_counts() -> Dict[str, int]:
+    """Exact counts for every stats table in a single statement."""
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            tables = _existing_tables(cur, DATABASE_STAT_TABLES)
+            stats = {t: 0 for t in DATABASE_STAT_TABLES}
+            if tables:
+                cur.execute("SELECT " + ", ".join(
+                    f"(SELECT count(*) FROM {t}) AS {t}" for t in tables
+                ))
+                stats.update(cur.fetchone())
+            return stats
+
+
+def _counted_project_rows(project_id) -> Optional[Dict[str, int]]:
+    """Counts from project_row_counts, or None if the table isn't installed."""
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            if not _existing_tables(cur, ["project_row_counts"]):
+                return None
+            cur.execute("""
+                SELECT table_name, row_count FROM project_row_counts
+                WHERE project_id = %s AND table_name = ANY(%s)
+            """, (project_id, PROJECT_STAT_TABLES))
+            stats = {t: 0 for t in PROJECT_STAT_TABLES}
+            for row in cur.fetchall():
+                stats[row["table_name"]] = int(row["row_count"])
+            return stats
+
+
+def _exact_project_counts(project_id) -> Dict[str, int]:
+    """Exact counts for one project; each leg is an index scan on project_id."""
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            tables = _existing_tables(cur, PROJECT_STAT_TABLES)
+            stats = {t: 0 for t in PROJECT_STAT_TABLES}
+            if tables:
+                cur.execute("SELECT " + ", ".join(
+                    f"(SELECT count(*) FROM {t} WHERE project_id = %s) AS {t}" for t in tables
+                ), [project_id] * len(tables))
+                stats.update(cur.fetchone())
+            return stats
+
+
+def get_database_stats(exact: bool = False) -> Dict:
+    """Get overall database statistics — how much data EVA-00 knows about.
+
+    Estimates by default (cheap enough for /health), cached for
+    STATS_CACHE_SECONDS; exact=True always counts every table.
+    """
+    if exact:
+        return _exact_table_counts()
+    return _cached("database_estimate", _estimated_table_counts)
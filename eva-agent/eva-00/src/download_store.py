@@ -0,0 +1,161 @@
+"""Procore download store — concurrent, resumable, content-addressed file downloads.
+
+Files land once in a SHA-256 blob store (<root>/blobs/ab/abcdef...) and are
+hardlinked into wherever the caller wants them, so a spec PDF attached to
+forty submittals takes one blob and one download:
+
+- A download key (the URL minus its signed query string, by default) that has
+  completed before is answered from the key index without touching the network.
+- Concurrent requests for the same key share one in-flight download.
+- Interrupted downloads keep their partial file and continue with a Range
+  request next time.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+log = logging.getLogger("procore.downloads")
+
+DOWNLOAD_WORKERS = int(os.environ.get("PROCORE_DOWNLOAD_WORKERS", "4"))
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def download_key(url: str) -> str:
+    """Stable identity for a Procore file URL (signatures and expiries stripped)."""
+    return url.split("?", 1)[0]
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _link(src: Path, dest: Path):
+    """Hardlink src to dest, replacing dest; copy when linking isn't possible."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.link")
+    if tmp.exists():
+        tmp.unlink()
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)  # different filesystem
+    os.replace(tmp, dest)
+
+
+class DownloadStore:
+    """Thread pool of Procore downloads backed by a content-addressed blob store."""
+
+    def __init__(self, client, root: Path, workers: int = DOWNLOAD_WORKERS):
+        self.client = client
+        self.root = Path(root)
+        self.blobs = self.root / "blobs"
+        self.keys = self.root / "keys"
+        self.partial = self.root / "partial"
+        for d in (self.blobs, self.keys, self.partial):
+            d.mkdir(parents=True, exist_ok=True)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="procore-download")
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.stats = {"downloaded": 0, "deduplicated": 0, "resumed": 0, "bytes": 0}
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Blob store
+    # -------------------------------------------------------------------------
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blobs / sha256[:2] / sha256
+
+    def _key_path(self, key: str) -> Path:
+        return self.keys / hashlib.sha256(key.encode()).hexdigest()
+
+    def _known_blob(self, key: str) -> Optional[Path]:
+        try:
+            sha256 = self._key_path(key).read_text().strip()
+        except FileNotFoundError:
+            return None
+        blob = self.blob_path(sha256)
+        return blob if blob.exists() else None
+
+    def _fetch_blob(self, url: str, key: str) -> Path:
+        """Download url (resuming any partial file) and file it under its hash."""
+        blob = self._known_blob(key)
+        if blob:
+            with self._lock:
+                self.stats["deduplicated"] += 1
+            return blob
+
+        partial = self.partial / hashlib.sha256(key.encode()).hexdigest()
+        if partial.exists():
+            with self._lock:
+                self.stats["resumed"] += 1
+        self.client.download(url, partial, resume=True)
+        sha256 = _sha256_file(partial)
+        blob = self.blob_path(sha256)
+        size = partial.stat().st_size
+        if blob.exists():
+            partial.unlink()  # same bytes under another key
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(partial, blob)
+        key_tmp = self._key_path(key).with_suffix(".tmp")
+        key_tmp.write_text(sha256)
+        os.replace(key_tmp, self._key_path(key))
+        with self._lock:
+            self.stats["downloaded"] += 1
+            self.stats["bytes"] += size
+        return blob
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def submit(self, url: str, dest: Path, key: str = None) -> Future:
+        """Queue a download; the future resolves to dest once it is linked in place."""
+        key = key or download_key(url)
+        with self._lock:
+            blob_future = self._in_flight.get(key)
+            if blob_future is None:
+                blob_future = self._pool.submit(self._fetch_blob, url, key)
+                self._in_flight[key] = blob_future
+                blob_future.add_done_callback(lambda _f, k=key: self._forget(k))
+            else:
+                self.stats["deduplicated"] += 1
+
+        done: Future = Future()
+
+        def link(f: Future):
+            try:
+                _link(f.result(), dest)
+                done.set_result(dest)
+            except Exception as e:
+                done.set_exception(e)
+
+        blob_future.add_done_callback(link)
+        return done
+
+    def fetch(self, url: str, dest: Path, key: str = None) -> Path:
+        """Blocking download into dest."""
+        return self.submit(url, dest, key).result()
+
+    def _forget(self, key: str):
+        with self._lock:
+            self._in_flight.pop(key, None)
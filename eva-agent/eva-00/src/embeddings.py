@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""EVA-00 Embeddings — Local similarity index for RFIs and submittals.
+
+Embeds RFI (subject, question, answer, responses) and submittal (title,
+description, spec section) text into document_chunks with a CPU-only hashing
+vectorizer: no model download, no network, deterministic across machines.
+"Similar" queries are answered by the HNSW index on those vectors.
+
+Usage:
+    python embeddings.py --backfill          # embed everything missing or stale
+    python embeddings.py --text "curtain wall anchor embed conflict"
+"""
+
+import hashlib
+import logging
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+import psycopg2.extras
+
+log = logging.getLogger("eva00.embeddings")
+
+# Must match document_chunks.embedding vector(768)
+EMBEDDING_DIM = 768
+EMBEDDING_MODEL = "eva00-hash-v1"
+EMBED_BATCH_SIZE = int(os.environ.get("EVA00_EMBED_BATCH_SIZE", "200"))
+HNSW_EF_SEARCH = int(os.environ.get("EVA00_HNSW_EF_SEARCH", "80"))
+MAX_CONTENT_CHARS = 8000
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-.][a-z0-9]+)*")
+_STOPWORDS = frozenset("""
+    a an and are as at be been but by can could do does for from has have how if in
+    into is it its may no not of on or our per please shall should so that the their
+    there these this to was we were what when where which will with would you your
+    rfi submittal question answer response see attached provide confirm
+""".split())
+
+
+# =============================================================================
+# VECTORIZER
+# =============================================================================
+
+def _stem(token: str) -> str:
+    """Very light suffix stripping so 'anchors'/'anchored' share a feature."""
+    for suffix in ("ing", "ed", "es", "s"):
+        if len(token) > len(suffix) + 3 and token.endswith(suffix):
+            return token[: -len(suffix)]
+    return token
+
+
+def _features(text: str) -> Counter:
+    tokens = [_stem(t) for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS and len(t) > 1]
+    feats: Counter = Counter()
+    for tok in tokens:
+        feats[f"w:{tok}"] += 1.0
+        # Character trigrams make near-misses ("sprinkelr") land close by
+        if len(tok) >= 5:
+            padded = f"<{tok}>"
+            grams = [padded[i:i + 3] for i in range(len(padded) - 2)]
+            for gram in grams:
+                feats[f"c:{gram}"] += 1.0 / len(grams)
+    for a, b in zip(tokens, tokens[1:]):
+        feats[f"b:{a} {b}"] += 0.5
+    return feats
+
+
+def embed_text(text: str) -> Optional[List[float]]:
+    """L2-normalised signed hashing embedding, or None for empty text."""
+    feats = _features(text or "")
+    if not feats:
+        return None
+    vec = [0.0] * EMBEDDING_DIM
+    for feat, count in feats.items():
+        h = int.from_bytes(hashlib.blake2b(feat.encode(), digest_size=8).digest(), "big")
+        sign = 1.0 if h >> 63 else -1.0
+        # Sublinear term frequency; fractional (char-gram/bigram) weights pass through
+        weight = 1.0 + math.log(count) if count >= 1 else count
+        vec[h % EMBEDDING_DIM] += sign * weight
+    norm = math.sqrt(sum(v * v for v in vec))
+    if norm == 0:
+        return None
+    return [v / norm for v in vec]
+
+
+def to_pgvector(vec: List[float]) -> str:
+    """pgvector text literal; pass as %s::vector."""
+    return "[" + ",".join(f"{v:.6f}" for v in vec) + "]"
+
+
+# =============================================================================
+# INCREMENTAL INDEXING
+# =============================================================================
+
+# Rows with no chunk for EMBEDDING_MODEL, or changed since it was embedded
+PENDING_QUERIES = {
+    "rfi": """
+        SELECT r.id, r.project_id, r.spec_section_number AS spec_section,
+               concat_ws(E'\\n', r.subject, r.question, r.official_answer,
+                         (SELECT string_agg(rr.body, E'\\n' ORDER BY rr.created_at)
+                          FROM rfi_responses rr WHERE rr.rfi_id = r.id)) AS content
+        FROM rfis r
+        LEFT JOIN document_chunks dc
+               ON dc.source_type = 'rfi' AND dc.source_id = r.id AND dc.embedding_model = %s
+        WHERE r.is_deleted = FALSE
+          AND (dc.id IS NULL
+               OR r.updated_at > dc.embedded_at
+               OR EXISTS (SELECT 1 FROM rfi_responses rr
+                          WHERE rr.rfi_id = r.id AND rr.created_at > dc.embedded_at))
+        LIMIT %s
+    """,
+    "submittal": """
+        SELECT s.id, s.project_id, s.spec_section_number AS spec_section,
+               concat_ws(E'\\n', s.title, s.spec_section_number, s.submittal_type, s.description) AS content
+        FROM submittals s
+        LEFT JOIN document_chunks dc
+               ON dc.source_type = 'submittal' AND dc.source_id = s.id AND dc.embedding_model = %s
+        WHERE s.is_deleted = FALSE
+          AND (dc.id IS NULL OR s.updated_at > dc.embedded_at)
+        LIMIT %s
+    """,
+}
+
+
+def _store(cur, source_type: str, row: Dict) -> bool:
+    """Replace the chunk for one row; False if it had no indexable text.
+
+    Rows with no indexable text still get a chunk (NULL embedding) stamped
+    with embedded_at, otherwise PENDING_QUERIES would select them forever.
+    """
+    content = (row["content"] or "")[:MAX_CONTENT_CHARS]
+    vec = embed_text(content)
+    cur.execute("""
+        DELETE FROM document_chunks
+        WHERE source_type = %s AND source_id = %s AND embedding_model = %s
+    """, (source_type, row["id"], EMBEDDING_MODEL))
+    cur.execute("""
+        INSERT INTO document_chunks
+            (source_type, source_id, project_id, content, chunk_index, token_count,
+             doc_type, spec_section, embedding, embedding_model, embedded_at)
+        VALUES (%s, %s, %s, %s, 0, %s, %s::document_type, %s, %s::vector, %s, NOW())
+    """, (
+        source_type, row["id"], row["project_id"], content, len(content.split()),
+        source_type, row["spec_section"], to_pgvector(vec) if vec else None, EMBEDDING_MODEL,
+    ))
+    return vec is not None
+
+
+def embed_pending(conn, source_type: str, max_rows: int = None) -> int:
+    """Embed new or changed rows of one source type. Commits per batch."""
+    if source_type not in PENDING_QUERIES:
+        raise ValueError(f"Unsupported source type: {source_type}")
+    total = 0
+    while max_rows is None or total < max_rows:
+        batch = EMBED_BATCH_SIZE if max_rows is None else min(EMBED_BATCH_SIZE, max_rows - total)
+        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            cur.execute(PENDING_QUERIES[source_type], (EMBEDDING_MODEL, batch))
+            rows = cur.fetchall()
+            for row in rows:
+                _store(cur, source_type, row)
+        conn.commit()
+        total += len(rows)
+        if len(rows) < batch:
+            break
+    if total:
+        log.info(f"Embedded {total} {source_type} row(s) with {EMBEDDING_MODEL}")
+    return total
+
+
+# =============================================================================
+# SIMILARITY SEARCH
+# =============================================================================
+
+def source_vector(cur, source_type: str, source_id) -> Optional[str]:
+    """Stored vector literal for an entity, if it has been embedded."""
+    cur.execute("""
+        SELECT embedding::text AS embedding FROM document_chunks
+        WHERE source_type = %s AND source_id = %s AND embedding_model = %s
+          AND embedding IS NOT NULL
+        LIMIT 1
+    """, (source_type, source_id, EMBEDDING_MODEL))
+    row = cur.fetchone()
+    return row["embedding"] if row else None
+
+
+def nearest(
+    cur, source_type: str, vector: str, limit: int = 10,
+    exclude_id=None, spec_section: str = None, exclude_project_id=None,
+) -> List[Dict]:
+    """Approximate nearest neighbours: [{source_id, project_id, spec_section, similarity}].
+
+    Unfiltered queries walk the source_type's partial HNSW index
+    (idx_chunks_embedding_hash_{rfi,submittal}_hnsw); model and source_type
+    are inlined as literals so the planner can match its predicate.
+    Spec-section filters are usually selective enough that the planner
+    switches to idx_chunks_spec and ranks the matching rows exactly.
+    """
+    conditions = ["embedding_model = %s", "source_type = %s", "embedding IS NOT NULL"]
+    params: List = [EMBEDDING_MODEL, source_type]
+    if exclude_id:
+        conditions.append("source_id <> %s")
+        params.append(exclude_id)
+    if spec_section:
+        conditions.append("spec_section = %s")
+        params.append(spec_section)
+    if exclude_project_id:
+        conditions.append("project_id IS DISTINCT FROM %s")
+        params.append(exclude_project_id)
+
+    cur.execute("SET LOCAL hnsw.ef_search = %s", (max(HNSW_EF_SEARCH, limit),))
+    cur.execute(f"""
+        SELECT source_id, project_id, spec_section,
+               1 - (embedding <=> %s::vector) AS similarity
+        FROM document_chunks
+        WHERE {" AND ".join(conditions)}
+        ORDER BY embedding <=> %s::vector
+        LIMIT %s
+    """, [vector] + params + [vector, limit])
+    return cur.fetchall()
+
+
+def main():
+    import argparse
+    import json
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    parser = argparse.ArgumentParser(description="EVA-00 local embedding index")
+    parser.add_argument("--backfill", action="store_true", help="Embed all missing or stale RFIs/submittals")
+    parser.add_argument("--text", help="Print the nearest RFIs and submittals for free text")
+    args = parser.parse_args()
+
+    import database as db
+    with db.get_conn() as conn:
+        if args.backfill:
+            for source_type in PENDING_QUERIES:
+                print(f"{source_type}: {embed_pending(conn, source_type)} embedded")
+        if args.text:
+            vec = embed_text(args.text)
+            if vec is None:
+                print("No indexable terms in text")
+                return
+            with conn.cursor() as cur:
+                for source_type in PENDING_QUERIES:
+                    rows = nearest(cur, source_type, to_pgvector(vec), limit=5)
+                    print(source_type, json.dumps(rows, default=str, indent=2))
+
+
+if __name__ == "__main__":
+    main()
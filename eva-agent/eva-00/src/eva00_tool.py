@@ -7,19 +7,30 @@ Run this as a service. EVA-00 queries it via:
 This keeps the database layer clean and lets EVA-00 use it from any OpenClaw session.
 """
 
+import asyncio
 import json
+import os
 import sys
+import threading
+import time
+from collections import deque
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List, Union
 import uvicorn
 
 # Add parent to path
 sys.path.insert(0, "/home/moby/.openclaw/workspace/eva-agent/eva-00/src")
 import database as db
+from query_cache import QueryCache, normalize_key
 
 app = FastAPI(title="EVA-00 Query Service")
 
+# Latency samples kept per action for percentiles
+METRICS_WINDOW = 500
+BATCH_MAX_QUERIES = int(os.environ.get("EVA00_BATCH_MAX_QUERIES", "25"))
+
 
 class QueryRequest(BaseModel):
     action: str
@@ -35,11 +46,15 @@ class QueryRequest(BaseModel):
     trade: Optional[str] = None
     company_id: Optional[int] = None
     submittal_id: Optional[int] = None
+    submittal_ids: Optional[List[Union[int, str]]] = None  # submittal_history for several
     rfi_id: Optional[int] = None
+    rfi_ids: Optional[List[Union[int, str]]] = None  # rfi_detail for several
     date_from: Optional[str] = None
     date_to: Optional[str] = None
     limit: Optional[int] = 25
     query: Optional[str] = None  # For search_all
+    deadline_ms: Optional[int] = None  # search_all: return partial results after this
+    exact: Optional[bool] = False  # database_stats/project_stats: exact counts, not estimates
 
 
 def resolve_project_id(req: QueryRequest) -> Optional[int]:
@@ -64,9 +79,50 @@ def format_response(data: Any, action: str) -> dict:
     return {"action": action, "result": data}
 
 
-@app.post("/query")
-async def query(req: QueryRequest):
-    """Main query endpoint — routes to the appropriate database function."""
+class QueryMetrics:
+    """Per-action call counts, errors and latency percentiles (in-process)."""
+
+    _lock = threading.Lock()
+    _actions: Dict[str, Dict] = {}
+
+    @classmethod
+    def record(cls, action: str, elapsed_ms: float, ok: bool):
+        with cls._lock:
+            m = cls._actions.setdefault(action, {
+                "count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+                "samples": deque(maxlen=METRICS_WINDOW),
+            })
+            m["count"] += 1
+            m["errors"] += 0 if ok else 1
+            m["total_ms"] += elapsed_ms
+            m["max_ms"] = max(m["max_ms"], elapsed_ms)
+            m["samples"].append(elapsed_ms)
+
+    @staticmethod
+    def _percentile(ordered, pct: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))]
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict]:
+        with cls._lock:
+            out = {}
+            for action, m in cls._actions.items():
+                ordered = sorted(m["samples"])
+                out[action] = {
+                    "count": m["count"],
+                    "errors": m["errors"],
+                    "avg_ms": round(m["total_ms"] / m["count"], 2),
+                    "p50_ms": round(cls._percentile(ordered, 0.50), 2),
+                    "p95_ms": round(cls._percentile(ordered, 0.95), 2),
+                    "max_ms": round(m["max_ms"], 2),
+                }
+            return out
+
+
+def run_action(req: QueryRequest) -> dict:
+    """Route a request to the appropriate database function (blocking)."""
     try:
         pid = resolve_project_id(req)
 
@@ -79,7 +135,7 @@ async def query(req: QueryRequest):
         elif req.action == "project_stats":
             if not pid:
                 return {"error": "Project not found"}
-            data = db.get_project_stats(pid)
+            data = db.get_project_stats(pid, exact=bool(req.exact))
 
         elif req.action == "search_submittals":
             data = db.search_submittals(
@@ -89,9 +145,12 @@ async def query(req: QueryRequest):
             )
 
         elif req.action == "submittal_history":
-            if not req.submittal_id:
-                return {"error": "submittal_id required"}
-            data = db.get_submittal_history(req.submittal_id)
+            if req.submittal_ids:
+                data = db.get_submittal_histories(req.submittal_ids)
+            elif req.submittal_id:
+                data = db.get_submittal_history(req.submittal_id)
+            else:
+                return {"error": "submittal_id or submittal_ids required"}
 
         elif req.action == "similar_submittals":
             if not req.submittal_id:
@@ -105,9 +164,12 @@ async def query(req: QueryRequest):
             )
 
         elif req.action == "rfi_detail":
-            if not req.rfi_id:
-                return {"error": "rfi_id required"}
-            data = db.get_rfi_with_responses(req.rfi_id)
+            if req.rfi_ids:
+                data = db.get_rfis_with_responses(req.rfi_ids)
+            elif req.rfi_id:
+                data = db.get_rfi_with_responses(req.rfi_id)
+            else:
+                return {"error": "rfi_id or rfi_ids required"}
 
         elif req.action == "similar_rfis":
             data = db.find_similar_rfis(
@@ -139,10 +201,10 @@ async def query(req: QueryRequest):
             q = req.query or req.keyword
             if not q:
                 return {"error": "query or keyword required"}
-            data = db.search_all(q, project_id=pid, limit=req.limit)
+            data = db.search_all(q, project_id=pid, limit=req.limit, deadline_ms=req.deadline_ms)
 
         elif req.action == "database_stats":
-            data = db.get_database_stats()
+            data = db.get_database_stats(exact=bool(req.exact))
 
         else:
             return {"error": f"Unknown action: {req.action}"}
@@ -153,13 +215,113 @@ async def query(req: QueryRequest):
         return {"error": str(e)}
 
 
+def _cacheable(result: dict) -> bool:
+    """Errors and deadline-truncated search_all results are never cached."""
+    if "error" in result:
+        return False
+    summary = result.get("result", {}).get("summary") if isinstance(result.get("result"), dict) else None
+    return not (summary and summary.get("partial"))
+
+
+class BatchRequest(BaseModel):
+    queries: List[QueryRequest]
+    project: Optional[str] = None  # default for queries that name no project
+
+
+async def execute(req: QueryRequest) -> dict:
+    """Serve one request from cache, else run it off the event loop."""
+    started = time.perf_counter()
+    key = normalize_key(vars(req))
+    # exact=True asks for counts as of now: never served from or stored in the cache
+    result = None if req.exact else QueryCache.get(req.action, key)
+    if result is None:
+        result = await run_in_threadpool(run_action, req)
+        if not req.exact and _cacheable(result):
+            QueryCache.put(req.action, key, result)
+    QueryMetrics.record(req.action, (time.perf_counter() - started) * 1000, "error" not in result)
+    return result
+
+
+@app.post("/query")
+async def query(req: QueryRequest):
+    """Main query endpoint — routes to the appropriate database function."""
+    return await execute(req)
+
+
+@app.post("/query/batch")
+async def query_batch(batch: BatchRequest):
+    """Run several queries in one round trip; results come back in request order.
+
+    Each distinct project name is resolved once for the whole batch, then the
+    queries run concurrently (bounded by the connection pool size).
+    """
+    if len(batch.queries) > BATCH_MAX_QUERIES:
+        return {"error": f"Batch too large ({len(batch.queries)} > {BATCH_MAX_QUERIES})"}
+
+    started = time.perf_counter()
+    for req in batch.queries:
+        if not req.project_id and not req.project and batch.project:
+            req.project = batch.project
+
+    names = {req.project for req in batch.queries if req.project and not req.project_id}
+    resolved = {}
+    for name in names:
+        try:
+            proj = await run_in_threadpool(db.get_project, name=name)
+        except Exception as e:
+            return {"error": f"Project lookup failed for '{name}': {e}"}
+        resolved[name] = proj["id"] if proj else None
+    for req in batch.queries:
+        if not req.project_id and resolved.get(req.project):
+            req.project_id = resolved[req.project]
+
+    slots = asyncio.Semaphore(db.DB_POOL_MAX)
+
+    async def run(req: QueryRequest) -> dict:
+        async with slots:
+            return await execute(req)
+
+    results = await asyncio.gather(*(run(req) for req in batch.queries))
+    return {
+        "count": len(results),
+        "errors": sum(1 for r in results if "error" in r),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "results": results,
+    }
+
+
+@app.get("/metrics")
+async def metrics():
+    """Per-action latency and error counts since service start."""
+    return {"actions": QueryMetrics.snapshot()}
+
+
+@app.post("/cache/invalidate")
+async def invalidate_cache():
+    """Drop every cached /query result (e.g. after a manual data fix)."""
+    QueryCache.invalidate("api")
+    return {"status": "ok", "cache": QueryCache.stats()}
+
+
 @app.get("/health")
 async def health():
     try:
-        stats = db.get_database_stats()
-        return {"status": "ok", "tables": stats}
+        stats = await run_in_threadpool(db.get_database_stats)
+        return {"status": "ok", "tables": stats, "cache": QueryCache.stats()}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return {"status": "error", "error": str(e), "cache": QueryCache.stats()}
+
+
+@app.on_event("startup")
+def startup():
+    QueryCache.start_listener({
+        "dbname": db.DB_NAME, "user": db.DB_USER, "host": db.DB_HOST, "port": db.DB_PORT,
+    })
+
+
+@app.on_event("shutdown")
+def shutdown():
+    db.close_pool()
 
 
 if __name__ == "__main__":
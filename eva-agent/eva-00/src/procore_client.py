@@ -1,10 +1,26 @@
-"""Procore API client with automatic token refresh and retry logic."""
+"""Procore API client with automatic token refresh, retry logic and rate limiting.
 
+ProcoreClient (threads) and AsyncProcoreClient (asyncio) both keep pooled
+keep-alive connections to Procore, so paginated listings pay the TCP/TLS
+handshake once per connection rather than once per page. HTTP_STATS records
+how much time goes to handshakes vs waiting vs body transfer.
+"""
+
+import asyncio
+import fcntl
 import json
 import logging
+import math
+from collections import deque
+import os
+import threading
 import time
 import requests
+import urllib3.connection
+import urllib3.connectionpool
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 
 log = logging.getLogger("procore_client")
 
@@ -13,13 +29,27 @@ MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 1.0  # seconds — doubles each retry (1s, 2s, 4s)
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
-CREDS_DIR = Path("/home/moby/.openclaw/workspace/.credentials")
+# Rate limiting — Procore enforces ~100 requests per 60s window per token (see
+# SYNC-STRATEGY.md). The bucket starts just under that and then follows the
+# X-Rate-Limit-Remaining / X-Rate-Limit-Reset headers on every response.
+RATE_PER_SECOND = float(os.environ.get("PROCORE_RATE_PER_SECOND", "1.5"))
+RATE_MAX_PER_SECOND = float(os.environ.get("PROCORE_RATE_MAX_PER_SECOND", "5"))
+RATE_BURST = int(os.environ.get("PROCORE_RATE_BURST", "10"))
+CONNECTION_ERROR_PAUSE = 65  # seconds — over-limit clients get dropped connections, not 429s
+MAX_CONCURRENCY = int(os.environ.get("PROCORE_MAX_CONCURRENCY", "6"))  # in-flight pages per client
+# Keep-alive connections per host; callers beyond this wait for a free one
+MAX_CONNECTIONS_PER_HOST = int(os.environ.get("PROCORE_MAX_CONNECTIONS_PER_HOST", "10"))
+REQUEST_TIMEOUT = 30  # seconds
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+CREDS_DIR = Path(os.environ.get("PROCORE_CREDS_DIR", "/home/moby/.openclaw/workspace/.credentials"))
 TOKEN_PATH = CREDS_DIR / "procore_token.json"
 ENV_PATH = CREDS_DIR / "procore.env"
+REFRESH_LOCK_PATH = CREDS_DIR / "procore_token.lock"
 
-# Sandbox endpoints
-AUTH_URL = "https://login-sandbox.procore.com/oauth/token"
-API_BASE = "https://sandbox.procore.com"
+# Sandbox endpoints (overridable to point at scripts/procore-sim.py)
+AUTH_URL = os.environ.get("PROCORE_AUTH_URL", "https://login-sandbox.procore.com/oauth/token")
+API_BASE = os.environ.get("PROCORE_API_BASE", "https://sandbox.procore.com")
 
 
 def _load_env():
@@ -41,41 +71,238 @@ def _load_token():
 
 
 def _save_token(token_data):
-    """Save token to disk."""
+    """Save token to disk (atomically — other processes may be reading it)."""
     token_data['saved_at'] = time.time()
-    with open(TOKEN_PATH, 'w') as f:
+    tmp = TOKEN_PATH.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
         json.dump(token_data, f, indent=2)
+    os.replace(tmp, TOKEN_PATH)
+
+
+class RateLimiter:
+    """Token bucket shared by every request made with one Procore token.
+
+    Refills at RATE_PER_SECOND until Procore reports its own numbers; after
+    that the refill rate is whatever the remaining budget allows until
+    X-Rate-Limit-Reset (capped at RATE_MAX_PER_SECOND). An exhausted budget,
+    a 429 or a dropped connection blocks every caller.
+    """
+
+    def __init__(self, per_second: float = RATE_PER_SECOND, burst: int = RATE_BURST,
+                 max_per_second: float = RATE_MAX_PER_SECOND):
+        self.max_rate = max_per_second
+        self.rate = min(per_second, max_per_second)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.remaining = None
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "waited_seconds": 0.0, "throttled": 0}
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.stats["requests"] += 1
+                    self.stats["waited_seconds"] += waited
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            wait = min(wait, 5.0)  # re-check; observe() may have raised the rate
+            time.sleep(wait)
+            waited += wait
+
+    def block(self, seconds: float):
+        """Hold every caller for `seconds` (e.g. a 429's Retry-After)."""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+            self.stats["throttled"] += 1
+
+    def observe(self, headers):
+        """Re-tune from X-Rate-Limit-Remaining / X-Rate-Limit-Reset (epoch seconds)."""
+        remaining = headers.get("X-Rate-Limit-Remaining")
+        if remaining is None:
+            return
+        try:
+            remaining = int(remaining)
+            reset = headers.get("X-Rate-Limit-Reset")
+            reset_in = max(float(reset) - time.time(), 1.0) if reset else 60.0
+        except ValueError:
+            return
+        if remaining <= 0:
+            log.warning(f"Procore rate limit exhausted, pausing {reset_in:.0f}s until reset")
+            self.block(reset_in)
+            return
+        with self.lock:
+            self._refill(time.monotonic())
+            self.remaining = remaining
+            # Spread what is left of this window evenly over the time until it resets
+            self.rate = min(self.max_rate, remaining / reset_in)
+            self.tokens = min(self.tokens, float(remaining))
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "rate_per_second": round(self.rate, 3),
+                "remaining": self.remaining,
+                "blocked_for": round(max(self.blocked_until - time.monotonic(), 0.0), 1),
+                **self.stats,
+            }
+
+
+# One access token per process (TOKEN_PATH), so one budget for every client
+RATE_LIMITER = RateLimiter()
+
+
+# =============================================================================
+# CONNECTION INSTRUMENTATION
+# =============================================================================
+
+class HttpStats:
+    """Where request time goes: new-connection handshakes, server wait, body transfer."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.totals = {
+            "requests": 0, "new_connections": 0, "bytes": 0,
+            "connect_seconds": 0.0, "wait_seconds": 0.0, "transfer_seconds": 0.0,
+        }
+
+    def record(self, connect: float, wait: float, transfer: float, nbytes: int, new_connection: bool):
+        with self.lock:
+            t = self.totals
+            t["requests"] += 1
+            t["new_connections"] += int(new_connection)
+            t["bytes"] += nbytes
+            t["connect_seconds"] += connect
+            t["wait_seconds"] += wait
+            t["transfer_seconds"] += transfer
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            t = dict(self.totals)
+        n = t["requests"] or 1
+        return {
+            "requests": t["requests"],
+            "new_connections": t["new_connections"],
+            "connection_reuse_rate": round(1 - t["new_connections"] / n, 3) if t["requests"] else None,
+            "avg_connect_ms": round(1000 * t["connect_seconds"] / max(t["new_connections"], 1), 1),
+            "avg_wait_ms": round(1000 * t["wait_seconds"] / n, 1),
+            "avg_transfer_ms": round(1000 * t["transfer_seconds"] / n, 1),
+            "bytes": t["bytes"],
+        }
+
+
+HTTP_STATS = HttpStats()
+
+# Handshake time of connections opened by the current thread's in-flight request
+_connect_timing = threading.local()
+
+
+class _TimedConnect:
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _connect_timing.seconds = getattr(_connect_timing, "seconds", 0.0) + time.perf_counter() - started
 
 
-class ProcoreClient:
-    """Procore API client with auto-refresh."""
+class _TimedHTTPSConnection(_TimedConnect, urllib3.connection.HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnection(_TimedConnect, urllib3.connection.HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnectionPool(urllib3.connectionpool.HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPConnectionPool(urllib3.connectionpool.HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _PooledAdapter(HTTPAdapter):
+    """Keep-alive pool capped per host, with handshake timing on every new connection."""
+
+    def __init__(self):
+        super().__init__(pool_connections=4, pool_maxsize=MAX_CONNECTIONS_PER_HOST, pool_block=True)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            **self.poolmanager.pool_classes_by_scheme,
+            "https": _TimedHTTPSConnectionPool, "http": _TimedHTTPConnectionPool,
+        }
 
-    def __init__(self, company_id: int = 4281379):
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", _PooledAdapter())
+    session.mount("http://", _PooledAdapter())  # local simulator
+    session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+    return session
+
+
+# =============================================================================
+# CLIENTS
+# =============================================================================
+
+def _page_size(resp, requested: int) -> int:
+    """Procore may cap per_page below what was asked; Per-Page says what it used."""
+    value = resp.headers.get('Per-Page')
+    return int(value) if value and value.isdigit() and int(value) > 0 else requested
+
+
+def _page_count(resp, per_page: int):
+    total = resp.headers.get('Total')
+    return math.ceil(int(total) / per_page) if total and total.isdigit() else None
+
+
+class _ProcoreAuth:
+    """Credentials, token state and rate budget shared by both client flavours."""
+
+    def __init__(self, company_id: int, limiter: RateLimiter = None):
         self.company_id = company_id
         env = _load_env()
         self.client_id = env['PROCORE_CLIENT_ID']
         self.client_secret = env['PROCORE_CLIENT_SECRET']
+        self.limiter = limiter or RATE_LIMITER
         self.token = _load_token()
-        self._ensure_fresh_token()
 
-    def _ensure_fresh_token(self):
-        """Refresh token if expired or close to expiry."""
+    def _token_expiring(self) -> bool:
         saved_at = self.token.get('saved_at', 0)
         expires_in = self.token.get('expires_in', 5400)
-        if time.time() - saved_at > (expires_in - 300):  # refresh 5 min early
-            self._refresh_token()
-
-    def _refresh_token(self):
-        """Refresh the OAuth token."""
-        resp = requests.post(AUTH_URL, data={
+        return time.time() - saved_at > (expires_in - 300)  # refresh 5 min early
+
+    def _adopt_saved_token(self) -> bool:
+        """Pick up a token another process saved since ours; True if it needs no refresh."""
+        try:
+            saved = _load_token()
+        except (OSError, ValueError):
+            return False
+        if saved.get('access_token') == self.token.get('access_token'):
+            return False
+        self.token = saved  # carries the current refresh token even if expiring
+        return not self._token_expiring()
+
+    def _refresh_form(self) -> dict:
+        return {
             'grant_type': 'refresh_token',
             'refresh_token': self.token['refresh_token'],
             'client_id': self.client_id,
             'client_secret': self.client_secret,
-        })
-        resp.raise_for_status()
-        self.token = resp.json()
-        _save_token(self.token)
+        }
 
     def _headers(self):
         return {
@@ -83,25 +310,97 @@ class ProcoreClient:
             'Procore-Company-Id': str(self.company_id),
         }
 
+
+class ProcoreClient(_ProcoreAuth):
+    """Procore API client with auto-refresh. Safe to share across threads."""
+
+    def __init__(self, company_id: int = 4281379, limiter: RateLimiter = None):
+        super().__init__(company_id, limiter)
+        self.session = _new_session()
+        self._token_lock = threading.Lock()
+        self._pages = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY, thread_name_prefix="procore-page")
+        self._ensure_fresh_token()
+
+    def close(self):
+        self._pages.shutdown(wait=False)
+        self.session.close()
+
+    def _ensure_fresh_token(self):
+        """Refresh token if expired or close to expiry."""
+        with self._token_lock:
+            if self._token_expiring():
+                self._refresh_token()
+
+    def _refresh_token(self):
+        """Refresh the OAuth token. Caller holds _token_lock.
+
+        Processes sharing CREDS_DIR (sharded sync workers) refresh one at a
+        time under a file lock, so a rotated refresh token is never spent twice.
+        """
+        with open(REFRESH_LOCK_PATH, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if self._adopt_saved_token():
+                return
+            resp = self.session.post(AUTH_URL, data=self._refresh_form(), timeout=REQUEST_TIMEOUT)
+            resp.raise_for_status()
+            self.token = resp.json()
+            _save_token(self.token)
+
+    def _refresh_after_401(self, rejected_token: str):
+        """Refresh once per rejected token — concurrent 401s share one refresh."""
+        with self._token_lock:
+            if self.token['access_token'] == rejected_token:
+                self._refresh_token()
+
+    def _timed_get(self, url: str, **kwargs) -> requests.Response:
+        _connect_timing.seconds = 0.0
+        started = time.perf_counter()
+        resp = self.session.get(url, timeout=REQUEST_TIMEOUT, **kwargs)
+        if not kwargs.get('stream'):
+            total = time.perf_counter() - started
+            connect = _connect_timing.seconds
+            headers_at = resp.elapsed.total_seconds()
+            HTTP_STATS.record(connect, max(headers_at - connect, 0.0), max(total - headers_at, 0.0),
+                              len(resp.content), connect > 0)
+        return resp
+
+    def _send(self, path: str, params: dict = None) -> requests.Response:
+        """One rate-limited GET; feeds the response's rate headers back to the limiter."""
+        self.limiter.acquire()
+        headers = self._headers()
+        resp = self._timed_get(f'{API_BASE}{path}', headers=headers, params=params)
+        self.limiter.observe(resp.headers)
+        if resp.status_code == 401:
+            self._refresh_after_401(headers['Authorization'].split(' ', 1)[1])
+            self.limiter.acquire()
+            resp = self._timed_get(f'{API_BASE}{path}', headers=self._headers(), params=params)
+            self.limiter.observe(resp.headers)
+        return resp
+
     def get(self, path: str, params: dict = None) -> requests.Response:
         """GET request with auto-refresh on 401 and retry with exponential backoff."""
         self._ensure_fresh_token()
 
         for attempt in range(MAX_RETRIES + 1):
-            resp = requests.get(f'{API_BASE}{path}', headers=self._headers(), params=params, timeout=30)
-            if resp.status_code == 401:
-                self._refresh_token()
-                resp = requests.get(f'{API_BASE}{path}', headers=self._headers(), params=params, timeout=30)
+            try:
+                resp = self._send(path, params)
+            except requests.ConnectionError as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                log.warning(f"Connection error on {path} ({e}), pausing all requests {CONNECTION_ERROR_PAUSE}s")
+                self.limiter.block(CONNECTION_ERROR_PAUSE)
+                continue
 
             if resp.status_code not in RETRYABLE_STATUS_CODES or attempt == MAX_RETRIES:
                 return resp
 
             wait = RETRY_BACKOFF_BASE * (2 ** attempt)
-            # Respect Retry-After header for 429s
+            # Respect Retry-After header for 429s, and hold every other caller too
             if resp.status_code == 429:
                 retry_after = resp.headers.get("Retry-After")
                 if retry_after:
                     wait = max(wait, float(retry_after))
+                self.limiter.block(wait)
             log.warning(f"Retryable {resp.status_code} on {path}, attempt {attempt + 1}/{MAX_RETRIES}, waiting {wait:.1f}s")
             time.sleep(wait)
 
@@ -113,32 +412,83 @@ class ProcoreClient:
         resp.raise_for_status()
         return resp.json()
 
+    def _get_page(self, path: str, params: dict, page: int, per_page: int) -> requests.Response:
+        resp = self.get(path, {**params, 'page': page, 'per_page': per_page})
+        resp.raise_for_status()
+        return resp
+
+    def iter_all(self, path: str, params: dict = None, per_page: int = 100, prefetch: int = MAX_CONCURRENCY):
+        """Yield every record of a paginated endpoint, in order, as pages arrive.
+
+        When page 1 carries Procore's Total (and Per-Page) headers, up to
+        `prefetch` later pages are in flight while the caller works through
+        the current one, so memory stays at roughly prefetch + 1 pages.
+        Otherwise pages are walked until a short one comes back.
+        """
+        params = dict(params or {})
+        first = self._get_page(path, params, 1, per_page)
+        data = first.json() or []
+        per_page = _page_size(first, per_page)
+        if len(data) < per_page:
+            yield from data
+            return
+
+        pages = _page_count(first, per_page)
+        if pages is None:
+            yield from data
+            page = 2
+            while True:
+                data = self._get_page(path, params, page, per_page).json()
+                if not data:
+                    return
+                yield from data
+                if len(data) < per_page:
+                    return
+                page += 1
+
+        remaining = iter(range(2, pages + 1))
+        window = deque(
+            self._pages.submit(self._get_page, path, params, page, per_page)
+            for _, page in zip(range(max(prefetch, 1)), remaining)
+        )
+        try:
+            yield from data
+            while window:
+                resp = window.popleft().result()
+                page = next(remaining, None)
+                if page is not None:
+                    window.append(self._pages.submit(self._get_page, path, params, page, per_page))
+                yield from resp.json() or []
+        finally:
+            # Consumer stopped early (or a page failed): don't fetch what nobody will read
+            for future in window:
+                future.cancel()
+
     def get_all(self, path: str, params: dict = None, per_page: int = 100) -> list:
-        """GET all pages of a paginated endpoint."""
-        params = params or {}
-        params['per_page'] = per_page
-        all_items = []
-        page = 1
-        while True:
-            params['page'] = page
-            data = self.get_json(path, params)
-            if not data:
-                break
-            all_items.extend(data)
-            if len(data) < per_page:
-                break
-            page += 1
-        return all_items
-
-    def download(self, url: str, dest: Path) -> Path:
-        """Download a file from a Procore URL."""
+        """GET all pages of a paginated endpoint. Prefer iter_all for large listings."""
+        return list(self.iter_all(path, params, per_page))
+
+    def download(self, url: str, dest: Path, resume: bool = False) -> Path:
+        """Stream a file from a Procore URL to dest.
+
+        With resume=True an existing partial dest is continued with a Range
+        request; servers that ignore the range send the whole file again.
+        """
         self._ensure_fresh_token()
-        resp = requests.get(url, headers=self._headers(), stream=True)
-        resp.raise_for_status()
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        with open(dest, 'wb') as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
+        offset = dest.stat().st_size if resume and dest.exists() else 0
+        headers = self._headers()
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+        self.limiter.acquire()
+        with self._timed_get(url, headers=headers, stream=True) as resp:
+            if offset and resp.status_code == 416:
+                return dest  # partial file was already complete
+            resp.raise_for_status()
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            append = offset and resp.status_code == 206
+            with open(dest, 'ab' if append else 'wb') as f:
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
         return dest
 
     # Convenience methods
@@ -162,3 +512,170 @@ class ProcoreClient:
 
     def list_documents(self, project_id: int) -> list:
         return self.get_json(f'/rest/v1.0/projects/{project_id}/documents')
+
+
+class AsyncProcoreClient(_ProcoreAuth):
+    """asyncio variant on a pooled httpx.AsyncClient; same token file and rate budget.
+
+    Usage:
+        async with AsyncProcoreClient(company_id) as client:
+            rfis = await client.get_all(f"/rest/v1.0/projects/{pid}/rfis")
+    """
+
+    def __init__(self, company_id: int = 4281379, limiter: RateLimiter = None):
+        import httpx
+
+        super().__init__(company_id, limiter)
+        self._httpx = httpx
+        self.http = httpx.AsyncClient(
+            base_url=API_BASE,
+            timeout=REQUEST_TIMEOUT,
+            headers={"Accept-Encoding": "gzip, deflate"},
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS_PER_HOST,
+                                max_keepalive_connections=MAX_CONNECTIONS_PER_HOST),
+        )
+        self._token_lock = asyncio.Lock()
+        self._pages = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def __aenter__(self):
+        await self._ensure_fresh_token()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.http.aclose()
+
+    async def _refresh_token(self):
+        """Refresh the OAuth token. Caller holds _token_lock.
+
+        Takes the same file lock as ProcoreClient._refresh_token (waiting on a
+        worker thread), so sync and async clients never spend one refresh token twice.
+        """
+        with open(REFRESH_LOCK_PATH, 'a') as lock:
+            await asyncio.to_thread(fcntl.flock, lock, fcntl.LOCK_EX)
+            if self._adopt_saved_token():
+                return
+            resp = await self.http.post(AUTH_URL, data=self._refresh_form())
+            resp.raise_for_status()
+            self.token = resp.json()
+            _save_token(self.token)
+
+    async def _ensure_fresh_token(self, rejected_token: str = None):
+        async with self._token_lock:
+            if self._token_expiring() or self.token['access_token'] == rejected_token:
+                await self._refresh_token()
+
+    async def _timed_get(self, url: str, **kwargs):
+        # httpcore reports connect/TLS/header/body phases through the trace extension
+        marks = {}
+
+        async def trace(event: str, info: dict):
+            marks[event] = time.perf_counter()
+
+        started = time.perf_counter()
+        resp = await self.http.get(url, extensions={"trace": trace}, **kwargs)
+        done = time.perf_counter()
+        connect_start = marks.get("connection.connect_tcp.started")
+        connect_end = marks.get("connection.start_tls.complete") or marks.get("connection.connect_tcp.complete")
+        connect = connect_end - connect_start if connect_start and connect_end else 0.0
+        headers_at = marks.get("http11.receive_response_headers.complete",
+                               marks.get("http2.receive_response_headers.complete", done))
+        HTTP_STATS.record(connect, max(headers_at - started - connect, 0.0), max(done - headers_at, 0.0),
+                          len(resp.content), connect_start is not None)
+        return resp
+
+    async def get(self, path: str, params: dict = None):
+        """GET with the same 401 refresh, retry and rate-limit behaviour as ProcoreClient.get."""
+        await self._ensure_fresh_token()
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                await asyncio.to_thread(self.limiter.acquire)
+                headers = self._headers()
+                resp = await self._timed_get(path, headers=headers, params=params)
+                self.limiter.observe(resp.headers)
+                if resp.status_code == 401:
+                    await self._ensure_fresh_token(rejected_token=headers['Authorization'].split(' ', 1)[1])
+                    await asyncio.to_thread(self.limiter.acquire)
+                    resp = await self._timed_get(path, headers=self._headers(), params=params)
+                    self.limiter.observe(resp.headers)
+            except self._httpx.TransportError as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                log.warning(f"Connection error on {path} ({e}), pausing all requests {CONNECTION_ERROR_PAUSE}s")
+                self.limiter.block(CONNECTION_ERROR_PAUSE)
+                continue
+
+            if resp.status_code not in RETRYABLE_STATUS_CODES or attempt == MAX_RETRIES:
+                return resp
+
+            wait = RETRY_BACKOFF_BASE * (2 ** attempt)
+            if resp.status_code == 429:
+                retry_after = resp.headers.get("Retry-After")
+                if retry_after:
+                    wait = max(wait, float(retry_after))
+                self.limiter.block(wait)
+            log.warning(f"Retryable {resp.status_code} on {path}, attempt {attempt + 1}/{MAX_RETRIES}, waiting {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+        return resp
+
+    async def get_json(self, path: str, params: dict = None) -> list | dict:
+        resp = await self.get(path, params)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def _get_page(self, path: str, params: dict, page: int, per_page: int):
+        async with self._pages:
+            resp = await self.get(path, {**params, 'page': page, 'per_page': per_page})
+        resp.raise_for_status()
+        return resp
+
+    async def iter_all(self, path: str, params: dict = None, per_page: int = 100, prefetch: int = MAX_CONCURRENCY):
+        """Async generator counterpart of ProcoreClient.iter_all."""
+        params = dict(params or {})
+        first = await self._get_page(path, params, 1, per_page)
+        data = first.json() or []
+        per_page = _page_size(first, per_page)
+        if len(data) < per_page:
+            for item in data:
+                yield item
+            return
+
+        pages = _page_count(first, per_page)
+        if pages is None:
+            for item in data:
+                yield item
+            page = 2
+            while True:
+                data = (await self._get_page(path, params, page, per_page)).json()
+                if not data:
+                    return
+                for item in data:
+                    yield item
+                if len(data) < per_page:
+                    return
+                page += 1
+
+        remaining = iter(range(2, pages + 1))
+        window = deque(
+            asyncio.ensure_future(self._get_page(path, params, page, per_page))
+            for _, page in zip(range(max(prefetch, 1)), remaining)
+        )
+        try:
+            for item in data:
+                yield item
+            while window:
+                resp = await window.popleft()
+                page = next(remaining, None)
+                if page is not None:
+                    window.append(asyncio.ensure_future(self._get_page(path, params, page, per_page)))
+                for item in resp.json() or []:
+                    yield item
+        finally:
+            for task in window:
+                task.cancel()
+
+    async def get_all(self, path: str, params: dict = None, per_page: int = 100) -> list:
+        return [item async for item in self.iter_all(path, params, per_page)]
@@ -0,0 +1,172 @@
+"""EVA-00 Query Cache — In-process result cache for the /query endpoint.
+
+Agents repeat the same lookups constantly (list_projects, project_stats, the
+same search keywords within a session). Results are cached per normalized
+request with a per-action TTL, and the whole cache is dropped whenever a
+sync agent pass or webhook batch writes rows (NOTIFY on EVA00_SYNC_CHANNEL),
+so TTLs only bound staleness if the notification is missed.
+"""
+
+import logging
+import os
+import select
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import psycopg2
+import psycopg2.extensions
+
+log = logging.getLogger("eva00.cache")
+
+QUERY_CACHE_ENABLED = os.environ.get("EVA00_QUERY_CACHE_ENABLED", "true").lower() == "true"
+QUERY_CACHE_MAX_ENTRIES = int(os.environ.get("EVA00_QUERY_CACHE_MAX", "2000"))
+SYNC_CHANNEL = os.environ.get("EVA00_SYNC_CHANNEL", "eva00_sync")
+
+# Seconds; actions not listed are never cached
+ACTION_TTLS = {
+    "list_projects": 300,
+    "get_project": 300,
+    "project_stats": 60,
+    "database_stats": 60,
+    "search_submittals": 30,
+    "search_rfis": 30,
+    "search_drawings": 30,
+    "search_companies": 120,
+    "search_daily_reports": 30,
+    "search_all": 30,
+    "submittal_history": 60,
+    "similar_submittals": 120,
+    "rfi_detail": 60,
+    "similar_rfis": 120,
+    "company_history": 120,
+}
+
+
+def normalize_key(fields: Dict[str, Any]) -> Tuple:
+    """Stable key for a request: drop unset fields, case/whitespace-fold text.
+
+    Every text filter EVA-00 applies is case-insensitive, so "HVAC " and
+    "hvac" are the same query.
+    """
+    items = []
+    for name, value in sorted(fields.items()):
+        if value is None:
+            continue
+        if isinstance(value, str) and name != "action":
+            value = " ".join(value.lower().split())
+        elif isinstance(value, list):
+            value = tuple(value)
+        items.append((name, value))
+    return tuple(items)
+
+
+class QueryCache:
+    """LRU + TTL cache, invalidated as a whole by sync notifications."""
+
+    _lock = threading.Lock()
+    _entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+    _stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "invalidations": 0}
+    _last_invalidated: Optional[float] = None
+    _listener: Optional[threading.Thread] = None
+
+    @classmethod
+    def get(cls, action: str, key: Tuple) -> Optional[Any]:
+        if not QUERY_CACHE_ENABLED or action not in ACTION_TTLS:
+            return None
+        now = time.monotonic()
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del cls._entries[key]
+                cls._stats["misses"] += 1
+                return None
+            cls._entries.move_to_end(key)
+            cls._stats["hits"] += 1
+            return entry[1]
+
+    @classmethod
+    def put(cls, action: str, key: Tuple, value: Any):
+        ttl = ACTION_TTLS.get(action)
+        if not QUERY_CACHE_ENABLED or not ttl:
+            return
+        with cls._lock:
+            cls._entries[key] = (time.monotonic() + ttl, value)
+            cls._entries.move_to_end(key)
+            cls._stats["stores"] += 1
+            while len(cls._entries) > QUERY_CACHE_MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+                cls._stats["evictions"] += 1
+
+    @classmethod
+    def invalidate(cls, reason: str = "manual"):
+        with cls._lock:
+            cls._entries.clear()
+            cls._stats["invalidations"] += 1
+            cls._last_invalidated = time.time()
+        log.info(f"Query cache invalidated ({reason})")
+
+    @classmethod
+    def stats(cls) -> Dict:
+        with cls._lock:
+            lookups = cls._stats["hits"] + cls._stats["misses"]
+            return {
+                "enabled": QUERY_CACHE_ENABLED,
+                "entries": len(cls._entries),
+                "max_entries": QUERY_CACHE_MAX_ENTRIES,
+                "hit_rate": round(cls._stats["hits"] / lookups, 4) if lookups else 0.0,
+                "listening": bool(cls._listener and cls._listener.is_alive()),
+                "last_invalidated": cls._last_invalidated,
+                **cls._stats,
+            }
+
+    # -------------------------------------------------------------------------
+    # Sync-driven invalidation
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def start_listener(cls, dsn: Dict[str, str]):
+        """LISTEN for sync notifications on a daemon thread (idempotent)."""
+        if not QUERY_CACHE_ENABLED:
+            return
+        with cls._lock:
+            if cls._listener and cls._listener.is_alive():
+                return
+            cls._listener = threading.Thread(
+                target=cls._listen_forever, args=(dsn,), name="eva00-cache-listener", daemon=True
+            )
+            cls._listener.start()
+
+    @classmethod
+    def _listen_forever(cls, dsn: Dict[str, str]):
+        backoff = 1.0
+        while True:
+            conn = None
+            try:
+                conn = psycopg2.connect(**dsn)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {SYNC_CHANNEL}")
+                # Anything may have synced while we weren't listening
+                cls.invalidate("listener connected")
+                backoff = 1.0
+                while True:
+                    if select.select([conn], [], [], 5.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    if conn.notifies:
+                        entities = sorted({n.payload for n in conn.notifies})
+                        conn.notifies.clear()
+                        cls.invalidate(f"sync: {', '.join(entities)}")
+            except Exception as e:
+                log.warning(f"Cache listener error, retrying in {backoff:.0f}s: {e}")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60.0)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
@@ -1,7 +1,14 @@
 #!/usr/bin/env python3
 """EVA-00 Procore Sync Agent — Continuously polls Procore and syncs to local PostgreSQL.
 
-Usage: python sync_agent.py [--once]  (--once = single sync pass then exit)
+With SYNC_WEBHOOKS_ENABLED=true it also receives Procore webhooks (webhooks.py)
+and syncs each touched record as it changes; polling then only reconciles.
+
+Usage: python sync_agent.py [--once] [--full] [--sharded | --workers N]
+    --once    = single sync pass then exit
+    --full    = full listings with delete reconciliation instead of updated_at deltas
+    --sharded = sync only the company/project shards this process leases (run several)
+    --workers = start N --sharded worker processes and supervise them
 """
 
 import os
@@ -10,9 +17,16 @@ import json
 import time
 import signal
 import hashlib
+import itertools
 import logging
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+import socket
+import subprocess
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 
 import psycopg2
 import psycopg2.extras
@@ -20,7 +34,9 @@ import psycopg2.pool
 
 # Add our directory to path for procore_client import
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from procore_client import ProcoreClient
+from procore_client import HTTP_STATS, ProcoreClient
+import embeddings
+import webhooks
 
 # =============================================================================
 # Configuration
@@ -34,7 +50,47 @@ DB_PORT = os.environ.get("EVA00_DB_PORT", "5432")
 COMPANY_ID = int(os.environ.get("PROCORE_COMPANY_ID", "4281379"))
 PROJECT_IDS = [int(x) for x in os.environ.get("PROCORE_PROJECT_IDS", "316469").split(",")]
 
-API_DELAY = float(os.environ.get("SYNC_API_DELAY", "0.6"))  # seconds between API calls
+# Concurrent Procore listings; the request rate itself is paced by procore_client.RateLimiter
+FETCH_WORKERS = int(os.environ.get("SYNC_FETCH_WORKERS", "8"))
+CRAWL_WORKERS = int(os.environ.get("SYNC_CRAWL_WORKERS", "6"))  # concurrent document folder listings
+SYNC_BATCH_SIZE = int(os.environ.get("SYNC_BATCH_SIZE", "500"))  # rows per upsert/commit
+# Delta passes fetch only records updated since the cursor; a full listing
+# runs this often to pick up deletes (Procore's updated_at filter can't show them)
+FULL_RECONCILE_SECONDS = int(os.environ.get("SYNC_FULL_RECONCILE_SECONDS", "86400"))
+DELTA_OVERLAP_SECONDS = int(os.environ.get("SYNC_DELTA_OVERLAP_SECONDS", "300"))  # clock skew margin
+EMBED_ON_SYNC = os.environ.get("EVA00_EMBED_ON_SYNC", "true").lower() == "true"
+# NOTIFY channel eva00_tool.py listens on to drop its query cache
+SYNC_CHANNEL = os.environ.get("EVA00_SYNC_CHANNEL", "eva00_sync")
+# sync_log keeps per-row history for SYNC_LOG_RETENTION_DAYS (daily partitions);
+# with SYNC_LOG_UPDATES=false only creates/deletes get rows, updates are only
+# counted in the per-pass sync_passes summary
+SYNC_LOG_RETENTION_DAYS = int(os.environ.get("SYNC_LOG_RETENTION_DAYS", "90"))
+SYNC_LOG_UPDATES = os.environ.get("SYNC_LOG_UPDATES", "true").lower() == "true"
+SYNC_LOG_PARTITIONS_AHEAD = 3  # days
+SYNC_LOG_MAINTENANCE_SECONDS = 3600
+SYNC_LOG_DELETE_BATCH = 10000  # rows per commit when trimming an unpartitioned sync_log
+
+# Change feed (sync_changes + NOTIFY with the project UUID) for nerv-interface's
+# targeted signal sweeps; only entity types its detectors read are published
+CHANGE_CHANNEL = os.environ.get("EVA00_CHANGE_CHANNEL", "eva00_changes")
+CHANGE_FEED_ENTITIES = frozenset({"rfi", "submittal"})
+# Unconsumed changes older than this are trimmed (sweeper disabled or down);
+# the synthesis cycle's full sweep covers whatever they would have triggered
+SYNC_CHANGES_RETENTION_HOURS = int(os.environ.get("SYNC_CHANGES_RETENTION_HOURS", "24"))
+
+# With webhooks on, entities they cover are only polled this often (reconciliation)
+WEBHOOK_RECONCILE_SECONDS = int(os.environ.get("SYNC_WEBHOOK_RECONCILE_SECONDS", "3600"))
+WEBHOOK_BATCH_SIZE = 100
+# nerv-interface's SignalGenerationService is told about every webhook-driven change
+SIGNALS_ON_WEBHOOK = os.environ.get("SYNC_WEBHOOK_SIGNALS", "true").lower() == "true"
+NERV_INTERFACE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "nerv-interface")
+
+# Sharded mode (--sharded / --workers N): processes lease company and project
+# shards from sync_shards instead of syncing the whole PROJECT_IDS list
+SHARDED = os.environ.get("SYNC_SHARDED", "false").lower() == "true"
+SHARD_LEASE_SECONDS = int(os.environ.get("SYNC_SHARD_LEASE_SECONDS", "120"))
+SHARD_HEARTBEAT_SECONDS = max(5, SHARD_LEASE_SECONDS // 4)
+SHARD_COORDINATOR_LOCK = 0x45564130  # pg advisory lock key held by the coordinating worker
 
 # Poll intervals in seconds
 INTERVALS = {
@@ -64,6 +120,9 @@ log = logging.getLogger("sync_agent")
 
 shutdown_requested = False
 
+# Shard the current pass belongs to; qualifies sync_cursors keys (see _cursor_key)
+CURSOR_SCOPE = ""
+
 
 def handle_signal(signum, frame):
     global shutdown_requested
@@ -86,8 +145,10 @@ _pool = None
 def _get_pool():
     global _pool
     if _pool is None:
+        # One connection per concurrently running entity pass, plus the main loop's,
+        # the webhook worker's, the webhook receiver's and (sharded) the shard keeper's
         _pool = psycopg2.pool.ThreadedConnectionPool(
-            1, 5,
+            1, 12,
             dbname=DB_NAME, user=DB_USER, host=DB_HOST, port=DB_PORT,
         )
     return _pool
@@ -110,22 +171,217 @@ def payload_hash(data: dict) -> str:
     return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()[:16]
 
 
+def _cursor_key(entity_type: str) -> str:
+    """sync_cursors key: the entity type, qualified by the shard in sharded mode."""
+    return f"{entity_type}@{CURSOR_SCOPE}" if CURSOR_SCOPE else entity_type
+
+
 def get_cursor(conn, entity_type: str) -> Optional[datetime]:
     """Get last sync time for an entity type."""
     with conn.cursor() as cur:
-        cur.execute("SELECT last_synced_at FROM sync_cursors WHERE entity_type = %s", (entity_type,))
+        cur.execute("SELECT last_synced_at FROM sync_cursors WHERE entity_type = %s", (_cursor_key(entity_type),))
+        row = cur.fetchone()
+        return row[0] if row else None
+
+
+def get_full_sync_at(conn, entity_type: str) -> Optional[datetime]:
+    """Get the time of the last full (reconciling) pass for an entity type."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT last_full_sync_at FROM sync_cursors WHERE entity_type = %s", (_cursor_key(entity_type),))
+        row = cur.fetchone()
+        return row[0] if row else None
+
+
+def set_cursor(conn, entity_type: str, ts: datetime, full: bool = False, changed: bool = False):
+    """Update sync cursor; if the pass wrote rows, tell query caches the entity type changed.
+
+    `full` also records `ts` as the last full reconciliation.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""
+            INSERT INTO sync_cursors (entity_type, last_synced_at, last_full_sync_at, updated_at)
+            VALUES (%s, %s, CASE WHEN %s THEN %s::timestamptz END, NOW())
+            ON CONFLICT (entity_type) DO UPDATE SET
+                last_synced_at = EXCLUDED.last_synced_at,
+                last_full_sync_at = COALESCE(EXCLUDED.last_full_sync_at, sync_cursors.last_full_sync_at),
+                updated_at = NOW()
+        """, (_cursor_key(entity_type), ts, full, ts))
+        if changed:
+            cur.execute("SELECT pg_notify(%s, %s)", (SYNC_CHANNEL, entity_type))
+    conn.commit()
+
+
+def get_cursor_token(conn, entity_type: str) -> Optional[str]:
+    with conn.cursor() as cur:
+        cur.execute("SELECT cursor_token FROM sync_cursors WHERE entity_type = %s", (_cursor_key(entity_type),))
         row = cur.fetchone()
         return row[0] if row else None
 
 
-def set_cursor(conn, entity_type: str, ts: datetime):
-    """Update sync cursor."""
+def set_cursor_token(conn, entity_type: str, token: Optional[str]):
+    """Persist (or clear) resumable in-progress state for an entity type."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            INSERT INTO sync_cursors (entity_type, last_synced_at, cursor_token, updated_at)
+            VALUES (%s, NOW(), %s, NOW())
+            ON CONFLICT (entity_type) DO UPDATE SET cursor_token = EXCLUDED.cursor_token, updated_at = NOW()
+        """, (_cursor_key(entity_type), token))
+    conn.commit()
+
+
+def _procore_ts(ts: datetime) -> str:
+    return ts.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def plan_fetch(conn, entity_type: str, force_full: bool = False) -> Tuple[Dict, bool, datetime]:
+    """Decide between a delta and a full listing for this pass.
+
+    Returns (extra list params, full, started). Delta passes filter on
+    updated_at from the previous pass's start minus an overlap; the caller
+    stores `started` as the new cursor once every project has been fetched.
+    """
+    started = datetime.now(timezone.utc)
+    last = get_cursor(conn, entity_type)
+    last_full = get_full_sync_at(conn, entity_type)
+    if (force_full or last is None or last_full is None
+            or (started - last_full).total_seconds() >= FULL_RECONCILE_SECONDS):
+        return {}, True, started
+    since = last - timedelta(seconds=DELTA_OVERLAP_SECONDS)
+    until = started + timedelta(seconds=DELTA_OVERLAP_SECONDS)
+    return {"filters[updated_at]": f"{_procore_ts(since)}...{_procore_ts(until)}"}, False, started
+
+
+def finish_fetch(conn, entity_type: str, started: datetime, full: bool, failed: bool, changed: bool):
+    """Advance the cursor; after a failed fetch keep it so the missed window is retried."""
+    if failed:
+        set_cursor(conn, entity_type, get_cursor(conn, entity_type) or started, changed=changed)
+    else:
+        set_cursor(conn, entity_type, started, full=full, changed=changed)
+
+
+def maintain_sync_log(conn) -> Tuple[int, int]:
+    """Create the next days' sync_log partitions and drop those past retention.
+
+    Returns (created, dropped). Also trims sync_passes, anything that fell
+    into the default partition, and unconsumed sync_changes past
+    SYNC_CHANGES_RETENTION_HOURS. A sync_log created before partitioning
+    (see SCHEMA-UPGRADES.sql) is trimmed with batched DELETEs instead.
+    """
+    today = datetime.now(timezone.utc).date()
+    cutoff = today - timedelta(days=SYNC_LOG_RETENTION_DAYS)
+    cutoff_at = datetime(cutoff.year, cutoff.month, cutoff.day, tzinfo=timezone.utc)
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM sync_changes WHERE created_at < NOW() - make_interval(hours => %s)",
+                    (SYNC_CHANGES_RETENTION_HOURS,))
+        if cur.rowcount:
+            log.warning(f"Trimmed {cur.rowcount} unconsumed sync_changes older than "
+                        f"{SYNC_CHANGES_RETENTION_HOURS}h (is nerv-interface's change feed sweeper running?)")
+    conn.commit()
+    with conn.cursor() as cur:
+        cur.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('sync_log')")
+        row = cur.fetchone()
+        if not row or row[0] != "p":
+            conn.commit()
+            if row:
+                trimmed = _trim_unpartitioned_sync_log(conn, cutoff_at)
+                log.warning(f"sync_log is not partitioned (apply SCHEMA-UPGRADES.sql); "
+                            f"deleted {trimmed} row(s) past retention instead")
+            return 0, 0
+        cur.execute("""
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'sync_log'::regclass
+        """)
+        existing = {row[0] for row in cur.fetchall()}
+    conn.commit()
+
+    created = dropped = 0
+    for offset in range(SYNC_LOG_PARTITIONS_AHEAD + 1):
+        day = today + timedelta(days=offset)
+        name = f"sync_log_{day:%Y%m%d}"
+        if name in existing:
+            continue
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {name} PARTITION OF sync_log
+                    FOR VALUES FROM (%s) TO (%s)
+                """, (f"{day} 00:00:00+00", f"{day + timedelta(days=1)} 00:00:00+00"))
+            conn.commit()
+            created += 1
+        except Exception as e:
+            # e.g. that day's rows already landed in sync_log_default
+            conn.rollback()
+            log.warning(f"Could not create {name}: {e}")
+
+    for name in sorted(existing):
+        try:
+            day = datetime.strptime(name, "sync_log_%Y%m%d").date()
+        except ValueError:
+            continue  # sync_log_default
+        if day < cutoff:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE {name}")
+            conn.commit()
+            dropped += 1
+
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM sync_log_default WHERE created_at < %s", (cutoff_at,))
+        cur.execute("DELETE FROM sync_passes WHERE started_at < %s", (cutoff_at,))
+    conn.commit()
+    if created or dropped:
+        log.info(f"sync_log partitions: {created} created, {dropped} dropped (retention {SYNC_LOG_RETENTION_DAYS}d)")
+    return created, dropped
+
+
+def _trim_unpartitioned_sync_log(conn, cutoff_at: datetime) -> int:
+    """Retention for a pre-partitioning sync_log: delete old rows a batch per commit."""
+    trimmed = 0
+    while not shutdown_requested:
+        with conn.cursor() as cur:
+            cur.execute("""
+                DELETE FROM sync_log WHERE id IN (
+                    SELECT id FROM sync_log WHERE created_at < %s LIMIT %s
+                )
+            """, (cutoff_at, SYNC_LOG_DELETE_BATCH))
+            deleted = cur.rowcount
+        conn.commit()
+        trimmed += deleted
+        if deleted < SYNC_LOG_DELETE_BATCH:
+            break
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM sync_passes WHERE started_at < %s", (cutoff_at,))
+    conn.commit()
+    return trimmed
+
+
+_sync_log_maintained_at = 0.0
+
+
+def maybe_maintain_sync_log(conn):
+    """maintain_sync_log at most every SYNC_LOG_MAINTENANCE_SECONDS; never fails the caller."""
+    global _sync_log_maintained_at
+    if time.time() - _sync_log_maintained_at < SYNC_LOG_MAINTENANCE_SECONDS:
+        return
+    _sync_log_maintained_at = time.time()
+    try:
+        maintain_sync_log(conn)
+    except Exception as e:
+        conn.rollback()
+        log.warning(f"sync_log maintenance failed: {e}")
+
+
+def record_sync_pass(conn, started: datetime, full: bool, entity_counts: Dict[str, Dict[str, int]],
+                     totals: Dict[str, int]):
+    """Write the pass's one-row summary to sync_passes."""
     with conn.cursor() as cur:
         cur.execute("""
-            INSERT INTO sync_cursors (entity_type, last_synced_at, updated_at)
-            VALUES (%s, %s, NOW())
-            ON CONFLICT (entity_type) DO UPDATE SET last_synced_at = %s, updated_at = NOW()
-        """, (entity_type, ts, ts))
+            INSERT INTO sync_passes (scope, full_listing, started_at, created, updated,
+                                     unchanged, deleted, errors, entities)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, (CURSOR_SCOPE or None, full, started, totals["created"], totals["updated"],
+              totals["unchanged"], totals["deleted"], totals["errors"],
+              psycopg2.extras.Json(entity_counts)))
     conn.commit()
 
 
@@ -159,6 +415,230 @@ def get_project_uuid(conn, procore_project_id: int) -> Optional[str]:
     return find_by_procore_id(conn, "projects", procore_project_id)
 
 
+def local_projects(conn, entity: str) -> Dict[int, str]:
+    """Tracked Procore project ID → local UUID, skipping projects not synced yet."""
+    projects = {}
+    for proj_id in PROJECT_IDS:
+        project_uuid = get_project_uuid(conn, proj_id)
+        if project_uuid:
+            projects[proj_id] = project_uuid
+        else:
+            log.warning(f"No local project for Procore ID {proj_id}, skipping {entity}")
+    return projects
+
+
+_fetch_pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="sync-fetch")
+
+
+def fetch_per_project(fetch, project_ids: List[int]):
+    """Run `fetch(proj_id)` for every project on the fetch pool.
+
+    Yields (proj_id, result, error) in project order as each completes, so the
+    caller writes project 1 while later projects are still downloading.
+    """
+    futures = [(proj_id, _fetch_pool.submit(fetch, proj_id)) for proj_id in project_ids]
+    for proj_id, future in futures:
+        try:
+            yield proj_id, future.result(), None
+        except Exception as e:
+            yield proj_id, None, e
+
+
+def load_id_map(conn, table: str) -> Dict[int, str]:
+    """procore_id → local UUID for a whole table, for FK resolution in bulk."""
+    if table not in ALLOWED_TABLES:
+        raise ValueError(f"Invalid table name: {table}")
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT procore_id, id FROM {table} WHERE procore_id IS NOT NULL")
+        return {row[0]: str(row[1]) for row in cur.fetchall()}
+
+
+def load_hash_map(conn, table: str) -> Dict[int, str]:
+    """procore_id → stored sync_hash, loaded once per pass to skip unchanged rows."""
+    if table not in ALLOWED_TABLES:
+        raise ValueError(f"Invalid table name: {table}")
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT procore_id, sync_hash FROM {table} WHERE procore_id IS NOT NULL")
+        return {row[0]: row[1] for row in cur.fetchall()}
+
+
+# Bookkeeping columns that must not affect the row hash
+VOLATILE_COLUMNS = frozenset({"last_synced_at", "sync_hash", "is_deleted"})
+
+
+def row_hash(row: Dict) -> str:
+    """Hash of the mapped column values, so resolved FKs and mapping changes count too."""
+    return payload_hash({k: v for k, v in row.items() if k not in VOLATILE_COLUMNS})
+
+
+# Tables whose procore_id is a plain UNIQUE column; the rest use a partial
+# unique index (procore_id IS NOT NULL), which ON CONFLICT must name
+PROCORE_ID_UNIQUE = frozenset({"projects", "companies", "contacts"})
+PROCORE_ID_PARTIAL_UNIQUE = ("drawings", "submittals", "rfis", "documents")
+
+
+# Columns newer than the first DATABASE-SCHEMA.sql; SCHEMA-UPGRADES.sql adds them
+REQUIRED_COLUMNS = {
+    **{
+        table: ("sync_hash",)
+        for table in ("projects", "companies", "contacts", "drawings", "submittals", "rfis", "documents")
+    },
+    "sync_cursors": ("last_full_sync_at",),
+}
+# Tables newer than the first DATABASE-SCHEMA.sql; the sharded ones only matter in sharded mode
+REQUIRED_TABLES = ("sync_changes",)
+SHARDED_TABLES = ("sync_shards", "sync_workers")
+
+
+def check_schema(conn, sharded: bool = False):
+    """Refuse to start against a schema bulk_upsert can't write to.
+
+    Databases created before the procore_id indexes became UNIQUE make every
+    ON CONFLICT fail, and ones without the newer columns or tables fail on
+    the first statement that names them; SCHEMA-UPGRADES.sql brings them up
+    to date.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT DISTINCT t.relname
+            FROM pg_index i
+            JOIN pg_class t ON t.oid = i.indrelid
+            JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = i.indkey[0]
+            WHERE t.relname = ANY(%s) AND t.relnamespace = 'public'::regnamespace
+              AND i.indisunique AND i.indisvalid AND i.indnatts = 1
+              AND a.attname = 'procore_id'
+        """, (list(PROCORE_ID_PARTIAL_UNIQUE),))
+        found = {row[0] for row in cur.fetchall()}
+        cur.execute("""
+            SELECT table_name, column_name FROM information_schema.columns
+            WHERE table_schema = 'public' AND table_name = ANY(%s)
+        """, (list(REQUIRED_COLUMNS),))
+        columns = {(row[0], row[1]) for row in cur.fetchall()}
+        tables = list(REQUIRED_TABLES) + (list(SHARDED_TABLES) if sharded else [])
+        cur.execute("SELECT t FROM unnest(%s::text[]) AS t WHERE to_regclass('public.' || t) IS NULL", (tables,))
+        missing_tables = [row[0] for row in cur.fetchall()]
+    conn.commit()
+
+    problems = []
+    missing = [t for t in PROCORE_ID_PARTIAL_UNIQUE if t not in found]
+    if missing:
+        problems.append(f"no unique procore_id index on {', '.join(missing)}")
+    missing = [f"{t}.{c}" for t, cols in REQUIRED_COLUMNS.items() for c in cols if (t, c) not in columns]
+    if missing:
+        problems.append(f"missing columns {', '.join(missing)}")
+    if missing_tables:
+        problems.append(f"missing tables {', '.join(missing_tables)}")
+    if problems:
+        msg = (f"Schema is out of date ({'; '.join(problems)}): apply "
+               f"eva-00-design/SCHEMA-UPGRADES.sql (psql -f) before starting the sync agent")
+        log.critical(msg)
+        raise SystemExit(msg)
+
+
+def bulk_upsert(conn, table: str, rows: List[Dict], immutable=(), keep_existing=()) -> List[tuple]:
+    """INSERT ... ON CONFLICT (procore_id) DO UPDATE for one batch, no commit.
+
+    Rows must share the same keys. `immutable` columns are only set on insert;
+    `keep_existing` columns keep their stored value when the new one is NULL.
+    Returns [(id, procore_id, created)] — duplicate procore_ids in the batch
+    collapse to the last occurrence.
+    """
+    if table not in ALLOWED_TABLES:
+        raise ValueError(f"Invalid table name: {table}")
+    if not rows:
+        return []
+    rows = list({row["procore_id"]: row for row in rows}.values())
+    cols = list(rows[0].keys())
+
+    updates = []
+    for col in cols:
+        if col == "procore_id" or col in immutable:
+            continue
+        if col in keep_existing:
+            updates.append(f"{col} = COALESCE(EXCLUDED.{col}, {table}.{col})")
+        else:
+            updates.append(f"{col} = EXCLUDED.{col}")
+    conflict = "(procore_id)" if table in PROCORE_ID_UNIQUE else "(procore_id) WHERE procore_id IS NOT NULL"
+
+    with conn.cursor() as cur:
+        result = psycopg2.extras.execute_values(cur, f"""
+            INSERT INTO {table} ({", ".join(cols)}) VALUES %s
+            ON CONFLICT {conflict} DO UPDATE SET {", ".join(updates)}
+            RETURNING id, procore_id, (xmax = 0) AS created
+        """, [tuple(row[c] for c in cols) for row in rows], page_size=len(rows), fetch=True)
+    return [(str(r[0]), r[1], r[2]) for r in result]
+
+
+def mark_missing_deleted(conn, table: str, entity: str, project_uuid: str, seen: set) -> int:
+    """Soft-delete a project's rows that a full Procore listing no longer returns.
+
+    Clears sync_hash so a record that reappears is written (and undeleted) again.
+    """
+    if table not in ALLOWED_TABLES:
+        raise ValueError(f"Invalid table name: {table}")
+    if not seen:
+        # An empty listing is far more likely an API hiccup than a wiped project
+        return 0
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f"""
+                UPDATE {table} SET is_deleted = TRUE, sync_hash = NULL
+                WHERE project_id = %s AND procore_id IS NOT NULL AND is_deleted = FALSE
+                  AND NOT (procore_id = ANY(%s))
+                RETURNING id, procore_id
+            """, (project_uuid, list(seen)))
+            deleted = cur.fetchall()
+        bulk_log_sync(conn, [(entity, str(r[0]), r[1], "delete", None) for r in deleted])
+        publish_changes(conn, entity, [(project_uuid, str(r[0]), "delete") for r in deleted])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    if deleted:
+        log.info(f"Marked {len(deleted)} {table} deleted (no longer in Procore)")
+    return len(deleted)
+
+
+def bulk_log_sync(conn, entries: List[tuple]):
+    """Write many sync_log rows at once: (entity_type, entity_id, procore_id, action, payload_hash)."""
+    if not entries:
+        return
+    with conn.cursor() as cur:
+        psycopg2.extras.execute_values(cur, """
+            INSERT INTO sync_log (entity_type, entity_id, procore_id, action,
+                                  sync_direction, status, payload_hash, created_at)
+            VALUES %s
+        """, entries, template="(%s, %s, %s, %s, 'procore_to_local', 'success', %s, NOW())",
+            page_size=len(entries))
+
+
+def publish_changes(conn, entity: str, changes: List[tuple]):
+    """Append (project_id, entity_id, action) rows to the sync_changes feed, no commit.
+
+    The NOTIFY rides the caller's transaction, so listeners are woken only
+    once the rows (and the entity writes) are committed.
+    """
+    if entity not in CHANGE_FEED_ENTITIES or not changes:
+        return
+    with conn.cursor() as cur:
+        psycopg2.extras.execute_values(cur, """
+            INSERT INTO sync_changes (entity_type, project_id, entity_id, action) VALUES %s
+        """, [(entity,) + change for change in changes], page_size=len(changes))
+        for project_id in sorted({str(change[0]) for change in changes}):
+            cur.execute("SELECT pg_notify(%s, %s)", (CHANGE_CHANNEL, project_id))
+
+
+def refresh_embeddings(conn, source_type: str):
+    """Embed rows created/changed by this pass. Never fails the sync."""
+    if not EMBED_ON_SYNC:
+        return
+    try:
+        embeddings.embed_pending(conn, source_type)
+    except Exception as e:
+        conn.rollback()
+        log.warning(f"Embedding refresh failed for {source_type}: {e}")
+
+
 # =============================================================================
 # Status mapping helpers
 # =============================================================================
@@ -196,549 +676,883 @@ def safe_date(val) -> Optional[str]:
 # =============================================================================
 # Sync functions per entity type
 # =============================================================================
+# Each pass maps a Procore page to row dicts, then bulk-upserts it: foreign
+# keys come from procore_id→uuid maps loaded once per pass, rows are written
+# with one INSERT ... ON CONFLICT per batch, sync_log in one insert, one commit.
+
+def _project_address(p: dict) -> Optional[str]:
+    if p.get("address") or p.get("city"):
+        return json.dumps({
+            "street": p.get("address", ""),
+            "city": p.get("city", ""),
+            "state": p.get("state_code", ""),
+            "zip": p.get("zip", ""),
+        })
+    return None
+
+
+def _new_counts() -> Dict[str, int]:
+    return {"created": 0, "updated": 0, "unchanged": 0, "deleted": 0, "errors": 0}
+
+
+def _changed(counts: Dict[str, int]) -> bool:
+    """True if a pass wrote anything query caches could have served stale."""
+    return bool(counts["created"] or counts["updated"] or counts["deleted"])
+
+
+def _add_counts(totals: Dict[str, int], counts: Dict[str, int]):
+    for k in totals:
+        totals[k] += counts[k]
+
+
+def _fmt_counts(counts: Dict[str, int]) -> str:
+    text = f"{counts['created']} created, {counts['updated']} updated, {counts['unchanged']} unchanged"
+    if counts["deleted"]:
+        text += f", {counts['deleted']} deleted"
+    if counts["errors"]:
+        text += f", {counts['errors']} failed"
+    return text
+
+
+def _batches(records: Iterable[dict]) -> Iterator[List[dict]]:
+    """SYNC_BATCH_SIZE chunks of a list or a streaming iter_all generator."""
+    records = iter(records)
+    while True:
+        batch = list(itertools.islice(records, SYNC_BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
+
+
+def _sync_rows(conn, table: str, entity: str, records: Iterable[dict], to_row, known: Dict[int, str],
+               immutable=(), keep_existing=(), log_updates: bool = True, seen: set = None) -> Dict[str, int]:
+    """Map and bulk-upsert `records` in SYNC_BATCH_SIZE batches.
+
+    `records` may be a streaming iterator; each batch is committed before the
+    next is pulled. `to_row(record)` returns the column dict, or None to skip
+    the record. `known` is the table's procore_id → sync_hash map (see
+    load_hash_map); rows whose hash matches are not written at all, and the
+    map is updated with what was written. Every procore_id read is added to
+    `seen` if given. Returns created/updated/unchanged counts.
+    """
+    counts = _new_counts()
+    for batch in _batches(records):
+        rows, hashes = [], {}
+        for record in batch:
+            row = to_row(record)
+            if row is None:
+                continue
+            if seen is not None:
+                seen.add(row["procore_id"])
+            row["sync_hash"] = row_hash(row)
+            if known.get(row["procore_id"]) == row["sync_hash"]:
+                counts["unchanged"] += 1
+                continue
+            rows.append(row)
+            hashes[row["procore_id"]] = payload_hash(record)
+        if not rows:
+            continue
+
+        try:
+            written = bulk_upsert(conn, table, rows, immutable=immutable, keep_existing=keep_existing)
+            entries, changes = [], []
+            row_projects = {row["procore_id"]: row.get("project_id") for row in rows}
+            for entity_id, procore_id, created in written:
+                counts["created" if created else "updated"] += 1
+                if created or (log_updates and SYNC_LOG_UPDATES):
+                    entries.append((entity, entity_id, procore_id,
+                                    "create" if created else "update", hashes.get(procore_id)))
+                if row_projects[procore_id]:
+                    changes.append((row_projects[procore_id], entity_id, "create" if created else "update"))
+            bulk_log_sync(conn, entries)
+            publish_changes(conn, entity, changes)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        known.update((row["procore_id"], row["sync_hash"]) for row in rows)
+    return counts
+
 
 def sync_projects(client: ProcoreClient, conn):
     """Sync all projects for the company."""
     log.info("Syncing projects...")
     projects = client.get_all("/rest/v1.1/projects", {"company_id": COMPANY_ID})
-    time.sleep(API_DELAY)
-
-    created, updated = 0, 0
-    for p in projects:
-        pid = p["id"]
-        existing_id = find_by_procore_id(conn, "projects", pid)
-
-        address = None
-        if p.get("address") or p.get("city"):
-            address = json.dumps({
-                "street": p.get("address", ""),
-                "city": p.get("city", ""),
-                "state": p.get("state_code", ""),
-                "zip": p.get("zip", ""),
-            })
-
-        vals = {
-            "procore_id": pid,
+
+    now = datetime.now(timezone.utc)
+
+    def to_row(p):
+        return {
+            "procore_id": p["id"],
             "name": p.get("name", "Unnamed"),
             "number": p.get("project_number") or p.get("code"),
             "description": p.get("description"),
-            "address": address,
+            "address": _project_address(p),
             "status": "active" if p.get("active") else "completed",
             "start_date": safe_date(p.get("start_date")),
             "estimated_completion": safe_date(p.get("projected_finish_date") or p.get("completion_date")),
             "contract_value": p.get("estimated_value") or p.get("total_value"),
             "project_type": p.get("project_type", {}).get("name") if isinstance(p.get("project_type"), dict) else p.get("project_type"),
             "square_footage": p.get("square_feet"),
-            "procore_project_id": pid,
+            "procore_project_id": p["id"],
             "sync_status": "synced",
-            "last_synced_at": datetime.now(timezone.utc),
+            "last_synced_at": now,
         }
 
-        with conn.cursor() as cur:
-            if existing_id:
-                sets = ", ".join(f"{k} = %s" for k in vals)
-                cur.execute(f"UPDATE projects SET {sets} WHERE id = %s",
-                            list(vals.values()) + [existing_id])
-                log_sync(conn, "project", existing_id, pid, "update", p_hash=payload_hash(p))
-                updated += 1
-            else:
-                cols = ", ".join(vals.keys())
-                placeholders = ", ".join(["%s"] * len(vals))
-                cur.execute(f"INSERT INTO projects ({cols}) VALUES ({placeholders}) RETURNING id",
-                            list(vals.values()))
-                new_id = str(cur.fetchone()[0])
-                log_sync(conn, "project", new_id, pid, "create", p_hash=payload_hash(p))
-                created += 1
-        conn.commit()
-
-    log.info(f"Projects: {created} created, {updated} updated (total {len(projects)})")
-    set_cursor(conn, "projects", datetime.now(timezone.utc))
+    counts = _sync_rows(conn, "projects", "project", projects, to_row, load_hash_map(conn, "projects"))
+    log.info(f"Projects: {_fmt_counts(counts)} (total {len(projects)})")
+    set_cursor(conn, "projects", datetime.now(timezone.utc), changed=_changed(counts))
+    return counts
 
 
 def sync_companies(client: ProcoreClient, conn):
     """Sync companies (vendors) for the company directory."""
     log.info("Syncing companies...")
+    vendor_lists = fetch_per_project(lambda proj_id: client.get_all(f"/rest/v1.0/projects/{proj_id}/vendors"),
+                                     PROJECT_IDS)
     companies = client.get_all("/rest/v1.0/companies", {"company_id": COMPANY_ID})
-    time.sleep(API_DELAY)
 
     # Also get project-level vendors for each project
-    for proj_id in PROJECT_IDS:
-        try:
-            vendors = client.get_all(f"/rest/v1.0/projects/{proj_id}/vendors")
-            time.sleep(API_DELAY)
-            # Merge — avoid duplicates by id
-            existing_ids = {c["id"] for c in companies}
-            for v in vendors:
-                if v["id"] not in existing_ids:
-                    companies.append(v)
-                    existing_ids.add(v["id"])
-        except Exception as e:
-            log.warning(f"Failed to get vendors for project {proj_id}: {e}")
-
-    created, updated = 0, 0
-    for c in companies:
-        cid = c["id"]
-        existing_id = find_by_procore_id(conn, "companies", cid)
-
-        vals = {
-            "procore_id": cid,
+    existing_ids = {c["id"] for c in companies}
+    for proj_id, vendors, error in vendor_lists:
+        if error:
+            log.warning(f"Failed to get vendors for project {proj_id}: {error}")
+            continue
+        # Merge — avoid duplicates by id
+        for v in vendors:
+            if v["id"] not in existing_ids:
+                companies.append(v)
+                existing_ids.add(v["id"])
+
+    def to_row(c):
+        return {
+            "procore_id": c["id"],
             "name": c.get("name", "Unknown"),
             "phone": c.get("phone"),
             "email": c.get("email_address") or c.get("email"),
             "website": c.get("website"),
+            "address": _project_address(c),
             "sync_status": "synced",
         }
-        # Add address if present
-        if c.get("address") or c.get("city"):
-            vals["address"] = json.dumps({
-                "street": c.get("address", ""),
-                "city": c.get("city", ""),
-                "state": c.get("state_code", ""),
-                "zip": c.get("zip", ""),
-            })
 
-        with conn.cursor() as cur:
-            if existing_id:
-                sets = ", ".join(f"{k} = %s" for k in vals)
-                cur.execute(f"UPDATE companies SET {sets} WHERE id = %s",
-                            list(vals.values()) + [existing_id])
-                updated += 1
-            else:
-                cols = ", ".join(vals.keys())
-                placeholders = ", ".join(["%s"] * len(vals))
-                cur.execute(f"INSERT INTO companies ({cols}) VALUES ({placeholders}) RETURNING id",
-                            list(vals.values()))
-                new_id = str(cur.fetchone()[0])
-                log_sync(conn, "company", new_id, cid, "create")
-                created += 1
-        conn.commit()
-
-    log.info(f"Companies: {created} created, {updated} updated (total {len(companies)})")
-    set_cursor(conn, "companies", datetime.now(timezone.utc))
+    # A vendor without an address must not blank one we already have
+    counts = _sync_rows(conn, "companies", "company", companies, to_row, load_hash_map(conn, "companies"),
+                        keep_existing=("address",), log_updates=False)
+    log.info(f"Companies: {_fmt_counts(counts)} (total {len(companies)})")
+    set_cursor(conn, "companies", datetime.now(timezone.utc), changed=_changed(counts))
+    return counts
 
 
 def sync_contacts(client: ProcoreClient, conn):
     """Sync users/contacts from project directories."""
     log.info("Syncing contacts...")
-    created, updated = 0, 0
+    company_ids = load_id_map(conn, "companies")
+    known = load_hash_map(conn, "contacts")
+    totals = _new_counts()
+
+    def to_row(u):
+        vendor = u.get("vendor")
+        company_uuid = None
+        if vendor and isinstance(vendor, dict) and vendor.get("id"):
+            company_uuid = company_ids.get(vendor["id"])
+        return {
+            "procore_id": u["id"],
+            "first_name": u.get("first_name", ""),
+            "last_name": u.get("last_name", ""),
+            "title": u.get("job_title"),
+            "email": u.get("email_address"),
+            "phone": u.get("business_phone"),
+            "mobile": u.get("mobile_phone"),
+            "company_id": company_uuid,
+            "sync_status": "synced",
+        }
 
-    for proj_id in PROJECT_IDS:
+    for proj_id, users, error in fetch_per_project(
+        lambda proj_id: client.get_all(f"/rest/v1.0/projects/{proj_id}/users"), PROJECT_IDS
+    ):
+        if error:
+            log.error(f"Failed to get users for project {proj_id}: {error}")
+            continue
+
+        _add_counts(totals, _sync_rows(conn, "contacts", "contact", users, to_row, known, log_updates=False))
+
+    log.info(f"Contacts: {_fmt_counts(totals)}")
+    set_cursor(conn, "contacts", datetime.now(timezone.utc), changed=_changed(totals))
+    return totals
+
+
+def _submittal_row(s: dict, project_uuid: str, company_ids: Dict[int, str]) -> dict:
+    # Map spec section
+    spec_num = None
+    spec = s.get("specification_section")
+    if spec and isinstance(spec, dict):
+        spec_num = spec.get("number") or spec.get("label")
+
+    # Map responsible contractor
+    rc = s.get("responsible_contractor")
+    rc_uuid = company_ids.get(rc["id"]) if rc and isinstance(rc, dict) and rc.get("id") else None
+
+    status = safe_status(
+        s.get("status", {}).get("name") if isinstance(s.get("status"), dict) else s.get("status"),
+        SUBMITTAL_STATUS_MAP, "open"
+    )
+
+    return {
+        "project_id": project_uuid,
+        "procore_id": s["id"],
+        "number": str(s.get("formatted_number") or s.get("number", "")),
+        "revision": s.get("revision", 0) or 0,
+        "title": s.get("title", "Untitled"),
+        "description": s.get("description") or None,
+        "spec_section_number": spec_num,
+        "submittal_type": s.get("type", {}).get("name") if isinstance(s.get("type"), dict) else s.get("type"),
+        "status": status,
+        "submitted_date": safe_date(s.get("distributed_at") or s.get("created_at")),
+        "required_date": safe_date(s.get("required_on_site_date")),
+        "received_date": safe_date(s.get("received_date")),
+        "lead_time_days": s.get("lead_time"),
+        "responsible_contractor_id": rc_uuid,
+        "import_source": "procore_api",
+        "sync_status": "synced",
+        "is_deleted": False,
+    }
+
+
+def sync_submittals(client: ProcoreClient, conn, full: bool = False):
+    """Sync submittals for all tracked projects (delta unless a full pass is due)."""
+    params, full, started = plan_fetch(conn, "submittals", full)
+    log.info(f"Syncing submittals ({'full' if full else 'delta'})...")
+    company_ids = load_id_map(conn, "companies")
+    known = load_hash_map(conn, "submittals")
+    totals = _new_counts()
+    failed = False
+
+    # Streamed page by page: each project's listing is written while later pages are in flight
+    for proj_id, project_uuid in local_projects(conn, "submittals").items():
+        seen = set()
         try:
-            users = client.get_all(f"/rest/v1.0/projects/{proj_id}/users")
-            time.sleep(API_DELAY)
+            _add_counts(totals, _sync_rows(
+                conn, "submittals", "submittal",
+                client.iter_all(f"/rest/v1.1/projects/{proj_id}/submittals", params),
+                lambda s: _submittal_row(s, project_uuid, company_ids), known,
+                immutable=("project_id",), seen=seen,
+            ))
         except Exception as e:
-            log.error(f"Failed to get users for project {proj_id}: {e}")
+            log.error(f"Failed to sync submittals for project {proj_id}: {e}")
+            failed = True
             continue
+        if full:
+            totals["deleted"] += mark_missing_deleted(conn, "submittals", "submittal", project_uuid, seen)
+
+    log.info(f"Submittals: {_fmt_counts(totals)}")
+    refresh_embeddings(conn, "submittal")
+    finish_fetch(conn, "submittals", started, full, failed, _changed(totals))
+    return totals
+
+
+def _rfi_row(r: dict, project_uuid: str) -> dict:
+    status = safe_status(r.get("status"), RFI_STATUS_MAP, "open")
+
+    # Extract question from questions array
+    question_text = ""
+    questions = r.get("questions")
+    if questions and isinstance(questions, list):
+        bodies = [q.get("body", "") for q in questions if q.get("body")]
+        question_text = "\n\n".join(bodies)
+    if not question_text:
+        question_text = r.get("subject", "No question text")
+
+    # Extract answer from questions (official responses)
+    answer_text = None
+    if questions and isinstance(questions, list):
+        for q in questions:
+            answers = q.get("answers", [])
+            if answers:
+                official = [a for a in answers if a.get("official")]
+                if official:
+                    answer_text = official[0].get("body")
+                elif answers:
+                    answer_text = answers[-1].get("body")
+
+    # Cost/schedule impact
+    cost_impact = False
+    cost_amount = None
+    ci = r.get("cost_impact")
+    if ci and isinstance(ci, dict):
+        cost_impact = ci.get("status") == "yes"
+        cost_amount = ci.get("value")
+
+    schedule_impact = False
+    schedule_days = None
+    si = r.get("schedule_impact")
+    if si and isinstance(si, dict):
+        schedule_impact = si.get("status") == "yes"
+        schedule_days = si.get("value")
+
+    # Location
+    loc = r.get("location")
+    location_str = None
+    if loc and isinstance(loc, dict):
+        location_str = loc.get("name") or loc.get("path")
+    elif isinstance(loc, str):
+        location_str = loc
+
+    return {
+        "project_id": project_uuid,
+        "procore_id": r["id"],
+        "number": str(r.get("full_number") or r.get("number", "")),
+        "subject": r.get("subject", "Untitled"),
+        "question": question_text,
+        "status": status,
+        "date_initiated": safe_date(r.get("initiated_at") or r.get("created_at")),
+        "due_date": safe_date(r.get("due_date")),
+        "cost_impact": cost_impact,
+        "cost_amount": cost_amount,
+        "schedule_impact": schedule_impact,
+        "schedule_impact_days": schedule_days,
+        "official_answer": answer_text,
+        "location": location_str,
+        "cost_code": r.get("cost_code", {}).get("name") if isinstance(r.get("cost_code"), dict) else r.get("cost_code"),
+        "import_source": "procore_api",
+        "sync_status": "synced",
+        "is_deleted": False,
+    }
+
+
+def sync_rfis(client: ProcoreClient, conn, full: bool = False):
+    """Sync RFIs for all tracked projects (delta unless a full pass is due)."""
+    params, full, started = plan_fetch(conn, "rfis", full)
+    log.info(f"Syncing RFIs ({'full' if full else 'delta'})...")
+    known = load_hash_map(conn, "rfis")
+    totals = _new_counts()
+    failed = False
+
+    for proj_id, project_uuid in local_projects(conn, "RFIs").items():
+        seen = set()
+        try:
+            _add_counts(totals, _sync_rows(
+                conn, "rfis", "rfi", client.iter_all(f"/rest/v1.0/projects/{proj_id}/rfis", params),
+                lambda r: _rfi_row(r, project_uuid), known, immutable=("project_id",), seen=seen,
+            ))
+        except Exception as e:
+            log.error(f"Failed to sync RFIs for project {proj_id}: {e}")
+            failed = True
+            continue
+        if full:
+            totals["deleted"] += mark_missing_deleted(conn, "rfis", "rfi", project_uuid, seen)
 
-        for u in users:
-            uid = u["id"]
-            existing_id = find_by_procore_id(conn, "contacts", uid)
-
-            # Try to link to company
-            company_uuid = None
-            vendor = u.get("vendor")
-            if vendor and isinstance(vendor, dict) and vendor.get("id"):
-                company_uuid = find_by_procore_id(conn, "companies", vendor["id"])
-
-            vals = {
-                "procore_id": uid,
-                "first_name": u.get("first_name", ""),
-                "last_name": u.get("last_name", ""),
-                "title": u.get("job_title"),
-                "email": u.get("email_address"),
-                "phone": u.get("business_phone"),
-                "mobile": u.get("mobile_phone"),
-                "company_id": company_uuid,
-                "sync_status": "synced",
-            }
+    log.info(f"RFIs: {_fmt_counts(totals)}")
+    refresh_embeddings(conn, "rfi")
+    finish_fetch(conn, "rfis", started, full, failed, _changed(totals))
+    return totals
 
-            with conn.cursor() as cur:
-                if existing_id:
-                    sets = ", ".join(f"{k} = %s" for k in vals)
-                    cur.execute(f"UPDATE contacts SET {sets} WHERE id = %s",
-                                list(vals.values()) + [existing_id])
-                    updated += 1
-                else:
-                    cols = ", ".join(vals.keys())
-                    placeholders = ", ".join(["%s"] * len(vals))
-                    cur.execute(f"INSERT INTO contacts ({cols}) VALUES ({placeholders}) RETURNING id",
-                                list(vals.values()))
-                    new_id = str(cur.fetchone()[0])
-                    log_sync(conn, "contact", new_id, uid, "create")
-                    created += 1
-            conn.commit()
 
-    log.info(f"Contacts: {created} created, {updated} updated")
-    set_cursor(conn, "contacts", datetime.now(timezone.utc))
+DISCIPLINE_MAP = {
+    "architectural": "architectural", "structural": "structural",
+    "mechanical": "mechanical", "electrical": "electrical",
+    "plumbing": "plumbing", "fire_protection": "fire_protection",
+    "civil": "civil", "landscape": "landscape",
+}
+
 
+def _drawing_row(rev: dict, project_uuid: str) -> dict:
+    disc_raw = rev.get("discipline")
+    discipline = None
+    if disc_raw and isinstance(disc_raw, str):
+        discipline = DISCIPLINE_MAP.get(disc_raw.lower(), "other")
+
+    set_info = rev.get("drawing_set")
+    return {
+        "project_id": project_uuid,
+        "procore_id": rev.get("drawing_id"),
+        "number": rev.get("number", "") or "UNKNOWN",
+        "title": rev.get("title", ""),
+        "discipline": discipline,
+        "set_name": set_info.get("name") if isinstance(set_info, dict) else None,
+        "revision": str(rev.get("revision_number", "0")),
+        "revision_date": safe_date(rev.get("drawing_date")),
+        "received_date": safe_date(rev.get("received_date")),
+        "current": bool(rev.get("current", False)),
+        "sync_status": "synced",
+        "is_deleted": False,
+    }
+
+
+def _sync_drawing_batches(conn, project_uuid: str, revisions: Iterable[dict], known: Dict[int, str],
+                          totals: Dict[str, int], seen: set) -> int:
+    """Upsert parent drawings and insert new revisions, one commit per batch.
+
+    Returns the number of drawing_revisions rows created.
+    """
+    created_r = 0
+    drawing_ids = load_id_map(conn, "drawings")
+    for batch in _batches(revisions):
+        seen.update(rev["drawing_id"] for rev in batch if rev.get("drawing_id"))
+
+        # Parent drawings: new ones are inserted from whichever revision we
+        # see; existing ones only take values from the current revision
+        parents = {}
+        orphans = []
+        for rev in batch:
+            row = _drawing_row(rev, project_uuid)
+            if row["procore_id"] is None:
+                orphans.append(row)
+            elif rev.get("current") or (row["procore_id"] not in drawing_ids
+                                        and row["procore_id"] not in parents):
+                parents[row["procore_id"]] = row
+        for procore_id, row in list(parents.items()):
+            row["sync_hash"] = row_hash(row)
+            if known.get(procore_id) == row["sync_hash"]:
+                totals["unchanged"] += 1
+                del parents[procore_id]
 
-def sync_submittals(client: ProcoreClient, conn):
-    """Sync submittals for all tracked projects."""
-    log.info("Syncing submittals...")
-    created, updated = 0, 0
+        try:
+            entries, revision_rows_orphan = [], []
+            for drawing_uuid, procore_id, created in bulk_upsert(
+                conn, "drawings", list(parents.values()), immutable=("project_id",)
+            ):
+                drawing_ids[procore_id] = drawing_uuid
+                known[procore_id] = parents[procore_id]["sync_hash"]
+                if created:
+                    totals["created"] += 1
+                    entries.append(("drawing", drawing_uuid, procore_id, "create", None))
+                else:
+                    totals["updated"] += 1
+            with conn.cursor() as cur:
+                for row in orphans:
+                    cols = ", ".join(row.keys())
+                    placeholders = ", ".join(["%s"] * len(row))
+                    cur.execute(f"INSERT INTO drawings ({cols}) VALUES ({placeholders}) RETURNING id",
+                                list(row.values()))
+                    orphan_uuid = str(cur.fetchone()[0])
+                    entries.append(("drawing", orphan_uuid, 0, "create", None))
+                    revision_rows_orphan.append((orphan_uuid, row["revision"], row["revision_date"]))
+                    totals["created"] += 1
+            bulk_log_sync(conn, entries)
+
+            # Revision records, once per (drawing, revision)
+            revision_rows = {r[:2]: r for r in revision_rows_orphan}
+            for rev in batch:
+                drawing_uuid = drawing_ids.get(rev.get("drawing_id"))
+                if drawing_uuid:
+                    key = (drawing_uuid, str(rev.get("revision_number", "0")))
+                    revision_rows[key] = key + (safe_date(rev.get("drawing_date")),)
+            if revision_rows:
+                with conn.cursor() as cur:
+                    inserted = psycopg2.extras.execute_values(cur, """
+                        INSERT INTO drawing_revisions (drawing_id, revision, revision_date)
+                        SELECT v.drawing_id::uuid, v.revision, v.revision_date::date
+                        FROM (VALUES %s) AS v(drawing_id, revision, revision_date)
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM drawing_revisions dr
+                            WHERE dr.drawing_id = v.drawing_id::uuid AND dr.revision = v.revision
+                        )
+                        RETURNING id
+                    """, list(revision_rows.values()), page_size=len(revision_rows), fetch=True)
+                    created_r += len(inserted)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return created_r
 
-    for proj_id in PROJECT_IDS:
-        project_uuid = get_project_uuid(conn, proj_id)
-        if not project_uuid:
-            log.warning(f"No local project for Procore ID {proj_id}, skipping submittals")
-            continue
 
+def sync_drawing_revisions(client: ProcoreClient, conn, full: bool = False):
+    """Sync drawing revisions — also creates/updates parent drawings."""
+    params, full, started = plan_fetch(conn, "drawing_revisions", full)
+    log.info(f"Syncing drawing revisions ({'full' if full else 'delta'})...")
+    known = load_hash_map(conn, "drawings")
+    totals = _new_counts()
+    created_r = 0
+    failed = False
+
+    for proj_id, project_uuid in local_projects(conn, "drawing revisions").items():
+        seen = set()
         try:
-            subs = client.get_all(f"/rest/v1.1/projects/{proj_id}/submittals")
-            time.sleep(API_DELAY)
+            created_r += _sync_drawing_batches(
+                conn, project_uuid,
+                client.iter_all(f"/rest/v1.0/projects/{proj_id}/drawing_revisions", params),
+                known, totals, seen,
+            )
         except Exception as e:
-            log.error(f"Failed to get submittals for project {proj_id}: {e}")
+            log.error(f"Failed to sync drawing revisions for project {proj_id}: {e}")
+            failed = True
             continue
 
-        for s in subs:
-            sid = s["id"]
-            existing_id = find_by_procore_id(conn, "submittals", sid)
-
-            # Map spec section
-            spec_num = None
-            spec = s.get("specification_section")
-            if spec and isinstance(spec, dict):
-                spec_num = spec.get("number") or spec.get("label")
-
-            # Map responsible contractor
-            rc_uuid = None
-            rc = s.get("responsible_contractor")
-            if rc and isinstance(rc, dict) and rc.get("id"):
-                rc_uuid = find_by_procore_id(conn, "companies", rc["id"])
-
-            status = safe_status(
-                s.get("status", {}).get("name") if isinstance(s.get("status"), dict) else s.get("status"),
-                SUBMITTAL_STATUS_MAP, "open"
-            )
+        if full:
+            totals["deleted"] += mark_missing_deleted(conn, "drawings", "drawing", project_uuid, seen)
 
-            vals = {
-                "project_id": project_uuid,
-                "procore_id": sid,
-                "number": str(s.get("formatted_number") or s.get("number", "")),
-                "revision": s.get("revision", 0) or 0,
-                "title": s.get("title", "Untitled"),
-                "description": s.get("description") or None,
-                "spec_section_number": spec_num,
-                "submittal_type": s.get("type", {}).get("name") if isinstance(s.get("type"), dict) else s.get("type"),
-                "status": status,
-                "submitted_date": safe_date(s.get("distributed_at") or s.get("created_at")),
-                "required_date": safe_date(s.get("required_on_site_date")),
-                "received_date": safe_date(s.get("received_date")),
-                "lead_time_days": s.get("lead_time"),
-                "responsible_contractor_id": rc_uuid,
-                "import_source": "procore_api",
-                "sync_status": "synced",
-            }
+    log.info(f"Drawings: {_fmt_counts(totals)}. Revisions: {created_r} created")
+    finish_fetch(conn, "drawing_revisions", started, full, failed, _changed(totals) or created_r > 0)
+    return totals
 
-            with conn.cursor() as cur:
-                if existing_id:
-                    sets = ", ".join(f"{k} = %s" for k in vals if k != "project_id")
-                    update_vals = [v for k, v in vals.items() if k != "project_id"]
-                    cur.execute(f"UPDATE submittals SET {sets} WHERE id = %s",
-                                update_vals + [existing_id])
-                    log_sync(conn, "submittal", existing_id, sid, "update", p_hash=payload_hash(s))
-                    updated += 1
-                else:
-                    cols = ", ".join(vals.keys())
-                    placeholders = ", ".join(["%s"] * len(vals))
-                    cur.execute(f"INSERT INTO submittals ({cols}) VALUES ({placeholders}) RETURNING id",
-                                list(vals.values()))
-                    new_id = str(cur.fetchone()[0])
-                    log_sync(conn, "submittal", new_id, sid, "create", p_hash=payload_hash(s))
-                    created += 1
-            conn.commit()
 
-    log.info(f"Submittals: {created} created, {updated} updated")
-    set_cursor(conn, "submittals", datetime.now(timezone.utc))
+def _parse_ts(value) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
 
 
-def sync_rfis(client: ProcoreClient, conn):
-    """Sync RFIs for all tracked projects."""
-    log.info("Syncing RFIs...")
-    created, updated = 0, 0
+def _document_row(d: dict, project_uuid: str) -> dict:
+    return {
+        "project_id": project_uuid,
+        "procore_id": d["id"],
+        "title": d.get("name", "Untitled"),
+        "file_name": d.get("name"),
+        "file_size_bytes": d.get("size"),
+        "category": d.get("name_with_path"),
+        "sync_status": "synced",
+        "is_deleted": False,
+    }
 
-    for proj_id in PROJECT_IDS:
-        project_uuid = get_project_uuid(conn, proj_id)
-        if not project_uuid:
-            log.warning(f"No local project for Procore ID {proj_id}, skipping RFIs")
-            continue
 
+def _folder_state(conn, project_uuid: str) -> Dict[int, tuple]:
+    """folder procore_id → (procore_updated_at, listed_updated_at, listed_at) checkpoints."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT procore_id, procore_updated_at, listed_updated_at, listed_at
+            FROM document_folders WHERE project_id = %s
+        """, (project_uuid,))
+        return {row[0]: tuple(row[1:]) for row in cur.fetchall()}
+
+
+def _needs_listing(listed_updated_at, listed_at, updated_at, full: bool, crawl_started: datetime) -> bool:
+    if listed_at is None:
+        return True
+    if full:
+        return listed_at < crawl_started
+    return listed_updated_at != updated_at
+
+
+def _checkpoint_folder(conn, project_uuid: str, folder_id: Optional[int], subfolders: List[dict]):
+    """Record a listed folder's subfolders and mark it listed, in one commit."""
+    try:
+        with conn.cursor() as cur:
+            if subfolders:
+                psycopg2.extras.execute_values(cur, """
+                    INSERT INTO document_folders
+                        (project_id, procore_id, parent_procore_id, name, procore_updated_at)
+                    VALUES %s
+                    ON CONFLICT (project_id, procore_id) DO UPDATE SET
+                        parent_procore_id = EXCLUDED.parent_procore_id,
+                        name = EXCLUDED.name,
+                        procore_updated_at = EXCLUDED.procore_updated_at
+                """, [(project_uuid, f["id"], folder_id, f.get("name"), _parse_ts(f.get("updated_at")))
+                      for f in subfolders], page_size=len(subfolders))
+            if folder_id is not None:
+                cur.execute("""
+                    UPDATE document_folders
+                    SET listed_updated_at = procore_updated_at, listed_at = NOW()
+                    WHERE project_id = %s AND procore_id = %s
+                """, (project_uuid, folder_id))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def crawl_documents(client: ProcoreClient, conn, proj_id: int, project_uuid: str, full: bool,
+                    crawl_started: datetime, known: Dict[int, str], totals: Dict[str, int], seen: set) -> bool:
+    """Breadth-first crawl of a project's documents tool on CRAWL_WORKERS threads.
+
+    Listings run concurrently (paced by the client's rate limiter); files and
+    folder checkpoints are written on this thread as each listing lands. An
+    incremental crawl only lists folders whose updated_at differs from when
+    they were last listed; a full crawl lists every folder not yet listed
+    since `crawl_started`. The frontier is seeded from document_folders, so a
+    crawl cut short resumes where it stopped. Returns False if any folder
+    could not be listed.
+    """
+    path = f"/rest/v1.0/projects/{proj_id}/documents"
+
+    def list_folder(folder_id):
+        children = client.get_json(path, {"filters[parent_id]": folder_id} if folder_id else None)
+        return children if isinstance(children, list) else []
+
+    state = _folder_state(conn, project_uuid)
+    frontier = deque([None])  # None = the root listing, always fetched
+    frontier.extend(
+        folder_id for folder_id, (updated_at, listed_updated_at, listed_at) in state.items()
+        if _needs_listing(listed_updated_at, listed_at, updated_at, full, crawl_started)
+    )
+    queued = set(frontier)
+    complete = True
+    listed = 0
+
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=CRAWL_WORKERS, thread_name_prefix="doc-crawl") as pool:
+        while frontier or in_flight:
+            while frontier and len(in_flight) < CRAWL_WORKERS and not shutdown_requested:
+                folder_id = frontier.popleft()
+                in_flight[pool.submit(list_folder, folder_id)] = folder_id
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                folder_id = in_flight.pop(future)
+                try:
+                    children = future.result()
+                except Exception as e:
+                    log.warning(f"Failed to list document folder {folder_id} in project {proj_id}: {e}")
+                    complete = False
+                    continue
+
+                files = [c for c in children if c.get("document_type") == "file"]
+                subfolders = [c for c in children if c.get("document_type") == "folder"]
+                _add_counts(totals, _sync_rows(conn, "documents", "document", files,
+                                               lambda d: _document_row(d, project_uuid), known,
+                                               immutable=("project_id",), log_updates=False, seen=seen))
+                _checkpoint_folder(conn, project_uuid, folder_id, subfolders)
+                listed += 1
+
+                for f in subfolders:
+                    _, listed_updated_at, listed_at = state.get(f["id"], (None, None, None))
+                    if f["id"] not in queued and _needs_listing(
+                        listed_updated_at, listed_at, _parse_ts(f.get("updated_at")), full, crawl_started
+                    ):
+                        queued.add(f["id"])
+                        frontier.append(f["id"])
+
+    log.info(f"Documents: listed {listed} folder(s) in project {proj_id} ({len(state)} known)")
+    return complete and not shutdown_requested
+
+
+def sync_documents(client: ProcoreClient, conn, full: bool = False):
+    """Sync documents (files/folders from Procore documents tool).
+
+    An interrupted full crawl leaves its start time in sync_cursors.cursor_token
+    and is resumed by the next pass.
+    """
+    _, full, started = plan_fetch(conn, "documents", full)
+    resumed = get_cursor_token(conn, "documents")
+    if resumed:
+        full, started = True, datetime.fromisoformat(resumed)
+    elif full:
+        set_cursor_token(conn, "documents", started.isoformat())
+    log.info(f"Syncing documents ({'resumed full' if resumed else 'full' if full else 'incremental'} crawl)...")
+    known = load_hash_map(conn, "documents")
+    totals = _new_counts()
+    failed = False
+
+    for proj_id, project_uuid in local_projects(conn, "documents").items():
+        seen = set()
         try:
-            rfis = client.get_all(f"/rest/v1.0/projects/{proj_id}/rfis")
-            time.sleep(API_DELAY)
+            complete = crawl_documents(client, conn, proj_id, project_uuid, full, started, known, totals, seen)
         except Exception as e:
-            log.error(f"Failed to get RFIs for project {proj_id}: {e}")
+            log.error(f"Failed to crawl documents for project {proj_id}: {e}")
+            complete = False
+        if not complete:
+            failed = True
             continue
+        # A resumed crawl didn't see the files listed before the restart
+        if full and not resumed:
+            totals["deleted"] += mark_missing_deleted(conn, "documents", "document", project_uuid, seen)
 
-        for r in rfis:
-            rid = r["id"]
-            existing_id = find_by_procore_id(conn, "rfis", rid)
-
-            status = safe_status(r.get("status"), RFI_STATUS_MAP, "open")
-
-            # Extract question from questions array
-            question_text = ""
-            questions = r.get("questions")
-            if questions and isinstance(questions, list):
-                bodies = [q.get("body", "") for q in questions if q.get("body")]
-                question_text = "\n\n".join(bodies)
-            if not question_text:
-                question_text = r.get("subject", "No question text")
-
-            # Extract answer from questions (official responses)
-            answer_text = None
-            if questions and isinstance(questions, list):
-                for q in questions:
-                    answers = q.get("answers", [])
-                    if answers:
-                        official = [a for a in answers if a.get("official")]
-                        if official:
-                            answer_text = official[0].get("body")
-                        elif answers:
-                            answer_text = answers[-1].get("body")
-
-            # Cost/schedule impact
-            cost_impact = False
-            cost_amount = None
-            ci = r.get("cost_impact")
-            if ci and isinstance(ci, dict):
-                cost_impact = ci.get("status") == "yes"
-                cost_amount = ci.get("value")
-
-            schedule_impact = False
-            schedule_days = None
-            si = r.get("schedule_impact")
-            if si and isinstance(si, dict):
-                schedule_impact = si.get("status") == "yes"
-                schedule_days = si.get("value")
-
-            # Location
-            loc = r.get("location")
-            location_str = None
-            if loc and isinstance(loc, dict):
-                location_str = loc.get("name") or loc.get("path")
-            elif isinstance(loc, str):
-                location_str = loc
-
-            vals = {
-                "project_id": project_uuid,
-                "procore_id": rid,
-                "number": str(r.get("full_number") or r.get("number", "")),
-                "subject": r.get("subject", "Untitled"),
-                "question": question_text,
-                "status": status,
-                "date_initiated": safe_date(r.get("initiated_at") or r.get("created_at")),
-                "due_date": safe_date(r.get("due_date")),
-                "cost_impact": cost_impact,
-                "cost_amount": cost_amount,
-                "schedule_impact": schedule_impact,
-                "schedule_impact_days": schedule_days,
-                "official_answer": answer_text,
-                "location": location_str,
-                "cost_code": r.get("cost_code", {}).get("name") if isinstance(r.get("cost_code"), dict) else r.get("cost_code"),
-                "import_source": "procore_api",
-                "sync_status": "synced",
-            }
+    log.info(f"Documents: {_fmt_counts(totals)}")
+    if full and not failed:
+        set_cursor_token(conn, "documents", None)
+    finish_fetch(conn, "documents", started, full, failed, _changed(totals))
+    return totals
 
-            with conn.cursor() as cur:
-                if existing_id:
-                    sets = ", ".join(f"{k} = %s" for k in vals if k != "project_id")
-                    update_vals = [v for k, v in vals.items() if k != "project_id"]
-                    cur.execute(f"UPDATE rfis SET {sets} WHERE id = %s",
-                                update_vals + [existing_id])
-                    log_sync(conn, "rfi", existing_id, rid, "update", p_hash=payload_hash(r))
-                    updated += 1
-                else:
-                    cols = ", ".join(vals.keys())
-                    placeholders = ", ".join(["%s"] * len(vals))
-                    cur.execute(f"INSERT INTO rfis ({cols}) VALUES ({placeholders}) RETURNING id",
-                                list(vals.values()))
-                    new_id = str(cur.fetchone()[0])
-                    log_sync(conn, "rfi", new_id, rid, "create", p_hash=payload_hash(r))
-                    created += 1
-            conn.commit()
 
-    log.info(f"RFIs: {created} created, {updated} updated")
-    set_cursor(conn, "rfis", datetime.now(timezone.utc))
+# =============================================================================
+# Webhook-driven sync
+# =============================================================================
+# Each queued Procore webhook names one record; the worker fetches just that
+# record and upserts it through the same row mappers as the polling passes.
 
+WEBHOOK_FETCH_PATHS = {
+    "rfis": "/rest/v1.0/projects/{project}/rfis/{id}",
+    "submittals": "/rest/v1.1/projects/{project}/submittals/{id}",
+    "drawing_revisions": "/rest/v1.0/projects/{project}/drawing_revisions/{id}",
+}
 
-def sync_drawing_revisions(client: ProcoreClient, conn):
-    """Sync drawing revisions — also creates/updates parent drawings."""
-    log.info("Syncing drawing revisions...")
-    created_d, updated_d, created_r = 0, 0, 0
+_signal_queue = None
 
-    for proj_id in PROJECT_IDS:
-        project_uuid = get_project_uuid(conn, proj_id)
-        if not project_uuid:
-            continue
 
-        try:
-            revisions = client.get_all(f"/rest/v1.0/projects/{proj_id}/drawing_revisions")
-            time.sleep(API_DELAY)
-        except Exception as e:
-            log.error(f"Failed to get drawing revisions for project {proj_id}: {e}")
-            continue
+def _known_hashes(conn, table: str, procore_ids: List[int]) -> Dict[int, str]:
+    if table not in ALLOWED_TABLES:
+        raise ValueError(f"Invalid table name: {table}")
+    with conn.cursor() as cur:
+        cur.execute(f"""
+            SELECT procore_id, sync_hash FROM {table}
+            WHERE procore_id = ANY(%s) AND sync_hash IS NOT NULL
+        """, (procore_ids,))
+        return dict(cur.fetchall())
+
+
+def _apply_webhook_event(client: ProcoreClient, conn, event: Dict, project_uuid: str) -> Optional[Dict]:
+    """Fetch and upsert the record an event names.
 
-        for rev in revisions:
-            dr_procore_id = rev["id"]
-            drawing_procore_id = rev.get("drawing_id")
-            number = rev.get("number", "")
-            title = rev.get("title", "")
-            revision_num = rev.get("revision_number", "0")
-
-            # Discipline mapping
-            disc_raw = rev.get("discipline")
-            discipline = None
-            if disc_raw and isinstance(disc_raw, str):
-                disc_lower = disc_raw.lower()
-                disc_map = {
-                    "architectural": "architectural", "structural": "structural",
-                    "mechanical": "mechanical", "electrical": "electrical",
-                    "plumbing": "plumbing", "fire_protection": "fire_protection",
-                    "civil": "civil", "landscape": "landscape",
-                }
-                discipline = disc_map.get(disc_lower, "other")
-
-            set_info = rev.get("drawing_set")
-            set_name = set_info.get("name") if isinstance(set_info, dict) else None
-
-            # Upsert drawing (parent) using drawing_procore_id
-            if drawing_procore_id:
-                existing_drawing_id = find_by_procore_id(conn, "drawings", drawing_procore_id)
-            else:
-                existing_drawing_id = None
-
-            drawing_vals = {
-                "project_id": project_uuid,
-                "procore_id": drawing_procore_id,
-                "number": number or "UNKNOWN",
-                "title": title,
-                "discipline": discipline,
-                "set_name": set_name,
-                "revision": str(revision_num),
-                "revision_date": safe_date(rev.get("drawing_date")),
-                "received_date": safe_date(rev.get("received_date")),
-                "current": bool(rev.get("current", False)),
-                "sync_status": "synced",
-            }
+    Returns the written row (or a deletion marker) when something changed,
+    None when the stored row was already current.
+    """
+    entity_type, procore_id = event["entity_type"], event["resource_id"]
 
+    if event["event_type"] == "delete":
+        if entity_type == "drawing_revisions":
+            return None  # the parent drawing survives; full reconciliation settles it
+        table, entity = ("rfis", "rfi") if entity_type == "rfis" else ("submittals", "submittal")
+        try:
             with conn.cursor() as cur:
-                if existing_drawing_id:
-                    # Only update if this is current revision
-                    if rev.get("current"):
-                        sets = ", ".join(f"{k} = %s" for k in drawing_vals if k != "project_id")
-                        update_vals = [v for k, v in drawing_vals.items() if k != "project_id"]
-                        cur.execute(f"UPDATE drawings SET {sets} WHERE id = %s",
-                                    update_vals + [existing_drawing_id])
-                        updated_d += 1
-                    drawing_uuid = existing_drawing_id
-                else:
-                    cols = ", ".join(drawing_vals.keys())
-                    placeholders = ", ".join(["%s"] * len(drawing_vals))
-                    cur.execute(f"INSERT INTO drawings ({cols}) VALUES ({placeholders}) RETURNING id",
-                                list(drawing_vals.values()))
-                    drawing_uuid = str(cur.fetchone()[0])
-                    log_sync(conn, "drawing", drawing_uuid, drawing_procore_id or 0, "create")
-                    created_d += 1
-                conn.commit()
+                cur.execute(f"""
+                    UPDATE {table} SET is_deleted = TRUE, sync_hash = NULL
+                    WHERE procore_id = %s AND is_deleted = FALSE
+                    RETURNING id
+                """, (procore_id,))
+                row = cur.fetchone()
+            if row:
+                bulk_log_sync(conn, [(entity, str(row[0]), procore_id, "delete", None)])
+                publish_changes(conn, entity, [(project_uuid, str(row[0]), "delete")])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return {"procore_id": procore_id, "is_deleted": True} if row else None
+
+    record = client.get_json(WEBHOOK_FETCH_PATHS[entity_type].format(
+        project=event["procore_project_id"], id=procore_id))
+    if entity_type == "drawing_revisions":
+        totals = _new_counts()
+        _sync_drawing_batches(conn, project_uuid, [record], {}, totals, set())
+        return _drawing_row(record, project_uuid)
+
+    if entity_type == "rfis":
+        table, entity, row = "rfis", "rfi", _rfi_row(record, project_uuid)
+        to_row = lambda r: _rfi_row(r, project_uuid)
+    else:
+        company_ids = load_id_map(conn, "companies")
+        table, entity, row = "submittals", "submittal", _submittal_row(record, project_uuid, company_ids)
+        to_row = lambda s: _submittal_row(s, project_uuid, company_ids)
+    counts = _sync_rows(conn, table, entity, [record], to_row, _known_hashes(conn, table, [procore_id]),
+                        immutable=("project_id",))
+    return row if counts["created"] or counts["updated"] else None
+
+
+def _evaluate_signals(entity_type: str, event_type: str, row: Dict, project_uuid: str):
+    """Hand a webhook-driven change to nerv-interface's SignalEvaluationQueue.
+
+    The queue is bounded (SIGNAL_QUEUE_MAXSIZE): when Ollama falls behind a
+    burst, the event is dropped and counted in the queue's `rejected` stat
+    instead of piling up in memory. RFI/submittal changes still reach the
+    deterministic detectors through the sync_changes feed.
+    """
+    global _signal_queue
+    if not SIGNALS_ON_WEBHOOK:
+        return
+    if _signal_queue is None:
+        try:
+            sys.path.insert(0, os.path.abspath(NERV_INTERFACE_DIR))
+            import httpx  # noqa: F401 — the queue's workers need it; fail here, not on its loop thread
+            from signal_generation import SignalEvaluationQueue
+            _signal_queue = SignalEvaluationQueue
+        except Exception as e:
+            log.warning(f"Signal generation unavailable, webhook changes won't raise signals: {e}")
+            _signal_queue = False
+    if not _signal_queue:
+        return
+
+    event_data = {
+        "source": "procore_webhook",
+        "entity_type": entity_type,
+        "event_type": event_type,
+        "procore_id": row["procore_id"],
+        "record": {k: v for k, v in row.items() if k not in ("project_id", "sync_hash", "sync_status")},
+    }
+    _signal_queue.submit(event_data, project_uuid)  # full: logged and counted as rejected
+
+
+def _stop_signal_queue():
+    """Drain and stop the signal queue if webhook changes ever started it."""
+    if _signal_queue:
+        _signal_queue.stop()
+
+
+def _webhook_company(conn, procore_project_id: int) -> Optional[int]:
+    """Procore company of a tracked project, None for projects this deployment doesn't sync.
+
+    Sharded workers rebind PROJECT_IDS per shard, so they ask sync_shards instead.
+    """
+    if not SHARDED:
+        return COMPANY_ID if procore_project_id in PROJECT_IDS else None
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT company_id FROM sync_shards
+            WHERE procore_project_id = %s AND enabled
+        """, (procore_project_id,))
+        row = cur.fetchone()
+        return row[0] if row else None
 
-                # Insert drawing revision record (check if exists by drawing_id + revision)
-                cur.execute("""
-                    SELECT id FROM drawing_revisions
-                    WHERE drawing_id = %s AND revision = %s
-                """, (drawing_uuid, str(revision_num)))
-                if not cur.fetchone():
-                    cur.execute("""
-                        INSERT INTO drawing_revisions (drawing_id, revision, revision_date)
-                        VALUES (%s, %s, %s)
-                    """, (drawing_uuid, str(revision_num), safe_date(rev.get("drawing_date"))))
-                    created_r += 1
-                conn.commit()
 
-    log.info(f"Drawings: {created_d} created, {updated_d} updated. Revisions: {created_r} created")
-    set_cursor(conn, "drawing_revisions", datetime.now(timezone.utc))
+def process_webhook_events(client: ProcoreClient, conn) -> int:
+    """Drain one leased batch of queued webhook events. Returns the number of records changed.
 
+    Several events for one record (a burst of edits) collapse into one fetch.
+    """
+    events = webhooks.claim_events(conn, WEBHOOK_BATCH_SIZE)
+    if not events:
+        return 0
 
-def sync_documents(client: ProcoreClient, conn):
-    """Sync documents (files/folders from Procore documents tool)."""
-    log.info("Syncing documents...")
-    created, updated = 0, 0
+    grouped: Dict[tuple, List[Dict]] = {}
+    for event in events:
+        key = (event["entity_type"], event["procore_project_id"], event["resource_id"])
+        grouped.setdefault(key, []).append(event)
 
-    for proj_id in PROJECT_IDS:
-        project_uuid = get_project_uuid(conn, proj_id)
-        if not project_uuid:
+    changed = 0
+    for (entity_type, procore_project_id, resource_id), group in grouped.items():
+        latest = group[-1]
+        ids = [e["id"] for e in group]
+        project_uuid = get_project_uuid(conn, procore_project_id)
+        company_id = _webhook_company(conn, procore_project_id)
+        conn.commit()
+        if not project_uuid or company_id is None:
+            webhooks.finish_events(conn, ids)  # not a tracked project
             continue
-
         try:
-            docs = client.get_json(f"/rest/v1.0/projects/{proj_id}/documents")
-            time.sleep(API_DELAY)
+            event_client = client if company_id == client.company_id else _client_for(company_id)
+            row = _apply_webhook_event(event_client, conn, latest, project_uuid)
         except Exception as e:
-            log.error(f"Failed to get documents for project {proj_id}: {e}")
+            log.warning(f"Webhook {entity_type} {resource_id} failed (attempt {latest['attempts']}): {e}")
+            conn.rollback()
+            webhooks.finish_events(conn, ids, error=str(e))
             continue
+        webhooks.finish_events(conn, ids)
+        if row is not None:
+            changed += 1
+            _evaluate_signals(entity_type, latest["event_type"], row, project_uuid)
 
-        # Recursively fetch folder contents
-        all_files = []
-        folders_to_process = []
-        for d in docs:
-            if d.get("document_type") == "folder":
-                folders_to_process.append(d["id"])
-            elif d.get("document_type") == "file":
-                all_files.append(d)
-
-        # Fetch files from subfolders (limit depth to avoid rate limit burn)
-        depth = 0
-        while folders_to_process and depth < 3:
-            next_folders = []
-            for fid in folders_to_process:
-                if shutdown_requested:
-                    break
-                try:
-                    children = client.get_json(f"/rest/v1.0/projects/{proj_id}/documents", {"filters[parent_id]": fid})
-                    time.sleep(API_DELAY)
-                    if isinstance(children, list):
-                        for c in children:
-                            if c.get("document_type") == "file":
-                                all_files.append(c)
-                            elif c.get("document_type") == "folder":
-                                next_folders.append(c["id"])
-                except Exception as e:
-                    log.warning(f"Failed to fetch folder {fid}: {e}")
-            folders_to_process = next_folders
-            depth += 1
-
-        for d in all_files:
-            did = d["id"]
-            existing_id = find_by_procore_id(conn, "documents", did)
-
-            vals = {
-                "project_id": project_uuid,
-                "procore_id": did,
-                "title": d.get("name", "Untitled"),
-                "file_name": d.get("name"),
-                "file_size_bytes": d.get("size"),
-                "category": d.get("name_with_path"),
-                "sync_status": "synced",
-            }
+    if changed:
+        with conn.cursor() as cur:
+            for entity_type in sorted({key[0] for key in grouped}):
+                cur.execute("SELECT pg_notify(%s, %s)", (SYNC_CHANNEL, entity_type))
+        conn.commit()
+    log.info(f"Webhooks: {len(events)} event(s), {len(grouped)} record(s), {changed} changed")
+    return changed
 
-            with conn.cursor() as cur:
-                if existing_id:
-                    sets = ", ".join(f"{k} = %s" for k in vals if k != "project_id")
-                    update_vals = [v for k, v in vals.items() if k != "project_id"]
-                    cur.execute(f"UPDATE documents SET {sets} WHERE id = %s",
-                                update_vals + [existing_id])
-                    updated += 1
-                else:
-                    cols = ", ".join(vals.keys())
-                    placeholders = ", ".join(["%s"] * len(vals))
-                    cur.execute(f"INSERT INTO documents ({cols}) VALUES ({placeholders}) RETURNING id",
-                                list(vals.values()))
-                    new_id = str(cur.fetchone()[0])
-                    log_sync(conn, "document", new_id, did, "create")
-                    created += 1
-            conn.commit()
 
-    log.info(f"Documents: {created} created, {updated} updated")
-    set_cursor(conn, "documents", datetime.now(timezone.utc))
+def _webhook_worker(client: ProcoreClient):
+    """Process queued webhook events as they arrive, until shutdown."""
+    conn = get_conn()
+    try:
+        while not shutdown_requested:
+            webhooks.events_pending.wait(timeout=5)
+            webhooks.events_pending.clear()
+            try:
+                while not shutdown_requested and process_webhook_events(client, conn):
+                    pass
+            except Exception as e:
+                log.error(f"Webhook worker error: {e}", exc_info=True)
+                try:
+                    conn.rollback()
+                except Exception:
+                    return_conn(conn)
+                    conn = get_conn()
+    finally:
+        return_conn(conn)
 
 
 # =============================================================================
@@ -755,44 +1569,425 @@ SYNC_FUNCTIONS = {
     "documents": sync_documents,
 }
 
-# Order matters for first run: projects & companies before entities that reference them
-SYNC_ORDER = ["projects", "companies", "contacts", "submittals", "rfis", "drawing_revisions", "documents"]
+# Entity passes that fetch deltas and accept full=True to force reconciliation
+DELTA_ENTITIES = frozenset({"submittals", "rfis", "drawing_revisions", "documents"})
+
+# Passes within a stage run concurrently; stages run in order because later
+# ones need earlier rows (project UUIDs, then company FKs for contacts/submittals)
+SYNC_STAGES = [
+    ["projects"],
+    ["companies", "rfis", "drawing_revisions", "documents"],
+    ["contacts", "submittals"],
+]
+SYNC_ORDER = [entity_type for stage in SYNC_STAGES for entity_type in stage]
 
 
-def run_sync_pass(client: ProcoreClient, conn, force_all: bool = False):
-    """Run one pass of all sync functions that are due."""
+def _run_entity(client: ProcoreClient, entity_type: str, full: bool) -> Dict[str, int]:
+    """One entity pass on its own pooled connection; errors are logged, not raised."""
+    conn = get_conn()
+    try:
+        func = SYNC_FUNCTIONS[entity_type]
+        if entity_type in DELTA_ENTITIES:
+            return func(client, conn, full=full)
+        return func(client, conn)
+    except Exception as e:
+        log.error(f"Error syncing {entity_type}: {e}", exc_info=True)
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        counts = _new_counts()
+        counts["errors"] = 1
+        return counts
+    finally:
+        return_conn(conn)
+
+
+def run_sync_pass(client: ProcoreClient, conn, force_all: bool = False, full: bool = False,
+                  entities: Iterable[str] = None):
+    """Run one pass of all sync functions that are due; returns the pass's counts.
+
+    `full` forces a full listing (with delete reconciliation) for delta entities;
+    `entities` limits the pass to those entity types (a shard's share).
+    """
     now = datetime.now(timezone.utc)
+    pass_totals = _new_counts()
+    entity_counts: Dict[str, Dict[str, int]] = {}
 
-    for entity_type in SYNC_ORDER:
+    for stage in SYNC_STAGES:
         if shutdown_requested:
             break
 
-        interval = INTERVALS.get(entity_type, 3600)
-        last_sync = get_cursor(conn, entity_type)
-
-        if not force_all and last_sync:
-            elapsed = (now - last_sync).total_seconds()
-            if elapsed < interval:
+        due = []
+        for entity_type in stage:
+            if entities is not None and entity_type not in entities:
                 continue
+            interval = INTERVALS.get(entity_type, 3600)
+            if webhooks.WEBHOOKS_ENABLED and entity_type in WEBHOOK_FETCH_PATHS:
+                interval = max(interval, WEBHOOK_RECONCILE_SECONDS)
+            last_sync = get_cursor(conn, entity_type)
+            if not force_all and last_sync:
+                elapsed = (now - last_sync).total_seconds()
+                if elapsed < interval:
+                    continue
+            due.append(entity_type)
+        conn.commit()  # don't sit idle in transaction while the stage runs
+        if not due:
+            continue
 
-        func = SYNC_FUNCTIONS[entity_type]
+        with ThreadPoolExecutor(max_workers=len(due), thread_name_prefix="sync-entity") as stage_pool:
+            for entity_type, counts in zip(due, stage_pool.map(
+                    lambda entity_type: _run_entity(client, entity_type, full), due)):
+                entity_counts[entity_type] = counts
+                _add_counts(pass_totals, counts)
+
+    if entity_counts:
+        try:
+            record_sync_pass(conn, now, full, entity_counts, pass_totals)
+        except Exception as e:
+            conn.rollback()
+            log.warning(f"Could not record sync pass summary: {e}")
+    if any(pass_totals.values()):
+        log.info(f"Sync pass: {_fmt_counts(pass_totals)}")
+        log.info(f"Procore rate limiter: {client.limiter.snapshot()}")
+        log.info(f"Procore HTTP: {HTTP_STATS.snapshot()}")
+    return pass_totals
+
+
+# =============================================================================
+# Sharded sync
+# =============================================================================
+# sync_shards holds one company shard (project list, company directory) per
+# Procore company and one project shard (everything project-scoped) per
+# project. Each worker process heartbeats into sync_workers; whichever worker
+# holds the coordinator advisory lock assigns enabled shards to live workers by
+# rendezvous hashing, so a worker starting or stopping only moves the shards it
+# gains or loses. A worker syncs a shard only while holding its lease, renewed
+# with every heartbeat; a dead worker's leases lapse after SHARD_LEASE_SECONDS.
+
+COMPANY_SHARD_ENTITIES = frozenset({"projects", "companies"})
+PROJECT_SHARD_ENTITIES = frozenset(SYNC_ORDER) - COMPANY_SHARD_ENTITIES
+
+_clients: Dict[int, ProcoreClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _client_for(company_id: int) -> ProcoreClient:
+    """One ProcoreClient per Procore company, all drawing on this process's rate budget."""
+    with _clients_lock:
+        if company_id not in _clients:
+            _clients[company_id] = ProcoreClient(company_id=company_id)
+        return _clients[company_id]
+
+
+def new_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def seed_shards(conn):
+    """Register PROCORE_COMPANY_ID and PROCORE_PROJECT_IDS as shards; existing rows are left alone."""
+    rows = [(f"company:{COMPANY_ID}", COMPANY_ID, None)]
+    rows += [(f"project:{proj_id}", COMPANY_ID, proj_id) for proj_id in PROJECT_IDS]
+    with conn.cursor() as cur:
+        psycopg2.extras.execute_values(cur, """
+            INSERT INTO sync_shards (shard_key, company_id, procore_project_id) VALUES %s
+            ON CONFLICT (shard_key) DO NOTHING
+        """, rows)
+    conn.commit()
+
+
+def heartbeat(conn, worker_id: str):
+    """Mark this worker alive and extend every shard lease it holds."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            INSERT INTO sync_workers (worker_id, hostname, pid) VALUES (%s, %s, %s)
+            ON CONFLICT (worker_id) DO UPDATE SET heartbeat_at = NOW()
+        """, (worker_id, socket.gethostname(), os.getpid()))
+        cur.execute("""
+            UPDATE sync_shards SET lease_expires_at = NOW() + make_interval(secs => %s)
+            WHERE lease_owner = %s
+        """, (SHARD_LEASE_SECONDS, worker_id))
+    conn.commit()
+
+
+def _try_lead(conn) -> bool:
+    """Take the coordinator lock. It is session-level, so it stays with this
+    connection until the process exits and another worker's next try wins it."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_try_advisory_lock(%s)", (SHARD_COORDINATOR_LOCK,))
+        leading = cur.fetchone()[0]
+    conn.commit()
+    return leading
+
+
+def _rendezvous(shard_key: str, worker_id: str) -> int:
+    return int(hashlib.sha256(f"{shard_key}|{worker_id}".encode()).hexdigest()[:16], 16)
+
+
+def rebalance(conn) -> int:
+    """Drop stale workers and assign each enabled shard to its highest-scoring live worker.
+
+    Returns the number of shards whose assignment changed.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""
+            DELETE FROM sync_workers WHERE heartbeat_at < NOW() - make_interval(secs => %s)
+            RETURNING worker_id
+        """, (SHARD_LEASE_SECONDS,))
+        stale = [row[0] for row in cur.fetchall()]
+        cur.execute("SELECT worker_id FROM sync_workers")
+        live = [row[0] for row in cur.fetchall()]
+        cur.execute("SELECT shard_key, assigned_to FROM sync_shards WHERE enabled")
+        moves = []
+        for shard_key, assigned_to in cur.fetchall():
+            owner = max(live, key=lambda w: _rendezvous(shard_key, w)) if live else None
+            if owner != assigned_to:
+                moves.append((shard_key, owner))
+        if moves:
+            psycopg2.extras.execute_values(cur, """
+                UPDATE sync_shards s SET assigned_to = v.owner
+                FROM (VALUES %s) AS v(shard_key, owner)
+                WHERE s.shard_key = v.shard_key
+            """, moves, template="(%s, %s::text)")
+        cur.execute("UPDATE sync_shards SET assigned_to = NULL WHERE NOT enabled AND assigned_to IS NOT NULL")
+    conn.commit()
+    if stale:
+        log.info(f"Shard coordinator: dropped stale worker(s) {stale}")
+    if moves:
+        log.info(f"Shard coordinator: {len(moves)} shard(s) reassigned across {len(live)} worker(s)")
+    return len(moves)
+
+
+def claim_shards(conn, worker_id: str) -> List[Dict]:
+    """Release leases on shards assigned elsewhere, lease the ones assigned here.
+
+    A shard moving to this worker is only taken once its previous owner has
+    released it (after finishing its pass) or its lease has lapsed. Company
+    shards come first: project shards need the project rows they write.
+    """
+    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        cur.execute("""
+            UPDATE sync_shards SET lease_owner = NULL, lease_expires_at = NULL
+            WHERE lease_owner = %s AND (assigned_to IS DISTINCT FROM %s OR NOT enabled)
+            RETURNING shard_key
+        """, (worker_id, worker_id))
+        released = [row["shard_key"] for row in cur.fetchall()]
+        cur.execute("""
+            UPDATE sync_shards
+            SET lease_owner = %s, lease_expires_at = NOW() + make_interval(secs => %s)
+            WHERE enabled AND assigned_to = %s
+              AND (lease_owner IS NULL OR lease_owner = %s OR lease_expires_at < NOW())
+            RETURNING shard_key, company_id, procore_project_id
+        """, (worker_id, SHARD_LEASE_SECONDS, worker_id, worker_id))
+        shards = cur.fetchall()
+    conn.commit()
+    if released:
+        log.info(f"Released shard(s) {released}")
+    return sorted(shards, key=lambda s: (s["procore_project_id"] is not None, s["shard_key"]))
+
+
+def holds_shard(conn, worker_id: str, shard_key: str) -> bool:
+    """Whether this worker still owns the shard (it may have been reassigned mid-round)."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT 1 FROM sync_shards
+            WHERE shard_key = %s AND enabled AND assigned_to = %s
+              AND lease_owner = %s AND lease_expires_at > NOW()
+        """, (shard_key, worker_id, worker_id))
+        held = cur.fetchone() is not None
+    conn.commit()
+    return held
+
+
+def release_shards(conn, worker_id: str):
+    """Give up every lease and deregister, so the coordinator rebalances right away."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            UPDATE sync_shards SET lease_owner = NULL, lease_expires_at = NULL
+            WHERE lease_owner = %s
+        """, (worker_id,))
+        cur.execute("DELETE FROM sync_workers WHERE worker_id = %s", (worker_id,))
+    conn.commit()
+
+
+def run_shard_pass(conn, shard: Dict, force_all: bool = False, full: bool = False) -> Dict[str, int]:
+    """Sync one leased shard: its company's or project's share of SYNC_STAGES.
+
+    The module-level scope (COMPANY_ID, PROJECT_IDS, CURSOR_SCOPE) is rebound
+    for the pass; a worker runs one shard pass at a time.
+    """
+    global COMPANY_ID, PROJECT_IDS, CURSOR_SCOPE
+    shard_key, company_id, proj_id = shard["shard_key"], shard["company_id"], shard["procore_project_id"]
+    if proj_id is None:
+        # The company shard also merges in the vendor lists of the company's project shards
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT procore_project_id FROM sync_shards
+                WHERE company_id = %s AND procore_project_id IS NOT NULL AND enabled
+                ORDER BY procore_project_id
+            """, (company_id,))
+            project_ids = [row[0] for row in cur.fetchall()]
+        entities = COMPANY_SHARD_ENTITIES
+    else:
+        if not get_project_uuid(conn, proj_id):
+            conn.commit()
+            log.info(f"Shard {shard_key}: project not synced yet (waiting on company:{company_id})")
+            return _new_counts()
+        project_ids, entities = [proj_id], PROJECT_SHARD_ENTITIES
+    conn.commit()
+
+    COMPANY_ID, PROJECT_IDS, CURSOR_SCOPE = company_id, project_ids, shard_key
+    try:
+        totals = run_sync_pass(_client_for(company_id), conn, force_all=force_all, full=full, entities=entities)
+    finally:
+        CURSOR_SCOPE = ""
+    with conn.cursor() as cur:
+        cur.execute("UPDATE sync_shards SET last_pass_at = NOW() WHERE shard_key = %s", (shard_key,))
+    conn.commit()
+    return totals
+
+
+def _shard_keeper(worker_id: str, ready: threading.Event):
+    """Heartbeat, renew leases and, once elected, coordinate — every SHARD_HEARTBEAT_SECONDS."""
+    conn = get_conn()
+    leading = False
+    try:
+        while not shutdown_requested:
+            try:
+                heartbeat(conn, worker_id)
+                if not leading and _try_lead(conn):
+                    leading = True
+                    log.info(f"Worker {worker_id} is the shard coordinator")
+                if leading:
+                    rebalance(conn)
+                    maybe_maintain_sync_log(conn)
+            except Exception as e:
+                log.error(f"Shard keeper error: {e}", exc_info=True)
+                # Close rather than pool the session, so a held coordinator lock goes with it
+                leading = False
+                _get_pool().putconn(conn, close=True)
+                conn = get_conn()
+            ready.set()
+            for _ in range(SHARD_HEARTBEAT_SECONDS):
+                if shutdown_requested:
+                    break
+                time.sleep(1)
+    finally:
+        if leading:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT pg_advisory_unlock(%s)", (SHARD_COORDINATOR_LOCK,))
+                conn.commit()
+            except Exception:
+                pass
+        return_conn(conn)
+
+
+def run_sharded(full: bool = False):
+    """Sharded worker loop: sync whatever shards this process currently leases."""
+    worker_id = new_worker_id()
+    conn = get_conn()
+    receiver = None
+    check_schema(conn, sharded=True)
+    seed_shards(conn)
+    heartbeat(conn, worker_id)
+    log.info(f"Sharded worker {worker_id} (lease {SHARD_LEASE_SECONDS}s)")
+
+    ready = threading.Event()
+    keeper = threading.Thread(target=_shard_keeper, args=(worker_id, ready), name="shard-keeper", daemon=True)
+    keeper.start()
+    ready.wait(timeout=SHARD_HEARTBEAT_SECONDS)
+    if webhooks.WEBHOOKS_ENABLED:
+        threading.Thread(target=_webhook_worker, args=(_client_for(COMPANY_ID),),
+                         name="webhook-worker", daemon=True).start()
+
+    synced = set()  # shards that have had their initial (every-entity) pass in this process
+    try:
+        while not shutdown_requested:
+            if webhooks.WEBHOOKS_ENABLED and receiver is None:
+                try:
+                    receiver = webhooks.start_receiver(get_conn, return_conn)
+                except OSError:
+                    pass  # another worker on this host is serving the port; retried each round
+            try:
+                for shard in claim_shards(conn, worker_id):
+                    if shutdown_requested:
+                        break
+                    shard_key = shard["shard_key"]
+                    if not holds_shard(conn, worker_id, shard_key):
+                        continue
+                    first = shard_key not in synced
+                    run_shard_pass(conn, shard, force_all=first, full=full and first)
+                    synced.add(shard_key)
+            except Exception as e:
+                log.error(f"Sharded round failed: {e}", exc_info=True)
+                try:
+                    conn.rollback()
+                except Exception:
+                    _get_pool().putconn(conn, close=True)
+                    conn = get_conn()
+            for _ in range(30):  # Check every 30s if anything is due
+                if shutdown_requested:
+                    break
+                time.sleep(1)
+    finally:
+        keeper.join(timeout=10)  # its last heartbeat must not re-register us after release
         try:
-            func(client, conn)
+            release_shards(conn, worker_id)
         except Exception as e:
-            log.error(f"Error syncing {entity_type}: {e}", exc_info=True)
-            # Continue with next entity type
+            log.warning(f"Could not release shard leases (they lapse in {SHARD_LEASE_SECONDS}s): {e}")
+        if receiver:
+            receiver.shutdown()
+        _stop_signal_queue()
+        return_conn(conn)
+        for client in _clients.values():
+            client.close()
+
+
+def supervise_workers(count: int, full: bool = False):
+    """Run `count` sharded worker processes on this host, restarting any that exit."""
+    cmd = [sys.executable, os.path.abspath(__file__), "--sharded"] + (["--full"] if full else [])
+    procs = [subprocess.Popen(cmd) for _ in range(count)]
+    log.info(f"Started {count} sharded sync workers: {[p.pid for p in procs]}")
+    while not shutdown_requested:
+        time.sleep(5)
+        for i, proc in enumerate(procs):
+            if proc.poll() is not None and not shutdown_requested:
+                log.warning(f"Sync worker {proc.pid} exited with {proc.returncode}, restarting")
+                procs[i] = subprocess.Popen(cmd)
+    for proc in procs:
+        proc.terminate()  # SIGTERM: finish the current shard, release leases
+    for proc in procs:
+        proc.wait()
 
 
 def main():
+    global SHARDED
     once = "--once" in sys.argv
+    full = "--full" in sys.argv
+    if "--workers" in sys.argv:
+        supervise_workers(int(sys.argv[sys.argv.index("--workers") + 1]), full)
+        return
+    # --once always syncs every configured project in this one process
+    SHARDED = (SHARDED or "--sharded" in sys.argv) and not once
     log.info("=" * 60)
     log.info("EVA-00 Procore Sync Agent starting")
     log.info(f"Company: {COMPANY_ID} | Projects: {PROJECT_IDS}")
-    log.info(f"Mode: {'single pass' if once else 'continuous'}")
+    log.info(f"Mode: {'single pass' if once else 'sharded' if SHARDED else 'continuous'}")
     log.info("=" * 60)
 
-    client = ProcoreClient(company_id=COMPANY_ID)
+    if SHARDED:
+        try:
+            run_sharded(full)
+        finally:
+            _get_pool().closeall()
+            log.info("Sync agent stopped.")
+        return
+
     conn = get_conn()
+    check_schema(conn)
+    client = ProcoreClient(company_id=COMPANY_ID)
+    receiver = None
 
     # Check if this is first run (no cursors exist)
     with conn.cursor() as cur:
@@ -802,14 +1997,21 @@ def main():
     first_run = cursor_count == 0
     if first_run:
         log.info("First run detected — performing full initial sync")
+    maybe_maintain_sync_log(conn)
 
     try:
         if once:
-            run_sync_pass(client, conn, force_all=True)
+            run_sync_pass(client, conn, force_all=True, full=full)
             log.info("Single sync pass complete.")
         else:
-            # Initial full sync
-            run_sync_pass(client, conn, force_all=True)
+            # Webhooks queue up (and are applied) while the initial pass runs
+            if webhooks.WEBHOOKS_ENABLED:
+                receiver = webhooks.start_receiver(get_conn, return_conn)
+                threading.Thread(target=_webhook_worker, args=(client,),
+                                 name="webhook-worker", daemon=True).start()
+
+            # Initial pass over every entity type (delta where a cursor exists)
+            run_sync_pass(client, conn, force_all=True, full=full)
             log.info("Initial sync complete. Entering polling loop...")
 
             while not shutdown_requested:
@@ -826,12 +2028,17 @@ def main():
                     except Exception:
                         pass
                     conn = get_conn()
+                maybe_maintain_sync_log(conn)
                 run_sync_pass(client, conn)
 
     except KeyboardInterrupt:
         log.info("Interrupted.")
     finally:
+        if receiver:
+            receiver.shutdown()
+        _stop_signal_queue()
         return_conn(conn)
+        client.close()
         pool = _get_pool()
         if pool:
             pool.closeall()
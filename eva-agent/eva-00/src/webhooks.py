@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""EVA-00 Procore Webhooks — Receiver and event queue for the sync agent.
+
+Procore POSTs a small JSON trigger (resource_name, resource_id, event_type,
+project_id) for every change. The receiver verifies it, drops retries it has
+already stored (procore_webhook_events.event_key), and wakes the sync agent's
+webhook worker, which fetches just the touched record. Payloads are never
+trusted as data — they only say what to fetch.
+
+Usage (local stand-in for Procore, against a running sync agent):
+    python webhooks.py --send rfis 12345 --project 316469
+    python webhooks.py --send submittals 678 --project 316469 --event-type delete
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import psycopg2.extras
+
+log = logging.getLogger("sync_agent.webhooks")
+
+WEBHOOKS_ENABLED = os.environ.get("SYNC_WEBHOOKS_ENABLED", "false").lower() == "true"
+WEBHOOK_HOST = os.environ.get("SYNC_WEBHOOK_HOST", "127.0.0.1")  # exposed via the Cloudflare tunnel
+WEBHOOK_PORT = int(os.environ.get("SYNC_WEBHOOK_PORT", "8401"))
+WEBHOOK_PATH = "/webhooks/procore"
+WEBHOOK_SECRET = os.environ.get("PROCORE_WEBHOOK_SECRET", "")
+WEBHOOK_MAX_BODY = 1024 * 1024
+WEBHOOK_MAX_ATTEMPTS = 5
+WEBHOOK_LEASE_SECONDS = 300
+# Failed events wait RETRY_BASE * 2^(attempts-1) seconds, capped, before the next claim
+WEBHOOK_RETRY_BASE_SECONDS = 30
+WEBHOOK_RETRY_MAX_SECONDS = 3600
+
+# Procore resource_name (lower-cased) → sync_agent entity pass
+RESOURCE_ENTITIES = {
+    "rfis": "rfis",
+    "submittals": "submittals",
+    "drawing revisions": "drawing_revisions",
+    "drawing_revisions": "drawing_revisions",
+}
+
+# Set whenever a new event is stored; the worker waits on it
+events_pending = threading.Event()
+
+_stats_lock = threading.Lock()
+_stats = {"accepted": 0, "duplicates": 0, "ignored": 0, "rejected": 0}
+
+
+def _count(key: str):
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def stats() -> Dict[str, int]:
+    with _stats_lock:
+        return dict(_stats)
+
+
+# =============================================================================
+# Verification and parsing
+# =============================================================================
+
+def sign(body: bytes, secret: str = None) -> str:
+    return hmac.new((secret or WEBHOOK_SECRET).encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify(body: bytes, headers) -> bool:
+    """Accept Procore's per-hook Authorization header value, or an HMAC of the body.
+
+    With no PROCORE_WEBHOOK_SECRET configured every request is refused.
+    """
+    if not WEBHOOK_SECRET:
+        return False
+    auth = headers.get("Authorization") or ""
+    if auth and hmac.compare_digest(auth, f"Bearer {WEBHOOK_SECRET}"):
+        return True
+    signature = headers.get("X-Procore-Signature") or ""
+    return bool(signature) and hmac.compare_digest(signature, sign(body))
+
+
+def parse_event(body: bytes) -> Optional[Dict]:
+    """Normalise a Procore webhook body; None for resources the sync agent doesn't track.
+
+    Raises ValueError for malformed bodies.
+    """
+    try:
+        payload = json.loads(body)
+        entity_type = RESOURCE_ENTITIES.get(str(payload.get("resource_name", "")).lower())
+        event = {
+            "entity_type": entity_type,
+            "event_type": str(payload.get("event_type", "update")).lower(),
+            "procore_project_id": int(payload["project_id"]),
+            "resource_id": int(payload["resource_id"]),
+            "payload": payload,
+        }
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Malformed webhook body: {e}") from e
+    if entity_type is None:
+        return None
+    # Procore retries reuse the event's ulid/id; fall back to the body itself
+    event["event_key"] = str(payload.get("ulid") or payload.get("id") or hashlib.sha256(body).hexdigest())
+    return event
+
+
+# =============================================================================
+# Event queue (procore_webhook_events)
+# =============================================================================
+
+def store_event(conn, event: Dict) -> bool:
+    """Insert an event unless its key was seen before. Returns True if new."""
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""
+                INSERT INTO procore_webhook_events
+                    (event_key, entity_type, event_type, procore_project_id, resource_id, payload)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT (event_key) DO NOTHING
+                RETURNING id
+            """, (event["event_key"], event["entity_type"], event["event_type"],
+                  event["procore_project_id"], event["resource_id"],
+                  psycopg2.extras.Json(event["payload"])))
+            created = cur.fetchone() is not None
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    if created:
+        events_pending.set()
+    return created
+
+
+def claim_events(conn, limit: int = 100) -> List[Dict]:
+    """Lease a batch of unprocessed events, oldest first, and commit the lease.
+
+    A worker that dies mid-batch leaves its events to be re-claimed once
+    WEBHOOK_LEASE_SECONDS pass.
+    """
+    try:
+        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            cur.execute("""
+                UPDATE procore_webhook_events e
+                SET locked_until = NOW() + make_interval(secs => %s), attempts = e.attempts + 1
+                WHERE e.id IN (
+                    SELECT id FROM procore_webhook_events
+                    WHERE processed_at IS NULL AND (locked_until IS NULL OR locked_until < NOW())
+                    ORDER BY received_at
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING e.id, e.entity_type, e.event_type, e.procore_project_id, e.resource_id,
+                          e.payload, e.attempts, e.received_at
+            """, (WEBHOOK_LEASE_SECONDS, limit))
+            events = sorted(cur.fetchall(), key=lambda e: e["received_at"])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return events
+
+
+def finish_events(conn, event_ids: List[int], error: str = None):
+    """Mark claimed events processed, or hold them back for a retry with
+    exponential backoff (given up after WEBHOOK_MAX_ATTEMPTS)."""
+    try:
+        with conn.cursor() as cur:
+            if error is None:
+                cur.execute("""
+                    UPDATE procore_webhook_events
+                    SET processed_at = NOW(), locked_until = NULL, last_error = NULL
+                    WHERE id = ANY(%s)
+                """, (event_ids,))
+            else:
+                cur.execute("""
+                    UPDATE procore_webhook_events
+                    SET locked_until = NOW() + make_interval(
+                            secs => LEAST(%s * power(2, GREATEST(attempts - 1, 0)), %s)),
+                        last_error = %s,
+                        processed_at = CASE WHEN attempts >= %s THEN NOW() END
+                    WHERE id = ANY(%s)
+                """, (WEBHOOK_RETRY_BASE_SECONDS, WEBHOOK_RETRY_MAX_SECONDS,
+                      error[:2000], WEBHOOK_MAX_ATTEMPTS, event_ids))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+# =============================================================================
+# HTTP receiver
+# =============================================================================
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    server_version = "EVA00Webhooks/1.0"
+    get_conn = None
+    return_conn = None
+
+    def _reply(self, status: int, body: Dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply(200, {"status": "ok", **stats()})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path.split("?", 1)[0] != WEBHOOK_PATH:
+            self._reply(404, {"error": "not found"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > WEBHOOK_MAX_BODY:
+            self._reply(413, {"error": "body too large"})
+            return
+        body = self.rfile.read(length)
+
+        if not verify(body, self.headers):
+            _count("rejected")
+            self._reply(401, {"error": "invalid signature"})
+            return
+        try:
+            event = parse_event(body)
+        except ValueError as e:
+            _count("rejected")
+            self._reply(400, {"error": str(e)})
+            return
+        if event is None:
+            _count("ignored")
+            self._reply(200, {"status": "ignored"})
+            return
+
+        conn = self.get_conn()
+        try:
+            created = store_event(conn, event)
+        except Exception as e:
+            log.error(f"Failed to store webhook event {event['event_key']}: {e}")
+            self._reply(503, {"error": "event not stored"})  # Procore retries
+            return
+        finally:
+            self.return_conn(conn)
+        _count("accepted" if created else "duplicates")
+        self._reply(202 if created else 200, {"status": "queued" if created else "duplicate"})
+
+    def log_message(self, fmt, *args):
+        log.debug(f"{self.address_string()} {fmt % args}")
+
+
+def start_receiver(get_conn, return_conn) -> ThreadingHTTPServer:
+    """Serve WEBHOOK_PATH on a daemon thread. Connections come from the caller's pool."""
+    if not WEBHOOK_SECRET:
+        log.warning("PROCORE_WEBHOOK_SECRET is not set — every webhook will be rejected")
+    handler = type("WebhookHandler", (_WebhookHandler,), {
+        "get_conn": staticmethod(get_conn), "return_conn": staticmethod(return_conn),
+    })
+    server = ThreadingHTTPServer((WEBHOOK_HOST, WEBHOOK_PORT), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="webhook-receiver", daemon=True).start()
+    log.info(f"Webhook receiver listening on http://{WEBHOOK_HOST}:{WEBHOOK_PORT}{WEBHOOK_PATH}")
+    return server
+
+
+# =============================================================================
+# Local stand-in for Procore
+# =============================================================================
+
+def send_test_event(resource: str, resource_id: int, project_id: int, event_type: str = "update",
+                    url: str = None) -> int:
+    """POST a signed Procore-shaped event to the receiver; returns the HTTP status."""
+    import urllib.error
+    import urllib.request
+    import uuid
+
+    body = json.dumps({
+        "ulid": uuid.uuid4().hex,
+        "resource_name": resource,
+        "resource_id": resource_id,
+        "project_id": project_id,
+        "event_type": event_type,
+        "api_version": "v2",
+    }).encode()
+    request = urllib.request.Request(
+        url or f"http://{WEBHOOK_HOST}:{WEBHOOK_PORT}{WEBHOOK_PATH}", data=body, method="POST",
+        headers={"Content-Type": "application/json", "X-Procore-Signature": sign(body)},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as resp:
+            return resp.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Send a signed test webhook to the EVA-00 sync agent")
+    parser.add_argument("--send", nargs=2, metavar=("RESOURCE", "RESOURCE_ID"), required=True,
+                        help="e.g. rfis 12345")
+    parser.add_argument("--project", type=int, required=True, help="Procore project ID")
+    parser.add_argument("--event-type", default="update", choices=["create", "update", "delete"])
+    parser.add_argument("--url", help=f"Receiver URL (default http://{WEBHOOK_HOST}:{WEBHOOK_PORT}{WEBHOOK_PATH})")
+    args = parser.parse_args()
+
+    resource, resource_id = args.send
+    print(send_test_event(resource, int(resource_id), args.project, args.event_type, args.url))
+
+
+if __name__ == "__main__":
+    main()
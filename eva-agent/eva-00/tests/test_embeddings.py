@@ -0,0 +1,70 @@
+"""embed_pending against an in-memory stand-in for the pending query."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("psycopg2")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import embeddings  # noqa: E402
+
+
+class FakeCursor:
+    """Answers PENDING_QUERIES from `source` rows that have no chunk yet."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=()):
+        self.conn.statements += 1
+        if self.conn.statements > 100:
+            raise AssertionError("embed_pending did not terminate")
+        if "LIMIT %s" in sql and "LEFT JOIN document_chunks" in sql:
+            pending = [r for r in self.conn.source if r["id"] not in self.conn.chunks]
+            self.result = pending[: params[1]]
+        elif sql.lstrip().startswith("DELETE FROM document_chunks"):
+            self.conn.chunks.pop(params[1], None)
+        elif sql.lstrip().startswith("INSERT INTO document_chunks"):
+            self.conn.chunks[params[1]] = params[7]
+
+    def fetchall(self):
+        return self.result
+
+
+class FakeConn:
+    def __init__(self, source):
+        self.source = source
+        self.chunks = {}
+        self.statements = 0
+
+    def cursor(self, cursor_factory=None):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+
+def _row(row_id, content):
+    return {"id": row_id, "project_id": "p1", "spec_section": None, "content": content}
+
+
+def test_empty_content_gets_marker_row(monkeypatch):
+    monkeypatch.setattr(embeddings, "EMBED_BATCH_SIZE", 1)
+    conn = FakeConn([_row("r1", ""), _row("r2", None), _row("r3", "curtain wall anchor embed")])
+
+    assert embeddings.embed_pending(conn, "rfi") == 3
+    assert conn.chunks["r1"] is None
+    assert conn.chunks["r2"] is None
+    assert conn.chunks["r3"].startswith("[")
+
+    # Nothing left pending on the next pass
+    assert embeddings.embed_pending(conn, "rfi") == 0
@@ -19,6 +19,7 @@ import json
 import os
 import sys
 import time
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -27,11 +28,16 @@ WORKSPACE = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(WORKSPACE / "nerv-interface"))
 sys.path.insert(0, str(WORKSPACE / "eva-agent" / "eva-00" / "src"))
 
+from download_store import DownloadStore
 from eva_sentry import EVASentry
 
 SENTRY_STATE = WORKSPACE / "eva-sentry-v1" / "state"
 INGEST_DIR = WORKSPACE / "eva-sentry-v1" / "ingest" / "procore"
 WATERMARK_PATH = WORKSPACE / "eva-sentry-v1" / "state" / "procore_watermarks.json"
+# Shared blob store; must be on the same filesystem as INGEST_DIR for hardlinks
+BLOB_STORE_DIR = WORKSPACE / "eva-sentry-v1" / "ingest" / "store"
+# Items whose attachments may be downloading while later items are listed
+PENDING_ITEMS = 32
 
 
 def _load_watermarks() -> Dict:
@@ -58,26 +64,68 @@ def _get_procore_client():
         return None
 
 
+def _queue_attachments(store: DownloadStore, item_dir: Path, attachments: List[Dict], prefix: str) -> List:
+    """Start downloading an item's attachments; returns [(filename, future)]."""
+    jobs = []
+    for att in attachments:
+        att_url = att.get("url", "")
+        att_name = Path(att.get("filename", att.get("name", f"{prefix}{att.get('id', '')}"))).name
+        if att_url:
+            jobs.append((att_name, store.submit(att_url, item_dir / att_name)))
+    return jobs
+
+
+def _scan_attachments(sentry: EVASentry, jobs: List) -> List[Dict]:
+    att_verdicts = []
+    for att_name, future in jobs:
+        try:
+            dest = future.result()
+            v = sentry.scan_file(dest)
+            att_verdicts.append({"filename": att_name, "path": str(dest), "sentry": v})
+        except Exception as e:
+            att_verdicts.append({"filename": att_name, "error": str(e)})
+    return att_verdicts
+
+
+def _finish_items(pending: deque, sentry: EVASentry, results: List[Dict], keep: int = 0):
+    """Scan attachments and write manifests for pending items, oldest first."""
+    while len(pending) > keep:
+        item_type, item_id, title, item_dir, body_verdict, jobs, label = pending.popleft()
+        manifest = _build_manifest(item_type, item_id, title, body_verdict, _scan_attachments(sentry, jobs))
+        (item_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+        results.append(manifest)
+        print(f"[{manifest['aggregate_verdict'].upper()}] {label}")
+
+
 def scan_procore_items(
     client,
     project_id: int,
     sentry: EVASentry,
     watermarks: Dict,
+    store: DownloadStore,
 ) -> List[Dict]:
-    """Scan RFIs, submittals, and documents for a project. Returns manifests."""
+    """Scan RFIs, submittals, and documents for a project. Returns manifests.
+
+    Attachment downloads run on the store's worker pool; each item's manifest
+    is written once its attachments have landed and been scanned.
+    """
     results = []
+    pending = deque()
     proj_key = str(project_id)
     proj_wm = watermarks.get(proj_key, {})
     proj_dir = INGEST_DIR / proj_key
 
     # --- RFIs ---
     try:
-        rfis = client.get_all(f"/rest/v1.0/projects/{project_id}/rfis")
         last_rfi = proj_wm.get("rfi_last_id", 0)
-        new_rfis = [r for r in rfis if r.get("id", 0) > last_rfi]
+        newest_rfi = last_rfi
 
-        for rfi in new_rfis:
+        # Streamed: page 1 is scanned while later pages are still downloading
+        for rfi in client.iter_all(f"/rest/v1.0/projects/{project_id}/rfis"):
+            if rfi.get("id", 0) <= last_rfi:
+                continue
             rfi_id = rfi["id"]
+            newest_rfi = max(newest_rfi, rfi_id)
             rfi_dir = proj_dir / "rfis" / str(rfi_id)
             rfi_dir.mkdir(parents=True, exist_ok=True)
 
@@ -89,38 +137,27 @@ def scan_procore_items(
 
             body_verdict = sentry.scan_text(text_content, sender=str(rfi.get("created_by", {}).get("id", "")), channel="procore")
 
-            # Scan attachments
-            att_verdicts = []
-            for att in rfi.get("attachments", []):
-                att_url = att.get("url", "")
-                att_name = att.get("filename", att.get("name", f"attachment_{att.get('id', 'unknown')}"))
-                if att_url:
-                    try:
-                        dest = rfi_dir / att_name
-                        client.download(att_url, dest)
-                        v = sentry.scan_file(dest)
-                        att_verdicts.append({"filename": att_name, "path": str(dest), "sentry": v})
-                    except Exception as e:
-                        att_verdicts.append({"filename": att_name, "error": str(e)})
-
-            manifest = _build_manifest("rfi", rfi_id, rfi.get("subject", ""), body_verdict, att_verdicts)
-            (rfi_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
-            results.append(manifest)
-            print(f"[{manifest['aggregate_verdict'].upper()}] RFI #{rfi.get('number')}: {rfi.get('subject', '')}")
-
-        if new_rfis:
-            proj_wm["rfi_last_id"] = max(r["id"] for r in new_rfis)
+            jobs = _queue_attachments(store, rfi_dir, rfi.get("attachments", []), "attachment_")
+            pending.append(("rfi", rfi_id, rfi.get("subject", ""), rfi_dir, body_verdict, jobs,
+                            f"RFI #{rfi.get('number')}: {rfi.get('subject', '')}"))
+            _finish_items(pending, sentry, results, keep=PENDING_ITEMS)
+
+        _finish_items(pending, sentry, results)
+        if newest_rfi > last_rfi:
+            proj_wm["rfi_last_id"] = newest_rfi
     except Exception as e:
         print(f"[WARN] RFI scan failed for project {project_id}: {e}", file=sys.stderr)
 
     # --- Submittals ---
     try:
-        submittals = client.get_all(f"/rest/v1.1/projects/{project_id}/submittals")
         last_sub = proj_wm.get("submittal_last_id", 0)
-        new_subs = [s for s in submittals if s.get("id", 0) > last_sub]
+        newest_sub = last_sub
 
-        for sub in new_subs:
+        for sub in client.iter_all(f"/rest/v1.1/projects/{project_id}/submittals"):
+            if sub.get("id", 0) <= last_sub:
+                continue
             sub_id = sub["id"]
+            newest_sub = max(newest_sub, sub_id)
             sub_dir = proj_dir / "submittals" / str(sub_id)
             sub_dir.mkdir(parents=True, exist_ok=True)
 
@@ -129,26 +166,14 @@ def scan_procore_items(
 
             body_verdict = sentry.scan_text(text_content, channel="procore")
 
-            att_verdicts = []
-            for att in sub.get("attachments", []):
-                att_url = att.get("url", "")
-                att_name = att.get("filename", att.get("name", f"att_{att.get('id', '')}"))
-                if att_url:
-                    try:
-                        dest = sub_dir / att_name
-                        client.download(att_url, dest)
-                        v = sentry.scan_file(dest)
-                        att_verdicts.append({"filename": att_name, "path": str(dest), "sentry": v})
-                    except Exception as e:
-                        att_verdicts.append({"filename": att_name, "error": str(e)})
-
-            manifest = _build_manifest("submittal", sub_id, sub.get("title", ""), body_verdict, att_verdicts)
-            (sub_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
-            results.append(manifest)
-            print(f"[{manifest['aggregate_verdict'].upper()}] Submittal #{sub.get('number')}: {sub.get('title', '')}")
-
-        if new_subs:
-            proj_wm["submittal_last_id"] = max(s["id"] for s in new_subs)
+            jobs = _queue_attachments(store, sub_dir, sub.get("attachments", []), "att_")
+            pending.append(("submittal", sub_id, sub.get("title", ""), sub_dir, body_verdict, jobs,
+                            f"Submittal #{sub.get('number')}: {sub.get('title', '')}"))
+            _finish_items(pending, sentry, results, keep=PENDING_ITEMS)
+
+        _finish_items(pending, sentry, results)
+        if newest_sub > last_sub:
+            proj_wm["submittal_last_id"] = newest_sub
     except Exception as e:
         print(f"[WARN] Submittal scan failed for project {project_id}: {e}", file=sys.stderr)
 
@@ -164,29 +189,18 @@ def scan_procore_items(
             doc_dir.mkdir(parents=True, exist_ok=True)
 
             doc_name = doc.get("name", f"doc_{doc_id}")
-            doc_url = doc.get("url", "")
-
-            att_verdicts = []
-            if doc_url:
-                try:
-                    dest = doc_dir / doc_name
-                    client.download(doc_url, dest)
-                    v = sentry.scan_file(dest)
-                    att_verdicts.append({"filename": doc_name, "path": str(dest), "sentry": v})
-                except Exception as e:
-                    att_verdicts.append({"filename": doc_name, "error": str(e)})
-
+            jobs = _queue_attachments(store, doc_dir, [{"url": doc.get("url", ""), "filename": doc_name}], "doc_")
             body_verdict = sentry.scan_text(doc_name, channel="procore")
-            manifest = _build_manifest("document", doc_id, doc_name, body_verdict, att_verdicts)
-            (doc_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
-            results.append(manifest)
-            print(f"[{manifest['aggregate_verdict'].upper()}] Doc: {doc_name}")
+            pending.append(("document", doc_id, doc_name, doc_dir, body_verdict, jobs, f"Doc: {doc_name}"))
+            _finish_items(pending, sentry, results, keep=PENDING_ITEMS)
 
+        _finish_items(pending, sentry, results)
         if new_docs:
             proj_wm["doc_last_id"] = max(d["id"] for d in new_docs)
     except Exception as e:
         print(f"[WARN] Document scan failed for project {project_id}: {e}", file=sys.stderr)
 
+    _finish_items(pending, sentry, results)  # items left behind by a failed section
     watermarks[proj_key] = proj_wm
     return results
 
@@ -231,9 +245,11 @@ def poll_once(project_ids: Optional[List[int]] = None) -> List[Dict]:
             return []
 
     all_results = []
-    for pid in project_ids:
-        results = scan_procore_items(client, pid, sentry, watermarks)
-        all_results.extend(results)
+    with DownloadStore(client, BLOB_STORE_DIR) as store:
+        for pid in project_ids:
+            results = scan_procore_items(client, pid, sentry, watermarks, store)
+            all_results.extend(results)
+        print(f"[SENTRY:PROCORE] Downloads: {store.stats}")
 
     _save_watermarks(watermarks)
     return all_results
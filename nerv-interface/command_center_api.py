@@ -12,7 +12,8 @@ from datetime import datetime, timedelta, date
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, Body
+from fastapi import APIRouter, HTTPException, Query, Body, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from steelsync_db import get_cursor, serialize_row, serialize_rows
 
 logger = logging.getLogger("steelsync.api")
@@ -20,6 +21,41 @@ logger = logging.getLogger("steelsync.api")
 router = APIRouter(prefix="/api", tags=["command-center"])
 
 
+@router.on_event("startup")
+def _start_synthesis_workers():
+    """Run SYNTHESIS_INPROCESS_WORKERS job workers inside the API process."""
+    try:
+        from synthesis_jobs import start_inprocess_workers
+        started = start_inprocess_workers()
+        if started:
+            logger.info(f"Started {started} in-process synthesis worker(s)")
+    except Exception as e:
+        logger.error(f"Synthesis workers not started: {e}")
+
+    try:
+        from synthesis_scheduler import SynthesisScheduler
+        SynthesisScheduler.start()
+    except Exception as e:
+        logger.error(f"Synthesis scheduler not started: {e}")
+
+    try:
+        from signal_generation import ChangeFeedSweeper
+        ChangeFeedSweeper.start()
+    except Exception as e:
+        logger.error(f"Change feed sweeper not started: {e}")
+
+
+@router.on_event("shutdown")
+def _stop_synthesis_workers():
+    from signal_generation import ChangeFeedSweeper, SignalEvaluationQueue
+    from synthesis_jobs import stop_inprocess_workers
+    from synthesis_scheduler import SynthesisScheduler
+    ChangeFeedSweeper.stop()
+    SynthesisScheduler.stop()
+    stop_inprocess_workers()
+    SignalEvaluationQueue.stop()
+
+
 # =============================================================================
 # UTILITY
 # =============================================================================
@@ -680,54 +716,118 @@ def dashboard_overview():
 # SYNTHESIS TRIGGER ENDPOINTS
 # =============================================================================
 
-# In-memory job tracking (prototype; use Redis in production)
-_synthesis_jobs: dict = {}
-
-
 @router.post("/synthesis/trigger")
 def trigger_synthesis(
     project_id: str = Query(...),
     cycle_type: str = Query("morning_briefing"),
 ):
-    """Trigger a manual synthesis cycle. Returns immediately with job_id."""
-    import threading
-
-    job_id = str(__import__("uuid").uuid4())
-    _synthesis_jobs[job_id] = {"status": "running", "project_id": project_id, "cycle_type": cycle_type}
-
-    def _run():
-        try:
-            from synthesis_engine import SynthesisEngine
-            cycle_id = SynthesisEngine.run_cycle(project_id, cycle_type)
-            _synthesis_jobs[job_id] = {
-                "status": "completed",
-                "cycle_id": cycle_id,
-                "project_id": project_id,
-                "cycle_type": cycle_type,
-            }
-        except Exception as e:
-            _synthesis_jobs[job_id] = {
-                "status": "failed",
-                "error": str(e),
-                "project_id": project_id,
-            }
-            logger.error(f"Synthesis job {job_id} failed: {e}")
-
-    thread = threading.Thread(target=_run, daemon=True)
-    thread.start()
+    """Queue a manual synthesis cycle. Returns immediately with job_id.
 
-    return {"job_id": job_id, "status": "running"}
+    A request matching an already-queued job for the project coalesces into it.
+    """
+    from synthesis_jobs import CYCLE_TYPES, SynthesisJobQueue, PRIORITY_MANUAL
+    if cycle_type not in CYCLE_TYPES:
+        raise HTTPException(status_code=400, detail=f"cycle_type must be one of: {CYCLE_TYPES}")
+    job = SynthesisJobQueue.enqueue(project_id, cycle_type, priority=PRIORITY_MANUAL)
+    return job
 
 
 @router.get("/synthesis/status/{job_id}")
 def synthesis_status(job_id: str):
-    """Poll synthesis job status."""
-    job = _synthesis_jobs.get(job_id)
+    """Poll synthesis job status: queued, running, completed, failed."""
+    from synthesis_jobs import SynthesisJobQueue
+    job = SynthesisJobQueue.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    job["job_id"] = job["id"]
+    job["item_id"] = job["escalation_item_id"]
     return job
 
 
+@router.get("/synthesis/jobs")
+def list_synthesis_jobs(
+    project_id: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """Recent synthesis jobs, newest first."""
+    from synthesis_jobs import SynthesisJobQueue
+    return {"data": SynthesisJobQueue.list_jobs(project_id, status, limit)}
+
+
+@router.get("/synthesis/queue")
+def synthesis_queue_stats():
+    """Synthesis job queue depth and oldest runnable job age."""
+    from synthesis_jobs import SynthesisJobQueue
+    return {"data": SynthesisJobQueue.stats()}
+
+
+@router.get("/synthesis/schedule")
+def synthesis_schedule_status(limit: int = Query(50, ge=1, le=500)):
+    """Scheduler state and the most recent scheduled-cycle decisions."""
+    from synthesis_scheduler import SynthesisScheduler
+    return {"data": SynthesisScheduler.status(limit)}
+
+
+@router.post("/synthesis/schedule/tick")
+def synthesis_schedule_tick():
+    """Evaluate all project schedules now (normally runs every minute)."""
+    from synthesis_scheduler import SynthesisScheduler
+    return {"data": SynthesisScheduler.tick()}
+
+
+@router.put("/projects/{project_id}/synthesis-schedule")
+def update_synthesis_schedule(project_id: str, body: dict = Body(...)):
+    """Set a project's scheduler overrides.
+
+    Body: {timezone?, enabled?, morning_at?, midday_at?, end_of_day_at?} — times as "HH:MM".
+    Omitted fields are left unchanged; an explicit null clears the override
+    so the scheduler falls back to its default.
+    """
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+    tz = body.get("timezone")
+    if tz:
+        try:
+            ZoneInfo(tz)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise HTTPException(status_code=400, detail=f"Unknown time zone: {tz}")
+
+    enabled = body.get("enabled")
+    if enabled is not None and not isinstance(enabled, bool):
+        raise HTTPException(status_code=400, detail="enabled must be true or false")
+
+    time_fields = ("morning_at", "midday_at", "end_of_day_at")
+    for field in time_fields:
+        value = body.get(field)
+        if value is None:
+            continue
+        try:
+            datetime.strptime(value, "%H:%M")
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail=f"{field} must be \"HH:MM\", got {value!r}")
+
+    # Only fields present in the body are written on conflict; null clears them
+    overrides = [f for f in ("timezone",) + time_fields if f in body]
+    if enabled is not None:
+        overrides.append("enabled")
+    set_clause = ", ".join(f"{f} = EXCLUDED.{f}" for f in overrides + ["updated_at"])
+
+    with get_cursor() as cur:
+        cur.execute(f"""
+            INSERT INTO synthesis_schedules
+                (project_id, timezone, enabled, morning_at, midday_at, end_of_day_at, updated_at)
+            VALUES (%s, %s, COALESCE(%s, TRUE), %s, %s, %s, NOW())
+            ON CONFLICT (project_id) DO UPDATE SET {set_clause}
+            RETURNING project_id, timezone, enabled,
+                      morning_at::text, midday_at::text, end_of_day_at::text, updated_at
+        """, (
+            project_id, tz, enabled,
+            body.get("morning_at"), body.get("midday_at"), body.get("end_of_day_at"),
+        ))
+        return {"data": serialize_row(cur.fetchone())}
+
+
 @router.post("/synthesis/sweep")
 def trigger_signal_sweep(project_id: str = Query(...)):
     """Trigger a deterministic signal sweep for a project."""
@@ -759,10 +859,9 @@ def trigger_deep_dive(
     """Trigger an escalation review synthesis for a specific intelligence item.
 
     Queues an escalation_review cycle focused on the given item and its related
-    signals/items. Returns a job_id for polling via /synthesis/status/{job_id}.
+    signals/items at deep-dive priority (ahead of manual and scheduled cycles).
+    Returns a job_id for polling via /synthesis/status/{job_id}.
     """
-    import threading
-
     # Validate item exists and get its project_id
     with get_cursor() as cur:
         cur.execute(
@@ -774,40 +873,14 @@ def trigger_deep_dive(
             raise HTTPException(status_code=404, detail="Intelligence item not found")
         project_id = str(row["project_id"])
 
-    job_id = str(__import__("uuid").uuid4())
-    _synthesis_jobs[job_id] = {
-        "status": "running",
-        "project_id": project_id,
-        "cycle_type": "escalation_review",
-        "item_id": item_id,
-    }
-
-    def _run():
-        try:
-            from synthesis_engine import SynthesisEngine
-            cycle_id = SynthesisEngine.run_cycle(
-                project_id, "escalation_review", escalation_item_id=item_id
-            )
-            _synthesis_jobs[job_id] = {
-                "status": "completed",
-                "cycle_id": cycle_id,
-                "project_id": project_id,
-                "cycle_type": "escalation_review",
-                "item_id": item_id,
-            }
-        except Exception as e:
-            _synthesis_jobs[job_id] = {
-                "status": "failed",
-                "error": str(e),
-                "project_id": project_id,
-                "item_id": item_id,
-            }
-            logger.error(f"Deep dive job {job_id} failed: {e}")
-
-    thread = threading.Thread(target=_run, daemon=True)
-    thread.start()
-
-    return {"job_id": job_id, "status": "running", "item_id": item_id}
+    from synthesis_jobs import SynthesisJobQueue, PRIORITY_DEEP_DIVE
+    job = SynthesisJobQueue.enqueue(
+        project_id, "escalation_review",
+        escalation_item_id=item_id,
+        priority=PRIORITY_DEEP_DIVE,
+        requested_by="deep_dive",
+    )
+    return {**job, "item_id": item_id}
 
 
 @router.post("/documents/refire-signals")
@@ -883,6 +956,82 @@ def signal_stats(project_id: Optional[str] = Query(None)):
         }
 
 
+@router.post("/signals/evaluate", status_code=202)
+def enqueue_signal_evaluation(body: dict = Body(...)):
+    """Queue a Procore event for async LLM signal evaluation.
+
+    Body: {project_id, event_data}. Returns 503 when the queue is full.
+    """
+    project_id = body.get("project_id")
+    event_data = body.get("event_data")
+    if not project_id or not isinstance(event_data, dict):
+        raise HTTPException(status_code=400, detail="project_id and event_data required")
+
+    from signal_generation import SignalEvaluationQueue
+    if not SignalEvaluationQueue.submit(event_data, project_id):
+        raise HTTPException(status_code=503, detail="Signal evaluation queue is full")
+    return {"status": "queued", "queue": SignalEvaluationQueue.stats()}
+
+
+@router.get("/signals/queue")
+def signal_queue_stats():
+    """Async signal evaluation queue depth and worker throughput."""
+    from signal_generation import SignalEvaluationQueue
+    return {"data": SignalEvaluationQueue.stats()}
+
+
+@router.get("/signals/change-feed")
+def signal_change_feed_stats():
+    """Targeted sweeps run off sync_agent's change feed."""
+    from signal_generation import ChangeFeedSweeper
+    return {"data": ChangeFeedSweeper.stats()}
+
+
+@router.get("/signals/llm-cache")
+def signal_llm_cache_stats():
+    """Hit/miss counters and size of the parsed LLM output cache."""
+    from signal_generation import LLMResultCache
+    return {"data": LLMResultCache.stats()}
+
+
+# =============================================================================
+# EVENT STREAM (LISTEN/NOTIFY push channel)
+# =============================================================================
+
+@router.get("/stream")
+async def stream_events(request: Request, project_id: Optional[str] = Query(None)):
+    """Server-Sent Events feed of signal, intelligence item, radar and synthesis events.
+
+    Event types: signal.created, signal.updated, item.<created|updated|reinforced|
+    downgraded|resolved|archived|merged>, radar.match, synthesis.<completed|failed>,
+    stream.reconnected (re-fetch lists — events may have been missed).
+    """
+    from event_stream import sse_events
+    return StreamingResponse(
+        sse_events(project_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/stream")
+async def stream_events_ws(websocket: WebSocket, project_id: Optional[str] = None):
+    """WebSocket variant of /api/stream — same events, one JSON message each."""
+    from event_stream import websocket_events
+    await websocket.accept()
+    try:
+        await websocket_events(websocket, project_id)
+    except WebSocketDisconnect:
+        pass
+
+
+@router.get("/stream/stats")
+def stream_stats():
+    """Event broker subscriber and delivery counters."""
+    from event_stream import EventBroker
+    return {"data": EventBroker.stats()}
+
+
 # =============================================================================
 # CC-2.5: REINFORCEMENT CANDIDATE PIPELINE
 # =============================================================================
@@ -0,0 +1,229 @@
+"""SteelSync Event Stream — Postgres LISTEN/NOTIFY fan-out for the Command Center.
+
+Implements:
+- publish(): NOTIFY a small JSON event inside the writer's transaction, so it
+  is delivered only if (and when) that transaction commits
+- EventBroker: one LISTEN connection per process, fanned out to per-client
+  asyncio queues filtered by project
+- SSE and WebSocket helpers used by /api/stream
+"""
+
+import asyncio
+import json
+import logging
+import os
+import select
+import threading
+import time
+from typing import AsyncIterator, Dict, Optional, Set
+
+import psycopg2
+import psycopg2.extensions
+
+from steelsync_db import DB_NAME, DB_USER, DB_HOST, DB_PORT
+
+logger = logging.getLogger("steelsync.stream")
+
+EVENT_CHANNEL = os.environ.get("STEELSYNC_EVENT_CHANNEL", "steelsync_events")
+STREAM_HEARTBEAT_SECONDS = float(os.environ.get("STREAM_HEARTBEAT_SECONDS", "15"))
+STREAM_CLIENT_BUFFER = int(os.environ.get("STREAM_CLIENT_BUFFER", "256"))
+
+# pg_notify payloads are capped at 8000 bytes; stay well under it
+MAX_PAYLOAD_BYTES = 7500
+
+
+# =============================================================================
+# PUBLISH
+# =============================================================================
+
+def publish(cur, event_type: str, project_id, entity_id=None, data: Optional[Dict] = None):
+    """Queue a NOTIFY on EVENT_CHANNEL using the caller's cursor.
+
+    Postgres holds notifications until COMMIT and drops them on ROLLBACK, so
+    subscribers never see events for writes that didn't land. Failures are
+    logged, never raised — the stream is best-effort, the write is not.
+    """
+    event = {
+        "type": event_type,
+        "project_id": str(project_id) if project_id else None,
+        "id": str(entity_id) if entity_id else None,
+        "ts": time.time(),
+        "data": data or {},
+    }
+    payload = json.dumps(event, default=str)
+    if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+        event["data"] = {"truncated": True}
+        payload = json.dumps(event, default=str)
+
+    try:
+        cur.execute("SAVEPOINT steelsync_notify")
+        cur.execute("SELECT pg_notify(%s, %s)", (EVENT_CHANNEL, payload))
+        cur.execute("RELEASE SAVEPOINT steelsync_notify")
+    except Exception as e:
+        logger.warning(f"Event publish failed ({event_type}): {e}")
+        try:
+            cur.execute("ROLLBACK TO SAVEPOINT steelsync_notify")
+        except Exception:
+            pass  # transaction already aborted by an earlier statement
+
+
+# =============================================================================
+# BROKER
+# =============================================================================
+
+class Subscription:
+    """A single client's view of the stream."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, project_id: Optional[str] = None):
+        self.loop = loop
+        self.project_id = str(project_id) if project_id else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_CLIENT_BUFFER)
+        self.dropped = 0
+
+    def matches(self, event: Dict) -> bool:
+        # Events without a project (stream control) go to everyone
+        return self.project_id is None or event.get("project_id") in (None, self.project_id)
+
+    def offer(self, event: Dict):
+        """Runs on the subscriber's loop. Slow clients lose the oldest events."""
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+
+class EventBroker:
+    """Single LISTEN connection per process, fanned out to subscribers.
+
+    The listener runs on a daemon thread and reconnects with backoff if the
+    connection drops. Events that arrive while it is reconnecting are lost;
+    clients should re-fetch lists on the "stream.reconnected" event.
+    """
+
+    _lock = threading.Lock()
+    _subscribers: Set[Subscription] = set()
+    _thread: Optional[threading.Thread] = None
+    _stats = {"received": 0, "delivered": 0, "reconnects": 0}
+
+    @classmethod
+    def start(cls):
+        with cls._lock:
+            if cls._thread and cls._thread.is_alive():
+                return
+            cls._thread = threading.Thread(target=cls._listen_forever, name="event-broker", daemon=True)
+            cls._thread.start()
+        logger.info(f"Event broker listening on channel '{EVENT_CHANNEL}'")
+
+    @classmethod
+    def subscribe(cls, project_id: Optional[str] = None) -> Subscription:
+        cls.start()
+        sub = Subscription(asyncio.get_running_loop(), project_id)
+        with cls._lock:
+            cls._subscribers.add(sub)
+        return sub
+
+    @classmethod
+    def unsubscribe(cls, sub: Subscription):
+        with cls._lock:
+            cls._subscribers.discard(sub)
+
+    @classmethod
+    def stats(cls) -> Dict:
+        with cls._lock:
+            subscribers = len(cls._subscribers)
+        return {
+            "channel": EVENT_CHANNEL,
+            "listening": bool(cls._thread and cls._thread.is_alive()),
+            "subscribers": subscribers,
+            **cls._stats,
+        }
+
+    @classmethod
+    def _dispatch(cls, event: Dict):
+        cls._stats["received"] += 1
+        with cls._lock:
+            targets = [s for s in cls._subscribers if s.matches(event)]
+        for sub in targets:
+            try:
+                sub.loop.call_soon_threadsafe(sub.offer, event)
+                cls._stats["delivered"] += 1
+            except RuntimeError:
+                # Subscriber's loop is closed — client is gone
+                cls.unsubscribe(sub)
+
+    @classmethod
+    def _listen_forever(cls):
+        backoff = 1.0
+        first = True
+        while True:
+            conn = None
+            try:
+                conn = psycopg2.connect(dbname=DB_NAME, user=DB_USER, host=DB_HOST, port=DB_PORT)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {EVENT_CHANNEL}")
+                if not first:
+                    cls._stats["reconnects"] += 1
+                    cls._dispatch({"type": "stream.reconnected", "project_id": None, "ts": time.time()})
+                first = False
+                backoff = 1.0
+
+                while True:
+                    if select.select([conn], [], [], 5.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        note = conn.notifies.pop(0)
+                        try:
+                            cls._dispatch(json.loads(note.payload))
+                        except json.JSONDecodeError:
+                            logger.warning(f"Dropping malformed event payload: {note.payload[:200]}")
+            except Exception as e:
+                logger.error(f"Event listener error, reconnecting in {backoff:.0f}s: {e}")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60.0)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+# =============================================================================
+# CLIENT HELPERS
+# =============================================================================
+
+async def sse_events(project_id: Optional[str], is_disconnected) -> AsyncIterator[str]:
+    """Yield Server-Sent Events frames until the client disconnects."""
+    sub = EventBroker.subscribe(project_id)
+    try:
+        yield f"event: stream.open\ndata: {json.dumps({'project_id': sub.project_id})}\n\n"
+        while not await is_disconnected():
+            try:
+                event = await asyncio.wait_for(sub.queue.get(), STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: {event.get('type', 'message')}\ndata: {json.dumps(event, default=str)}\n\n"
+    finally:
+        EventBroker.unsubscribe(sub)
+
+
+async def websocket_events(websocket, project_id: Optional[str]):
+    """Push events to an accepted WebSocket until it closes."""
+    sub = EventBroker.subscribe(project_id)
+    try:
+        await websocket.send_json({"type": "stream.open", "project_id": sub.project_id})
+        while True:
+            try:
+                event = await asyncio.wait_for(sub.queue.get(), STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                await websocket.send_json({"type": "keepalive", "ts": time.time()})
+                continue
+            await websocket.send_json(event)
+    finally:
+        EventBroker.unsubscribe(sub)
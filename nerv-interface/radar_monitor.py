@@ -16,6 +16,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
+from event_stream import publish
 from steelsync_db import get_cursor, serialize_row, serialize_rows
 
 logger = logging.getLogger("steelsync.radar")
@@ -290,6 +291,15 @@ def emit_radar_match(
                 match_result["relevance_score"],
             ))
 
+        publish(cur, "radar.match", project_id, radar_item["id"], {
+            "radar_title": radar_item.get("title"),
+            "signal_id": signal_id,
+            "source_signal_id": str(signal["id"]),
+            "relevance_score": match_result["relevance_score"],
+            "severity": match_result["severity"],
+            "summary": match_result["relevance_summary"][:500],
+        })
+
     logger.info(
         f"Radar match: signal {signal['id']} → radar {radar_item['id']} "
         f"(score={match_result['relevance_score']}, severity={match_result['severity']})"
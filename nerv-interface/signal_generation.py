@@ -7,15 +7,24 @@ Implements:
 - Sweep function to run all detectors for a project
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import select
+import threading
+import time
 from datetime import datetime, timedelta, date
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from steelsync_db import get_cursor, serialize_row, serialize_rows
+import psycopg2
+import psycopg2.extensions
+
+from event_stream import publish
+from steelsync_db import DB_HOST, DB_NAME, DB_PORT, DB_USER, get_cursor, serialize_row, serialize_rows
 
 logger = logging.getLogger("steelsync.signals")
 
@@ -31,6 +40,22 @@ ALLOWED_INGESTION_CATEGORIES = {
 OLLAMA_HOST = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_MODEL = os.environ.get("SIGNAL_LLM_MODEL", "deepseek-r1:8b")
 
+# Async evaluation queue (webhook bursts drain through a worker pool, not serially)
+SIGNAL_LLM_WORKERS = int(os.environ.get("SIGNAL_LLM_WORKERS", "4"))
+SIGNAL_QUEUE_MAXSIZE = int(os.environ.get("SIGNAL_QUEUE_MAXSIZE", "1000"))
+SIGNAL_SUMMARY_CACHE_TTL = float(os.environ.get("SIGNAL_SUMMARY_CACHE_TTL", "300"))
+
+# Persistent cache of parsed LLM outputs (llm_signal_cache table)
+SIGNAL_LLM_CACHE_TTL_HOURS = int(os.environ.get("SIGNAL_LLM_CACHE_TTL_HOURS", "168"))
+SIGNAL_LLM_CACHE_MAX_ROWS = int(os.environ.get("SIGNAL_LLM_CACHE_MAX_ROWS", "20000"))
+
+# Targeted sweeps off sync_agent's change feed (sync_changes + NOTIFY)
+SIGNAL_CHANGE_FEED_ENABLED = os.environ.get("SIGNAL_CHANGE_FEED_ENABLED", "true").lower() == "true"
+CHANGE_CHANNEL = os.environ.get("EVA00_CHANGE_CHANNEL", "eva00_changes")
+CHANGE_FEED_BATCH = 1000
+CHANGE_FEED_DEBOUNCE_SECONDS = 2.0  # let a sync pass's batches land before sweeping
+CHANGE_FEED_POLL_SECONDS = 60.0     # drain anyway, in case a NOTIFY was missed
+
 
 # =============================================================================
 # SIGNAL WRITER
@@ -88,8 +113,10 @@ class SignalWriter:
         source_multiplier = max(0.0, min(1.0, source_multiplier))
         effective_weight = round(confidence * strength * source_multiplier, 2)
 
+        signal_id = None
         with get_cursor() as cur:
             # Deduplication check: same source_document_id + signal_type within 1 hour
+            existing = None
             if source_document_id:
                 cur.execute("""
                     SELECT id, supporting_context_json FROM signals
@@ -98,81 +125,122 @@ class SignalWriter:
                       AND created_at > NOW() - INTERVAL '1 hour'
                     LIMIT 1
                 """, (source_document_id, signal_type))
-
                 existing = cur.fetchone()
-                if existing:
-                    # Check if new signal has additional context
-                    if supporting_context and existing["supporting_context_json"]:
-                        existing_ctx = existing["supporting_context_json"]
-                        if isinstance(existing_ctx, str):
-                            existing_ctx = json.loads(existing_ctx)
-                        new_keys = set(supporting_context.keys()) - set(existing_ctx.keys())
-                        if new_keys:
-                            # Merge new context into existing signal
-                            merged = {**existing_ctx, **supporting_context}
-                            cur.execute("""
-                                UPDATE signals SET supporting_context_json = %s
-                                WHERE id = %s
-                            """, (json.dumps(merged), existing["id"]))
-                            logger.info(
-                                f"Merged context into existing signal {existing['id']} "
-                                f"(new keys: {new_keys})"
-                            )
-                            return str(existing["id"])
+
+            if existing:
+                # Check if new signal has additional context
+                new_keys = set()
+                if supporting_context and existing["supporting_context_json"]:
+                    existing_ctx = existing["supporting_context_json"]
+                    if isinstance(existing_ctx, str):
+                        existing_ctx = json.loads(existing_ctx)
+                    new_keys = set(supporting_context.keys()) - set(existing_ctx.keys())
+                if new_keys:
+                    # Merge new context into existing signal
+                    merged = {**existing_ctx, **supporting_context}
+                    cur.execute("""
+                        UPDATE signals SET supporting_context_json = %s
+                        WHERE id = %s
+                    """, (json.dumps(merged), existing["id"]))
+                    logger.info(
+                        f"Merged context into existing signal {existing['id']} "
+                        f"(new keys: {new_keys})"
+                    )
+                    signal_id = str(existing["id"])
+                    publish(cur, "signal.updated", project_id, signal_id, {"signal_type": signal_type})
+                else:
                     logger.info(
                         f"Dedup: skipping duplicate signal {signal_type} for "
                         f"source_document_id={source_document_id}"
                     )
-                    return None
-
-            # Write the signal
-            signal_id = str(uuid4())
-            cur.execute("""
-                INSERT INTO signals (
-                    id, project_id, source_type, source_document_id,
+            else:
+                # Write the signal
+                signal_id = str(uuid4())
+                cur.execute("""
+                    INSERT INTO signals (
+                        id, project_id, source_type, source_document_id,
+                        signal_type, signal_category, summary,
+                        confidence, strength, effective_weight,
+                        decay_profile, entity_type, entity_value,
+                        supporting_context_json
+                    ) VALUES (
+                        %s, %s, %s::signal_source_type, %s,
+                        %s, %s::signal_category, %s,
+                        %s, %s, %s,
+                        %s::decay_profile, %s, %s,
+                        %s
+                    )
+                """, (
+                    signal_id, project_id, source_type, source_document_id,
                     signal_type, signal_category, summary,
                     confidence, strength, effective_weight,
                     decay_profile, entity_type, entity_value,
-                    supporting_context_json
-                ) VALUES (
-                    %s, %s, %s::signal_source_type, %s,
-                    %s, %s::signal_category, %s,
-                    %s, %s, %s,
-                    %s::decay_profile, %s, %s,
-                    %s
+                    json.dumps(supporting_context) if supporting_context else None,
+                ))
+
+                publish(cur, "signal.created", project_id, signal_id, {
+                    "signal_type": signal_type,
+                    "signal_category": signal_category,
+                    "summary": summary[:500],
+                    "effective_weight": effective_weight,
+                    "entity_type": entity_type,
+                    "entity_value": entity_value,
+                })
+
+                logger.info(
+                    f"Signal written: {signal_type} [{signal_category}] "
+                    f"project={project_id} confidence={confidence} weight={effective_weight}"
                 )
-            """, (
-                signal_id, project_id, source_type, source_document_id,
-                signal_type, signal_category, summary,
-                confidence, strength, effective_weight,
-                decay_profile, entity_type, entity_value,
-                json.dumps(supporting_context) if supporting_context else None,
-            ))
-
-            logger.info(
-                f"Signal written: {signal_type} [{signal_category}] "
-                f"project={project_id} confidence={confidence} weight={effective_weight}"
-            )
-            return signal_id
+
+        # Invalidate after commit so a concurrent reader can't re-cache the old summary
+        if signal_id:
+            invalidate_active_signal_summary(project_id)
+        return signal_id
+
+
+# =============================================================================
+# ACTIVE SIGNAL SUMMARY CACHE
+# =============================================================================
+
+# project_id -> (limit, built_at monotonic, summary text, ((signal id, event fingerprint), ...))
+_active_summary_cache: Dict[str, Tuple[int, float, str, Tuple]] = {}
+_active_summary_lock = threading.Lock()
+# Bumped on every invalidation so a summary built from a pre-write read is never stored
+_active_summary_generation = 0
+
+
+def invalidate_active_signal_summary(project_id: Optional[str] = None):
+    """Drop the cached active-signal summary for a project (or all projects).
+
+    Call after any write that adds, archives, resolves or re-weights signals.
+    """
+    global _active_summary_generation
+    with _active_summary_lock:
+        _active_summary_generation += 1
+        if project_id is None:
+            _active_summary_cache.clear()
+        else:
+            _active_summary_cache.pop(str(project_id), None)
 
 
 # =============================================================================
 # CC-2.1: DETERMINISTIC SIGNAL DETECTORS
 # =============================================================================
 
-def detect_rfis_overdue(project_id: str) -> int:
-    """Detect RFIs that are past their due date and still open."""
+def detect_rfis_overdue(project_id: str, ids: Optional[List[str]] = None) -> int:
+    """Detect RFIs that are past their due date and still open (only `ids`, if given)."""
     count = 0
     with get_cursor() as cur:
         cur.execute("""
             SELECT id, number, subject, due_date, date_initiated, status
             FROM rfis
             WHERE project_id = %s
+              AND (%s::uuid[] IS NULL OR id = ANY(%s::uuid[]))
               AND is_deleted = FALSE
               AND status NOT IN ('closed', 'answered', 'void')
               AND due_date IS NOT NULL
               AND due_date < CURRENT_DATE
-        """, (project_id,))
+        """, (project_id, ids, ids))
 
         for rfi in cur.fetchall():
             days_overdue = (date.today() - rfi["due_date"]).days
@@ -203,18 +271,19 @@ def detect_rfis_overdue(project_id: str) -> int:
     return count
 
 
-def detect_submittals_rejected(project_id: str) -> int:
-    """Detect submittals that have been rejected."""
+def detect_submittals_rejected(project_id: str, ids: Optional[List[str]] = None) -> int:
+    """Detect submittals that have been rejected (only `ids`, if given)."""
     count = 0
     with get_cursor() as cur:
         cur.execute("""
             SELECT id, number, title, status, spec_section_number, updated_at
             FROM submittals
             WHERE project_id = %s
+              AND (%s::uuid[] IS NULL OR id = ANY(%s::uuid[]))
               AND is_deleted = FALSE
               AND status = 'rejected'
               AND updated_at > NOW() - INTERVAL '72 hours'
-        """, (project_id,))
+        """, (project_id, ids, ids))
 
         for sub in cur.fetchall():
             sid = SignalWriter.write(
@@ -370,19 +439,20 @@ def detect_change_order_status_changed(project_id: str) -> int:
     return count
 
 
-def detect_submittals_overdue(project_id: str) -> int:
-    """Detect submittals past their required date."""
+def detect_submittals_overdue(project_id: str, ids: Optional[List[str]] = None) -> int:
+    """Detect submittals past their required date (only `ids`, if given)."""
     count = 0
     with get_cursor() as cur:
         cur.execute("""
             SELECT id, number, title, required_date, submitted_date, status, spec_section_number
             FROM submittals
             WHERE project_id = %s
+              AND (%s::uuid[] IS NULL OR id = ANY(%s::uuid[]))
               AND is_deleted = FALSE
               AND status NOT IN ('approved', 'approved_as_noted', 'closed', 'void')
               AND required_date IS NOT NULL
               AND required_date < CURRENT_DATE
-        """, (project_id,))
+        """, (project_id, ids, ids))
 
         for sub in cur.fetchall():
             days_overdue = (date.today() - sub["required_date"]).days
@@ -422,12 +492,53 @@ def _get_onboarding_phase(project_id: str) -> str:
         return row["onboarding_phase"] if row else "live"
 
 
+DETERMINISTIC_DETECTORS = [
+    ("rfis_overdue", detect_rfis_overdue),
+    ("submittals_rejected", detect_submittals_rejected),
+    ("submittals_overdue", detect_submittals_overdue),
+    ("daily_log_missing", detect_daily_log_missing),
+    ("schedule_milestones_approaching", detect_schedule_milestones_approaching),
+    ("change_order_status_changed", detect_change_order_status_changed),
+]
+
+# sync_changes entity_type → detectors that read it; each accepts ids= to scope to those rows
+ENTITY_DETECTORS = {
+    "rfi": ["rfis_overdue"],
+    "submittal": ["submittals_rejected", "submittals_overdue"],
+}
+
+
 def run_deterministic_sweep(project_id: str) -> Dict[str, int]:
     """Run all deterministic detectors for a project.
 
     Returns dict of detector_name -> signal_count.
     Respects onboarding phase: skips during historical_ingest.
     """
+    return _run_detectors(project_id, [(name, detector, {}) for name, detector in DETERMINISTIC_DETECTORS])
+
+
+def run_targeted_sweep(project_id: str, changed: Dict[str, List[str]]) -> Dict[str, int]:
+    """Run only the detectors that read the changed entity types, scoped to the changed rows.
+
+    `changed` maps a sync_changes entity_type ('rfi', 'submittal') to entity UUIDs.
+    """
+    detectors = dict(DETERMINISTIC_DETECTORS)
+    scoped = {}
+    for entity_type, ids in changed.items():
+        for name in ENTITY_DETECTORS.get(entity_type, []):
+            scoped.setdefault(name, set()).update(ids)
+    if not scoped:
+        return {}
+    return _run_detectors(project_id, [(name, detectors[name], {"ids": sorted(ids)})
+                                       for name, ids in scoped.items()], targeted=True)
+
+
+def _run_detectors(project_id: str, detectors: List[Tuple], targeted: bool = False) -> Dict[str, int]:
+    """Run (name, detector, kwargs) entries for a project, honouring its onboarding phase.
+
+    A failed detector is logged and reported as -1. Targeted sweeps then raise,
+    so the change-feed batch that asked for them rolls back and is retried.
+    """
     # Check onboarding phase
     phase = _get_onboarding_phase(project_id)
     if phase == "historical_ingest":
@@ -435,21 +546,13 @@ def run_deterministic_sweep(project_id: str) -> Dict[str, int]:
         return {"skipped": True, "reason": "historical_ingest"}
 
     is_calibration = (phase == "calibration")
-    logger.info(f"Running deterministic signal sweep for project {project_id} (phase={phase})")
+    kind = "targeted" if targeted else "deterministic"
+    logger.info(f"Running {kind} signal sweep for project {project_id} (phase={phase})")
     results = {}
 
-    detectors = [
-        ("rfis_overdue", detect_rfis_overdue),
-        ("submittals_rejected", detect_submittals_rejected),
-        ("submittals_overdue", detect_submittals_overdue),
-        ("daily_log_missing", detect_daily_log_missing),
-        ("schedule_milestones_approaching", detect_schedule_milestones_approaching),
-        ("change_order_status_changed", detect_change_order_status_changed),
-    ]
-
-    for name, detector in detectors:
+    for name, detector, kwargs in detectors:
         try:
-            count = detector(project_id)
+            count = detector(project_id, **kwargs)
             results[name] = count
         except Exception as e:
             logger.error(f"Detector {name} failed: {e}", exc_info=True)
@@ -472,9 +575,165 @@ def run_deterministic_sweep(project_id: str) -> Dict[str, int]:
 
     total = sum(v for v in results.values() if v > 0)
     logger.info(f"Sweep complete: {total} total signals generated. Details: {results}")
+    failed = [name for name, count in results.items() if count == -1]
+    if targeted and failed:
+        # SignalWriter dedups, so the retry doesn't duplicate what the others wrote
+        raise RuntimeError(f"Targeted sweep for {project_id} failed in: {', '.join(failed)}")
     return results
 
 
+# =============================================================================
+# LLM RESULT CACHE
+# =============================================================================
+
+# Delivery metadata that differs between re-deliveries of the same Procore event
+_VOLATILE_EVENT_KEYS = {"ulid", "timestamp", "delivered_at", "delivery_id", "received_at", "attempt"}
+# Classification fields rewritten by refire_signals_for_document (not LLM input that matters)
+_VOLATILE_CLASSIFICATION_KEYS = {"project_match_confidence"}
+
+
+class LLMResultCache:
+    """Persistent cache of parsed LLM signal outputs (llm_signal_cache table).
+
+    Keyed on sha256 of (event fingerprint, active-signal digest). The
+    fingerprint hashes model, prompt version, project and normalized event
+    payload. The digest covers the active signal IDs the prompt was built
+    from, except the signals this same event wrote, which carry the
+    fingerprint in their supporting context. Replayed webhooks and re-fired
+    documents therefore hit, but a changed active set misses.
+    Bump SIGNAL_PROMPT_VERSION to invalidate every entry. Entries expire after
+    SIGNAL_LLM_CACHE_TTL_HOURS; the table is trimmed to SIGNAL_LLM_CACHE_MAX_ROWS
+    least-recently-used rows. Cache failures are logged and treated as misses.
+    """
+
+    PRUNE_EVERY = 100  # puts between prune passes
+
+    _lock = threading.Lock()
+    _counters = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0, "errors": 0}
+
+    @classmethod
+    def _count(cls, name: str, n: int = 1):
+        with cls._lock:
+            cls._counters[name] += n
+
+    @staticmethod
+    def event_fingerprint(model: str, prompt_version: str, project_id: str, event_data: Dict) -> str:
+        payload = {k: v for k, v in event_data.items() if k not in _VOLATILE_EVENT_KEYS}
+        if isinstance(payload.get("classification"), dict):
+            payload["classification"] = {
+                k: v for k, v in payload["classification"].items()
+                if k not in _VOLATILE_CLASSIFICATION_KEYS
+            }
+        normalized = json.dumps(
+            [model, prompt_version, str(project_id), payload],
+            sort_keys=True, separators=(",", ":"), default=str,
+        )
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    @staticmethod
+    def make_key(fingerprint: str, active_digest: str) -> str:
+        return hashlib.sha256(f"{fingerprint}:{active_digest}".encode()).hexdigest()
+
+    @classmethod
+    def get(cls, cache_key: str) -> Optional[Dict]:
+        """Return the cached parsed output for a key, or None on miss."""
+        try:
+            with get_cursor() as cur:
+                cur.execute("""
+                    UPDATE llm_signal_cache SET
+                        hit_count = hit_count + 1,
+                        last_hit_at = NOW()
+                    WHERE cache_key = %s AND expires_at > NOW()
+                    RETURNING parsed_json
+                """, (cache_key,))
+                row = cur.fetchone()
+        except Exception as e:
+            cls._count("errors")
+            logger.warning(f"LLM cache lookup failed: {e}")
+            return None
+
+        if not row:
+            cls._count("misses")
+            return None
+        cls._count("hits")
+        parsed = row["parsed_json"]
+        return json.loads(parsed) if isinstance(parsed, str) else parsed
+
+    @classmethod
+    def put(cls, cache_key: str, project_id: str, parsed: Dict):
+        """Store a parsed LLM output, refreshing TTL if the key already exists."""
+        try:
+            with get_cursor() as cur:
+                cur.execute("""
+                    INSERT INTO llm_signal_cache
+                        (cache_key, project_id, model, prompt_version, parsed_json, expires_at)
+                    VALUES (%s, %s, %s, %s, %s, NOW() + make_interval(hours => %s))
+                    ON CONFLICT (cache_key) DO UPDATE SET
+                        parsed_json = EXCLUDED.parsed_json,
+                        expires_at = EXCLUDED.expires_at
+                """, (
+                    cache_key, project_id, OLLAMA_MODEL,
+                    SignalGenerationService.SIGNAL_PROMPT_VERSION,
+                    json.dumps(parsed), SIGNAL_LLM_CACHE_TTL_HOURS,
+                ))
+        except Exception as e:
+            cls._count("errors")
+            logger.warning(f"LLM cache write failed: {e}")
+            return
+
+        cls._count("writes")
+        if cls._counters["writes"] % cls.PRUNE_EVERY == 0:
+            cls.prune()
+
+    @classmethod
+    def prune(cls) -> int:
+        """Delete expired entries, then LRU rows beyond SIGNAL_LLM_CACHE_MAX_ROWS."""
+        try:
+            with get_cursor() as cur:
+                cur.execute("DELETE FROM llm_signal_cache WHERE expires_at <= NOW()")
+                evicted = cur.rowcount
+                cur.execute("""
+                    DELETE FROM llm_signal_cache
+                    WHERE cache_key IN (
+                        SELECT cache_key FROM llm_signal_cache
+                        ORDER BY COALESCE(last_hit_at, created_at) DESC
+                        OFFSET %s
+                    )
+                """, (SIGNAL_LLM_CACHE_MAX_ROWS,))
+                evicted += cur.rowcount
+        except Exception as e:
+            cls._count("errors")
+            logger.warning(f"LLM cache prune failed: {e}")
+            return 0
+
+        if evicted:
+            cls._count("evicted", evicted)
+            logger.info(f"LLM cache pruned {evicted} entries")
+        return evicted
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Process-local hit/miss counters plus table size."""
+        with cls._lock:
+            counters = dict(cls._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = round(counters["hits"] / lookups, 3) if lookups else None
+        try:
+            with get_cursor() as cur:
+                cur.execute("""
+                    SELECT COUNT(*) AS entries,
+                           COALESCE(SUM(hit_count), 0) AS lifetime_hits
+                    FROM llm_signal_cache
+                    WHERE expires_at > NOW()
+                """)
+                counters.update(cur.fetchone())
+        except Exception as e:
+            logger.warning(f"LLM cache stats query failed: {e}")
+        counters["ttl_hours"] = SIGNAL_LLM_CACHE_TTL_HOURS
+        counters["max_rows"] = SIGNAL_LLM_CACHE_MAX_ROWS
+        return counters
+
+
 # =============================================================================
 # CC-2.2: LLM-BASED SIGNAL GENERATION SERVICE
 # =============================================================================
@@ -482,6 +741,10 @@ def run_deterministic_sweep(project_id: str) -> Dict[str, int]:
 class SignalGenerationService:
     """Processes data items through LLM-based signal detection."""
 
+    # Bump whenever SIGNAL_PROMPT_TEMPLATE or _parse_llm_response changes —
+    # it is part of the LLM result cache key.
+    SIGNAL_PROMPT_VERSION = "2.2.1"
+
     SIGNAL_PROMPT_TEMPLATE = """You are a construction project intelligence signal detector. Analyze the following project event data and identify any signals that warrant tracking.
 
 PROJECT CONTEXT:
@@ -530,12 +793,28 @@ Return ONLY valid JSON in this format:
 }"""
 
     @staticmethod
-    def _get_active_signal_summary(project_id: str, limit: int = 50) -> str:
-        """Build summary of active signals for LLM context."""
+    def _get_active_signal_context(project_id: str, limit: int = 50) -> Tuple[str, Tuple]:
+        """Build summary of active signals for LLM context, plus the set's members.
+
+        Members are (signal id, event fingerprint) pairs; the fingerprint is
+        set on signals written from an LLM evaluation (see _active_digest).
+
+        Cached per project for SIGNAL_SUMMARY_CACHE_TTL seconds; SignalWriter
+        and the archive/decay paths invalidate the entry on write.
+        """
+        key = str(project_id)
+        with _active_summary_lock:
+            cached = _active_summary_cache.get(key)
+            generation = _active_summary_generation
+        if cached and cached[0] == limit and time.monotonic() - cached[1] < SIGNAL_SUMMARY_CACHE_TTL:
+            return cached[2], cached[3]
+
+        built_at = time.monotonic()
         with get_cursor() as cur:
             cur.execute("""
                 SELECT id, signal_type, signal_category, summary, effective_weight,
-                       entity_type, entity_value, created_at
+                       entity_type, entity_value, created_at,
+                       supporting_context_json->>'event_fingerprint' AS event_fingerprint
                 FROM signals
                 WHERE project_id = %s
                   AND archived_at IS NULL
@@ -545,16 +824,32 @@ Return ONLY valid JSON in this format:
             """, (project_id, limit))
 
             signals = cur.fetchall()
-            if not signals:
-                return "No active signals."
-
-            lines = []
-            for s in signals:
-                lines.append(
-                    f"- [{s['signal_category']}] {s['signal_type']}: {s['summary']} "
-                    f"(weight={s['effective_weight']}, entity={s['entity_type']}:{s['entity_value']})"
-                )
-            return "\n".join(lines)
+
+        if not signals:
+            summary = "No active signals."
+        else:
+            summary = "\n".join(
+                f"- [{s['signal_category']}] {s['signal_type']}: {s['summary']} "
+                f"(weight={s['effective_weight']}, entity={s['entity_type']}:{s['entity_value']})"
+                for s in signals
+            )
+        members = tuple((str(s["id"]), s["event_fingerprint"]) for s in signals)
+
+        with _active_summary_lock:
+            # An invalidation that landed while we were querying wins
+            if generation == _active_summary_generation:
+                _active_summary_cache[key] = (limit, built_at, summary, members)
+        return summary, members
+
+    @staticmethod
+    def _active_digest(members: Tuple, fingerprint: str) -> str:
+        """Digest of the active signal IDs, leaving out the ones this event wrote.
+
+        Without the exclusion an evaluation's own signals would change the
+        digest, and a replay of the same event could never hit the cache.
+        """
+        ids = sorted(sid for sid, fp in members if fp != fingerprint)
+        return hashlib.sha256(",".join(ids).encode()).hexdigest()
 
     @staticmethod
     def _call_ollama(prompt: str) -> Optional[str]:
@@ -581,6 +876,29 @@ Return ONLY valid JSON in this format:
             logger.error(f"Ollama call failed: {e}")
             return None
 
+    @staticmethod
+    async def _call_ollama_async(prompt: str, client) -> Optional[str]:
+        """Call local Ollama LLM on a shared httpx.AsyncClient."""
+        try:
+            response = await client.post(
+                f"{OLLAMA_HOST}/api/generate",
+                json={
+                    "model": OLLAMA_MODEL,
+                    "prompt": prompt,
+                    "stream": False,
+                    "options": {
+                        "temperature": 0.1,
+                        "num_predict": 1024,
+                    },
+                },
+                timeout=120.0,
+            )
+            response.raise_for_status()
+            return response.json().get("response", "")
+        except Exception as e:
+            logger.error(f"Ollama call failed: {e}")
+            return None
+
     @staticmethod
     def _parse_llm_response(response_text: str) -> Optional[Dict]:
         """Parse JSON from LLM response, handling markdown code blocks."""
@@ -611,12 +929,19 @@ Return ONLY valid JSON in this format:
             return None
 
     @classmethod
-    def evaluate_webhook_event(cls, event_data: Dict, project_id: str) -> List[str]:
-        """Process a webhook event through LLM-based signal detection.
+    def _prepare_evaluation(cls, event_data: Dict, project_id: str) -> Tuple[str, Optional[Dict], str]:
+        """Resolve the LLM cache key for an event and render its prompt.
 
-        Returns list of signal IDs created.
+        Returns (cache_key, cached parsed output or None, prompt).
         """
-        active_summary = cls._get_active_signal_summary(project_id)
+        fingerprint = LLMResultCache.event_fingerprint(
+            OLLAMA_MODEL, cls.SIGNAL_PROMPT_VERSION, project_id, event_data
+        )
+        active_summary, members = cls._get_active_signal_context(project_id)
+        cache_key = LLMResultCache.make_key(fingerprint, cls._active_digest(members, fingerprint))
+        cached = LLMResultCache.get(cache_key)
+        if cached is not None:
+            return cache_key, cached, ""
 
         prompt = cls.SIGNAL_PROMPT_TEMPLATE.replace(
             "{{project_id}}", project_id
@@ -625,17 +950,17 @@ Return ONLY valid JSON in this format:
         ).replace(
             "{{event_data}}", json.dumps(event_data, indent=2, default=str)
         )
+        return cache_key, None, prompt
 
-        response_text = cls._call_ollama(prompt)
-        if not response_text:
-            logger.warning(f"No LLM response for webhook event in project {project_id}")
-            return []
-
-        parsed = cls._parse_llm_response(response_text)
-        if not parsed:
-            return []
-
+    @staticmethod
+    def _apply_llm_result(parsed: Dict, event_data: Dict, project_id: str) -> List[str]:
+        """Write the signals and reinforcement candidates from a parsed LLM response."""
         signal_ids = []
+        # Tag the signals with the event's fingerprint so _active_digest can leave them out
+        fingerprint = LLMResultCache.event_fingerprint(
+            OLLAMA_MODEL, SignalGenerationService.SIGNAL_PROMPT_VERSION, project_id, event_data
+        )
+        supporting_context = {**event_data, "event_fingerprint": fingerprint}
 
         # Process signals
         for sig in parsed.get("signals", []):
@@ -651,7 +976,7 @@ Return ONLY valid JSON in this format:
                     decay_profile=sig.get("decay_profile", "medium_72h"),
                     entity_type=sig.get("entity_type"),
                     entity_value=sig.get("entity_value"),
-                    supporting_context=event_data,
+                    supporting_context=supporting_context,
                 )
                 if sid:
                     signal_ids.append(sid)
@@ -673,6 +998,54 @@ Return ONLY valid JSON in this format:
 
         return signal_ids
 
+    @classmethod
+    def evaluate_webhook_event(cls, event_data: Dict, project_id: str) -> List[str]:
+        """Process a webhook event through LLM-based signal detection.
+
+        Blocks on the Ollama call. High-volume callers should use
+        SignalEvaluationQueue.submit() instead.
+
+        Returns list of signal IDs created.
+        """
+        cache_key, parsed, prompt = cls._prepare_evaluation(event_data, project_id)
+
+        if parsed is None:
+            response_text = cls._call_ollama(prompt)
+            if not response_text:
+                logger.warning(f"No LLM response for webhook event in project {project_id}")
+                return []
+
+            parsed = cls._parse_llm_response(response_text)
+            if not parsed:
+                return []
+            LLMResultCache.put(cache_key, project_id, parsed)
+
+        return cls._apply_llm_result(parsed, event_data, project_id)
+
+    @classmethod
+    async def evaluate_webhook_event_async(cls, event_data: Dict, project_id: str, client) -> List[str]:
+        """Async variant of evaluate_webhook_event used by the queue workers.
+
+        DB work runs in the default executor; only the Ollama call is awaited
+        on the shared httpx.AsyncClient.
+        """
+        cache_key, parsed, prompt = await asyncio.to_thread(
+            cls._prepare_evaluation, event_data, project_id
+        )
+
+        if parsed is None:
+            response_text = await cls._call_ollama_async(prompt, client)
+            if not response_text:
+                logger.warning(f"No LLM response for webhook event in project {project_id}")
+                return []
+
+            parsed = cls._parse_llm_response(response_text)
+            if not parsed:
+                return []
+            await asyncio.to_thread(LLMResultCache.put, cache_key, project_id, parsed)
+
+        return await asyncio.to_thread(cls._apply_llm_result, parsed, event_data, project_id)
+
     @classmethod
     def evaluate_document(
         cls,
@@ -733,6 +1106,299 @@ Return ONLY valid JSON in this format:
         return cls.evaluate_webhook_event(event_data, project_id)
 
 
+# =============================================================================
+# ASYNC EVALUATION QUEUE
+# =============================================================================
+
+class SignalEvaluationQueue:
+    """Bounded event queue drained by a pool of async Ollama workers.
+
+    The queue owns an event loop on a daemon thread so sync callers (API
+    endpoints, ingest scripts) can hand off an event without waiting on
+    inference. SIGNAL_LLM_WORKERS requests are kept in flight against the
+    Ollama host; when SIGNAL_QUEUE_MAXSIZE events are waiting, submit()
+    rejects (or waits up to `timeout`) instead of growing without bound.
+    """
+
+    _lock = threading.Lock()
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _queue: Optional[asyncio.Queue] = None
+    _thread: Optional[threading.Thread] = None
+    _workers: int = 0
+    _maxsize: int = 0
+    _stats: Dict[str, Any] = {}
+    # Counters are bumped from request threads (submit) and the loop thread (workers)
+    _stats_lock = threading.Lock()
+
+    @classmethod
+    def _count(cls, **deltas):
+        with cls._stats_lock:
+            for key, delta in deltas.items():
+                cls._stats[key] += delta
+
+    @classmethod
+    def start(cls, workers: int = None, maxsize: int = None):
+        """Start the loop thread and worker pool. No-op if already running."""
+        with cls._lock:
+            if cls._thread and cls._thread.is_alive():
+                return
+            cls._workers = max(1, workers or SIGNAL_LLM_WORKERS)
+            cls._maxsize = max(1, maxsize or SIGNAL_QUEUE_MAXSIZE)
+            stats = {
+                "submitted": 0,
+                "rejected": 0,
+                "processed": 0,
+                "failed": 0,
+                "signals_written": 0,
+                "in_flight": 0,
+                "max_depth_seen": 0,
+                "total_wait_s": 0.0,
+                "total_eval_s": 0.0,
+                "started_at": datetime.utcnow().isoformat(),
+            }
+            with cls._stats_lock:
+                cls._stats = stats
+            ready = threading.Event()
+            cls._thread = threading.Thread(
+                target=cls._run_loop, args=(ready,),
+                name="signal-eval-queue", daemon=True,
+            )
+            cls._thread.start()
+            ready.wait()
+        logger.info(f"Signal evaluation queue started: workers={cls._workers} maxsize={cls._maxsize}")
+
+    @classmethod
+    def _run_loop(cls, ready: threading.Event):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        cls._loop = loop
+        cls._queue = asyncio.Queue(maxsize=cls._maxsize)
+        ready.set()
+        try:
+            loop.run_until_complete(cls._serve())
+        finally:
+            loop.close()
+            cls._loop = None
+            cls._queue = None
+
+    @classmethod
+    async def _serve(cls):
+        import httpx
+
+        limits = httpx.Limits(max_connections=cls._workers, max_keepalive_connections=cls._workers)
+        async with httpx.AsyncClient(limits=limits) as client:
+            tasks = [asyncio.create_task(cls._worker(i, client)) for i in range(cls._workers)]
+            try:
+                await asyncio.gather(*tasks)
+            except asyncio.CancelledError:
+                pass
+
+    @classmethod
+    async def _worker(cls, worker_id: int, client):
+        while True:
+            event_data, project_id, enqueued_at = await cls._queue.get()
+            started = time.monotonic()
+            cls._count(in_flight=1, total_wait_s=started - enqueued_at)
+            try:
+                signal_ids = await SignalGenerationService.evaluate_webhook_event_async(
+                    event_data, project_id, client
+                )
+                cls._count(processed=1, signals_written=len(signal_ids))
+            except Exception as e:
+                cls._count(failed=1)
+                logger.error(f"Queue worker {worker_id} failed on project {project_id}: {e}", exc_info=True)
+            finally:
+                cls._count(in_flight=-1, total_eval_s=time.monotonic() - started)
+                cls._queue.task_done()
+
+    @classmethod
+    async def _put(cls, item: Tuple, timeout: float) -> bool:
+        try:
+            if timeout > 0:
+                await asyncio.wait_for(cls._queue.put(item), timeout)
+            else:
+                cls._queue.put_nowait(item)
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            return False
+        with cls._stats_lock:
+            cls._stats["max_depth_seen"] = max(cls._stats["max_depth_seen"], cls._queue.qsize())
+        return True
+
+    @classmethod
+    def submit(cls, event_data: Dict, project_id: str, timeout: float = 0.0) -> bool:
+        """Enqueue an event for LLM evaluation.
+
+        Returns False when the queue is full (after waiting up to `timeout`
+        seconds), so callers can shed load or answer 503.
+        """
+        cls.start()
+        item = (event_data, str(project_id), time.monotonic())
+        future = asyncio.run_coroutine_threadsafe(cls._put(item, timeout), cls._loop)
+        accepted = future.result()
+        if accepted:
+            cls._count(submitted=1)
+        else:
+            cls._count(rejected=1)
+            logger.warning(f"Signal queue full ({cls._maxsize}); rejected event for project {project_id}")
+        return accepted
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Queue depth and throughput counters."""
+        running = bool(cls._thread and cls._thread.is_alive() and cls._queue is not None)
+        with cls._stats_lock:
+            stats = dict(cls._stats)
+        done = stats.get("processed", 0) + stats.get("failed", 0)
+        return {
+            "running": running,
+            "workers": cls._workers,
+            "maxsize": cls._maxsize,
+            "depth": cls._queue.qsize() if running else 0,
+            **stats,
+            "avg_wait_s": round(stats.get("total_wait_s", 0.0) / done, 3) if done else None,
+            "avg_eval_s": round(stats.get("total_eval_s", 0.0) / done, 3) if done else None,
+        }
+
+    @classmethod
+    def stop(cls, drain_timeout: float = 30.0):
+        """Wait up to drain_timeout for queued events, then stop the workers."""
+        loop, thread = cls._loop, cls._thread
+        if not loop or not thread:
+            return
+
+        async def _drain_and_cancel():
+            try:
+                await asyncio.wait_for(cls._queue.join(), drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Signal queue stop: {cls._queue.qsize()} events not drained")
+            for task in asyncio.all_tasks():
+                if task is not asyncio.current_task():
+                    task.cancel()
+
+        asyncio.run_coroutine_threadsafe(_drain_and_cancel(), loop).result()
+        thread.join(timeout=5)
+        with cls._lock:
+            cls._thread = None
+        logger.info("Signal evaluation queue stopped")
+
+
+# =============================================================================
+# CHANGE FEED: TARGETED SWEEPS
+# =============================================================================
+
+class ChangeFeedSweeper:
+    """Runs targeted sweeps for the RFIs/submittals sync_agent just wrote.
+
+    sync_agent appends each written row to sync_changes and NOTIFYs
+    CHANGE_CHANNEL with the project UUID. A LISTEN thread debounces those
+    wake-ups and drains the table in batches: rows are deleted with
+    FOR UPDATE SKIP LOCKED and the delete commits only after the sweep, so
+    several API processes share the feed. If any detector fails, the sweep
+    raises and the delete rolls back. The listener then retries the batch
+    after its reconnect backoff. sync_agent trims changes older than
+    SYNC_CHANGES_RETENTION_HOURS, so a batch that keeps failing ages out.
+    The synthesis cycle's full sweep still runs as the backstop.
+    """
+
+    _lock = threading.Lock()
+    _thread: Optional[threading.Thread] = None
+    _stop = threading.Event()
+    _stats = {"notifications": 0, "changes": 0, "sweeps": 0, "signals_written": 0, "reconnects": 0}
+
+    @classmethod
+    def drain(cls) -> int:
+        """Sweep every pending change, batch by batch. Returns the number of changes consumed."""
+        consumed = 0
+        while not cls._stop.is_set():
+            with get_cursor() as cur:
+                cur.execute("""
+                    DELETE FROM sync_changes
+                    WHERE id IN (
+                        SELECT id FROM sync_changes
+                        ORDER BY id
+                        LIMIT %s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING project_id, entity_type, entity_id
+                """, (CHANGE_FEED_BATCH,))
+                changes = cur.fetchall()
+                if not changes:
+                    return consumed
+
+                by_project: Dict[str, Dict[str, set]] = {}
+                for change in changes:
+                    changed = by_project.setdefault(str(change["project_id"]), {})
+                    changed.setdefault(change["entity_type"], set()).add(str(change["entity_id"]))
+                for project_id, changed in by_project.items():
+                    results = run_targeted_sweep(project_id, {k: sorted(v) for k, v in changed.items()})
+                    cls._stats["sweeps"] += 1
+                    cls._stats["signals_written"] += sum(v for v in results.values()
+                                                         if isinstance(v, int) and v > 0)
+            consumed += len(changes)
+            cls._stats["changes"] += len(changes)
+        return consumed
+
+    @classmethod
+    def _listen_forever(cls):
+        backoff = 1.0
+        while not cls._stop.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(dbname=DB_NAME, user=DB_USER, host=DB_HOST, port=DB_PORT)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {CHANGE_CHANNEL}")
+                backoff = 1.0
+                cls.drain()  # whatever queued up while nobody was listening
+
+                while not cls._stop.is_set():
+                    if select.select([conn], [], [], CHANGE_FEED_POLL_SECONDS) != ([], [], []):
+                        # Coalesce the NOTIFYs of one sync pass into a single drain
+                        cls._stop.wait(CHANGE_FEED_DEBOUNCE_SECONDS)
+                        conn.poll()
+                        cls._stats["notifications"] += len(conn.notifies)
+                        conn.notifies.clear()
+                    cls.drain()
+            except Exception as e:
+                cls._stats["reconnects"] += 1
+                logger.error(f"Change feed listener error, reconnecting in {backoff:.0f}s: {e}")
+                cls._stop.wait(backoff)
+                backoff = min(backoff * 2, 60.0)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+    @classmethod
+    def start(cls) -> bool:
+        if not SIGNAL_CHANGE_FEED_ENABLED:
+            logger.info("Change feed sweeps disabled (SIGNAL_CHANGE_FEED_ENABLED=false)")
+            return False
+        with cls._lock:
+            if cls._thread and cls._thread.is_alive():
+                return True
+            cls._stop.clear()
+            cls._thread = threading.Thread(target=cls._listen_forever, name="change-feed-sweeper", daemon=True)
+            cls._thread.start()
+        logger.info(f"Change feed sweeper listening on channel '{CHANGE_CHANNEL}'")
+        return True
+
+    @classmethod
+    def stop(cls):
+        cls._stop.set()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        return {
+            "enabled": SIGNAL_CHANGE_FEED_ENABLED,
+            "channel": CHANGE_CHANNEL,
+            "running": bool(cls._thread and cls._thread.is_alive()),
+            **cls._stats,
+        }
+
+
 def refire_signals_for_document(
     document_id: str,
     confirmed_project_id: str,
@@ -754,6 +1420,9 @@ def refire_signals_for_document(
         """, (document_id,))
         archived = cur.rowcount
 
+    if archived:
+        invalidate_active_signal_summary()
+
     # Re-run with confirmed project and full confidence
     classification_data["project_match_confidence"] = 1.0
     signal_ids = SignalGenerationService.evaluate_document(
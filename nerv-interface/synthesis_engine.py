@@ -18,6 +18,7 @@ from datetime import datetime, timedelta, date
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
+from event_stream import publish
 from steelsync_db import get_cursor, serialize_row, serialize_rows
 
 logger = logging.getLogger("steelsync.synthesis")
@@ -239,6 +240,28 @@ class ItemManager:
     """Manages intelligence item lifecycle: create, update, reinforce,
     downgrade, resolve, merge, archive."""
 
+    @staticmethod
+    def _publish(cur, event_type: str, item_id: str, extra: Dict = None):
+        """NOTIFY the Command Center stream with the item's current state."""
+        try:
+            cur.execute("SAVEPOINT item_event_lookup")
+            cur.execute("""
+                SELECT project_id, item_type::text, title, severity::text, status::text
+                FROM intelligence_items WHERE id = %s
+            """, (item_id,))
+            row = cur.fetchone()
+            cur.execute("RELEASE SAVEPOINT item_event_lookup")
+        except Exception as e:
+            logger.warning(f"Item event lookup failed for {item_id}: {e}")
+            try:
+                cur.execute("ROLLBACK TO SAVEPOINT item_event_lookup")
+            except Exception:
+                pass  # transaction already aborted by an earlier statement
+            return
+        if row:
+            data = {k: row[k] for k in ("item_type", "title", "severity", "status")}
+            publish(cur, event_type, row["project_id"], item_id, {**data, **(extra or {})})
+
     @staticmethod
     def create_item(
         project_id: str,
@@ -287,6 +310,8 @@ class ItemManager:
                 except Exception as e:
                     logger.warning(f"Failed to link signal {sig_id} to item {item_id}: {e}")
 
+            ItemManager._publish(cur, "item.created", item_id)
+
         logger.info(f"Created intelligence item: {item_id} [{synthesis_output.get('title')}]")
         return item_id
 
@@ -356,6 +381,8 @@ class ItemManager:
                 ) WHERE id = %s
             """, (item_id, item_id))
 
+            ItemManager._publish(cur, "item.updated", item_id)
+
         logger.info(f"Updated intelligence item: {item_id}")
         return True
 
@@ -391,6 +418,8 @@ class ItemManager:
                 ) WHERE id = %s
             """, (item_id, item_id))
 
+            ItemManager._publish(cur, "item.reinforced", item_id, {"signal_ids": signal_ids})
+
         logger.info(f"Reinforced intelligence item: {item_id}")
         return True
 
@@ -404,6 +433,8 @@ class ItemManager:
                 WHERE id = %s AND status IN ('new', 'active')
             """, (item_id,))
             affected = cur.rowcount
+            if affected:
+                ItemManager._publish(cur, "item.downgraded", item_id, {"reason": reason})
         if affected:
             logger.info(f"Downgraded item {item_id}: {reason}")
         return affected > 0
@@ -419,6 +450,8 @@ class ItemManager:
                 WHERE id = %s AND status NOT IN ('resolved', 'archived')
             """, (item_id,))
             affected = cur.rowcount
+            if affected:
+                ItemManager._publish(cur, "item.resolved", item_id, {"reason": reason})
         if affected:
             logger.info(f"Resolved item {item_id}: {reason}")
         return affected > 0
@@ -434,6 +467,8 @@ class ItemManager:
                 WHERE id = %s AND status != 'archived'
             """, (item_id,))
             affected = cur.rowcount
+            if affected:
+                ItemManager._publish(cur, "item.archived", item_id, {"reason": reason})
         if affected:
             logger.info(f"Archived item {item_id}: {reason}")
         return affected > 0
@@ -463,6 +498,7 @@ class ItemManager:
                         archived_at = NOW()
                     WHERE id = %s
                 """, (source_id,))
+                ItemManager._publish(cur, "item.archived", source_id, {"merged_into": surviving_id})
 
             # Update surviving item
             if synthesis_output.get("summary"):
@@ -476,6 +512,8 @@ class ItemManager:
                     WHERE id = %s
                 """, (synthesis_output["summary"], cycle_id, surviving_id, surviving_id))
 
+            ItemManager._publish(cur, "item.merged", surviving_id, {"merged_ids": source_ids})
+
         logger.info(f"Merged items {source_ids} into {surviving_id}")
         return True
 
@@ -1361,6 +1399,13 @@ CYCLE METADATA:
                     token_usage.get("output_tokens", 0),
                     cycle_id,
                 ))
+                publish(cur, "synthesis.completed", project_id, cycle_id, {
+                    "cycle_type": cycle_type,
+                    "items_created": items_created,
+                    "items_updated": items_updated,
+                    "items_resolved": items_resolved,
+                    "overall_health": result.get("overall_health", "green"),
+                })
 
             # Step 7: Write working memory snapshot with health trend
             with get_cursor() as cur:
@@ -1422,6 +1467,9 @@ CYCLE METADATA:
                         error_log = %s
                     WHERE id = %s
                 """, (str(e), cycle_id))
+                publish(cur, "synthesis.failed", project_id, cycle_id, {
+                    "cycle_type": cycle_type, "error": str(e)[:500],
+                })
             return cycle_id
 
     @staticmethod
@@ -1526,6 +1574,10 @@ CYCLE METADATA:
             """, (project_id,))
             results["items_archived"] = cur.rowcount
 
+        # Weights changed and some signals were archived — LLM context is stale
+        from signal_generation import invalidate_active_signal_summary
+        invalidate_active_signal_summary(project_id)
+
         logger.info(f"Decay cycle for {project_id}: {results}")
         return results
 
@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+"""SteelSync Synthesis Job Queue — durable, deduplicated synthesis execution.
+
+Implements:
+- SynthesisJobQueue: Postgres-backed queue (synthesis_jobs table). Requests for
+  a (project, cycle_type[, escalation item]) that is already queued coalesce into
+  the existing job instead of starting another cycle
+- SynthesisWorker: claims jobs with FOR UPDATE SKIP LOCKED, holds a per-project
+  advisory lock while a cycle runs, retries failures with backoff
+- Global caps: SYNTHESIS_MAX_CONCURRENT advisory-lock slots shared by all
+  workers, and an hourly token budget that defers scheduled jobs once spent
+- Worker pool entry point: python synthesis_jobs.py --workers 4
+
+Priorities: deep-dive (escalation_review) > manual trigger > scheduled.
+Throughput scales by adding worker processes on any host that can reach the DB.
+"""
+
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+import psycopg2
+import psycopg2.errors
+import psycopg2.extras
+
+from event_stream import publish
+from steelsync_db import DB_NAME, DB_USER, DB_HOST, DB_PORT, get_cursor, serialize_row, serialize_rows
+
+logger = logging.getLogger("steelsync.jobs")
+
+PRIORITY_DEEP_DIVE = 100
+PRIORITY_MANUAL = 50
+PRIORITY_SCHEDULED = 10
+
+# Values of the synthesis_cycle_type enum
+CYCLE_TYPES = ("morning_briefing", "midday_checkpoint", "end_of_day", "escalation_review")
+
+SYNTHESIS_JOB_MAX_ATTEMPTS = int(os.environ.get("SYNTHESIS_JOB_MAX_ATTEMPTS", "3"))
+SYNTHESIS_JOB_LEASE_MINUTES = int(os.environ.get("SYNTHESIS_JOB_LEASE_MINUTES", "30"))
+SYNTHESIS_JOB_POLL_SECONDS = float(os.environ.get("SYNTHESIS_JOB_POLL_SECONDS", "2"))
+# Worker threads started inside the API process; 0 = external workers only
+SYNTHESIS_INPROCESS_WORKERS = int(os.environ.get("SYNTHESIS_INPROCESS_WORKERS", "1"))
+# Global caps across every worker on every host; 0 = unlimited
+SYNTHESIS_MAX_CONCURRENT = int(os.environ.get("SYNTHESIS_MAX_CONCURRENT", "0"))
+SYNTHESIS_TOKEN_BUDGET_PER_HOUR = int(os.environ.get("SYNTHESIS_TOKEN_BUDGET_PER_HOUR", "0"))
+
+# First key of the two-int advisory locks; keeps our locks out of other namespaces
+ADVISORY_LOCK_NAMESPACE = 7301
+CONCURRENCY_SLOT_NAMESPACE = 7302
+RETRY_BACKOFF_SECONDS = 30  # doubles each attempt: 30s, 60s, 120s
+LOCK_BUSY_DELAY_SECONDS = 5
+
+
+# =============================================================================
+# QUEUE
+# =============================================================================
+
+class SynthesisJobQueue:
+    """Enqueue, inspect and transition rows in synthesis_jobs."""
+
+    @staticmethod
+    def _insert_job(
+        cur, project_id: str, cycle_type: str, escalation_item_id: Optional[str],
+        priority: int, requested_by: str, run_after_seconds: int,
+    ) -> Dict[str, Any]:
+        """Insert or coalesce the queued job on cur and publish synthesis.queued."""
+        cur.execute("""
+            INSERT INTO synthesis_jobs (
+                id, project_id, cycle_type, escalation_item_id,
+                priority, requested_by, max_attempts, run_after
+            ) VALUES (
+                %s, %s, %s::synthesis_cycle_type, %s,
+                %s, %s, %s, NOW() + make_interval(secs => %s)
+            )
+            ON CONFLICT (project_id, cycle_type, (COALESCE(escalation_item_id, project_id)))
+                WHERE status = 'queued'
+            DO UPDATE SET
+                coalesced_count = synthesis_jobs.coalesced_count + 1,
+                priority = GREATEST(synthesis_jobs.priority, EXCLUDED.priority),
+                run_after = LEAST(synthesis_jobs.run_after, EXCLUDED.run_after)
+            RETURNING id, status::text, (xmax = 0) AS inserted
+        """, (
+            str(uuid4()), project_id, cycle_type, escalation_item_id,
+            priority, requested_by, SYNTHESIS_JOB_MAX_ATTEMPTS, run_after_seconds,
+        ))
+        row = cur.fetchone()
+        if row["inserted"]:
+            publish(cur, "synthesis.queued", project_id, row["id"], {
+                "cycle_type": cycle_type, "priority": priority,
+            })
+        return row
+
+    @staticmethod
+    def enqueue(
+        project_id: str,
+        cycle_type: str,
+        escalation_item_id: str = None,
+        priority: int = PRIORITY_MANUAL,
+        requested_by: str = "api",
+        run_after_seconds: int = 0,
+        cur=None,
+    ) -> Dict[str, Any]:
+        """Queue a synthesis cycle, coalescing with an identical queued job.
+
+        Pass cur to enqueue inside the caller's transaction; otherwise the
+        job is committed on its own connection.
+
+        Returns {"job_id", "status", "coalesced"}.
+        """
+        if cur is None:
+            with get_cursor() as own_cur:
+                row = SynthesisJobQueue._insert_job(
+                    own_cur, project_id, cycle_type, escalation_item_id,
+                    priority, requested_by, run_after_seconds,
+                )
+        else:
+            row = SynthesisJobQueue._insert_job(
+                cur, project_id, cycle_type, escalation_item_id,
+                priority, requested_by, run_after_seconds,
+            )
+
+        job_id = str(row["id"])
+        if row["inserted"]:
+            logger.info(f"Queued {cycle_type} job {job_id} for project {project_id} (priority={priority})")
+        else:
+            logger.info(f"Coalesced {cycle_type} request for project {project_id} into job {job_id}")
+        return {"job_id": job_id, "status": row["status"], "coalesced": not row["inserted"]}
+
+    @staticmethod
+    def get(job_id: str) -> Optional[Dict]:
+        """Fetch a job, following coalesced_into to the job that will actually run."""
+        with get_cursor() as cur:
+            for _ in range(5):
+                cur.execute("""
+                    SELECT id, project_id, cycle_type::text, escalation_item_id,
+                           status::text, priority, attempts, max_attempts,
+                           coalesced_count, coalesced_into, cycle_id, worker_id,
+                           error, requested_by, run_after, created_at,
+                           started_at, completed_at
+                    FROM synthesis_jobs WHERE id = %s
+                """, (job_id,))
+                row = cur.fetchone()
+                if not row or not row["coalesced_into"]:
+                    break
+                job_id = row["coalesced_into"]
+        return serialize_row(row) if row else None
+
+    @staticmethod
+    def list_jobs(project_id: str = None, status: str = None, limit: int = 50) -> List[Dict]:
+        where = []
+        params = []
+        if project_id:
+            where.append("project_id = %s")
+            params.append(project_id)
+        if status:
+            where.append("status = %s::synthesis_job_status")
+            params.append(status)
+        where_sql = ("WHERE " + " AND ".join(where)) if where else ""
+        params.append(limit)
+
+        with get_cursor() as cur:
+            cur.execute(f"""
+                SELECT id, project_id, cycle_type::text, escalation_item_id,
+                       status::text, priority, attempts, coalesced_count,
+                       cycle_id, worker_id, error, requested_by,
+                       run_after, created_at, started_at, completed_at
+                FROM synthesis_jobs
+                {where_sql}
+                ORDER BY created_at DESC
+                LIMIT %s
+            """, params)
+            return serialize_rows(cur.fetchall())
+
+    @staticmethod
+    def stats() -> Dict[str, Any]:
+        """Queue depth by status plus age of the oldest runnable job."""
+        with get_cursor() as cur:
+            cur.execute("""
+                SELECT status::text AS status, COUNT(*) AS cnt
+                FROM synthesis_jobs
+                WHERE status IN ('queued', 'running')
+                   OR completed_at > NOW() - INTERVAL '24 hours'
+                GROUP BY status
+            """)
+            by_status = {r["status"]: r["cnt"] for r in cur.fetchall()}
+
+            cur.execute("""
+                SELECT EXTRACT(EPOCH FROM NOW() - MIN(run_after)) AS oldest_wait_s,
+                       COUNT(DISTINCT project_id) AS projects
+                FROM synthesis_jobs
+                WHERE status = 'queued' AND run_after <= NOW()
+            """)
+            ready = cur.fetchone()
+            tokens = SynthesisJobQueue.tokens_last_hour(cur)
+
+        return {
+            "by_status": by_status,
+            "tokens_last_hour": tokens,
+            "token_budget_per_hour": SYNTHESIS_TOKEN_BUDGET_PER_HOUR or None,
+            "max_concurrent": SYNTHESIS_MAX_CONCURRENT or None,
+            "ready_projects": ready["projects"],
+            "oldest_wait_s": float(ready["oldest_wait_s"]) if ready["oldest_wait_s"] is not None else None,
+        }
+
+    @staticmethod
+    def tokens_last_hour(cur) -> int:
+        cur.execute("""
+            SELECT COALESCE(SUM(COALESCE(input_tokens, 0) + COALESCE(output_tokens, 0)), 0) AS tokens
+            FROM synthesis_cycles
+            WHERE started_at > NOW() - INTERVAL '1 hour'
+        """)
+        row = cur.fetchone()
+        return int(row["tokens"] if isinstance(row, dict) else row[0])
+
+    @staticmethod
+    def claim(cur, worker_id: str, min_priority: int = 0) -> Optional[Dict]:
+        """Claim the highest-priority runnable job. Expired leases are reclaimed.
+
+        Projects with a live running job are skipped here; the advisory lock
+        taken by the worker is the hard guarantee against overlap. Jobs below
+        min_priority are left queued (used to defer scheduled work when the
+        hourly token budget is spent).
+        """
+        cur.execute("""
+            UPDATE synthesis_jobs SET
+                status = 'running',
+                attempts = attempts + 1,
+                started_at = NOW(),
+                locked_until = NOW() + make_interval(mins => %s),
+                worker_id = %s
+            WHERE id = (
+                SELECT j.id FROM synthesis_jobs j
+                WHERE ((j.status = 'queued' AND j.run_after <= NOW())
+                       OR (j.status = 'running' AND j.locked_until < NOW()))
+                  AND j.priority >= %s
+                  AND NOT EXISTS (
+                      SELECT 1 FROM synthesis_jobs r
+                      WHERE r.project_id = j.project_id
+                        AND r.status = 'running'
+                        AND r.locked_until >= NOW()
+                  )
+                ORDER BY j.priority DESC, j.run_after, j.created_at
+                FOR UPDATE SKIP LOCKED
+                LIMIT 1
+            )
+            RETURNING id, project_id, cycle_type::text, escalation_item_id,
+                      attempts, max_attempts
+        """, (SYNTHESIS_JOB_LEASE_MINUTES, worker_id, min_priority))
+        return cur.fetchone()
+
+    @staticmethod
+    def requeue(cur, job: Dict, delay_seconds: int, error: str = None, refund_attempt: bool = False):
+        """Put a claimed job back in the queue.
+
+        If an identical job was queued meanwhile, this one is cancelled and
+        coalesced into it instead of violating the one-queued-job rule.
+        """
+        cur.execute("SAVEPOINT requeue")
+        try:
+            cur.execute("""
+                UPDATE synthesis_jobs SET
+                    status = 'queued',
+                    attempts = attempts - %s,
+                    run_after = NOW() + make_interval(secs => %s),
+                    locked_until = NULL,
+                    worker_id = NULL,
+                    error = COALESCE(%s, error)
+                WHERE id = %s
+            """, (1 if refund_attempt else 0, delay_seconds, error, job["id"]))
+            cur.execute("RELEASE SAVEPOINT requeue")
+        except psycopg2.errors.UniqueViolation:
+            cur.execute("ROLLBACK TO SAVEPOINT requeue")
+            cur.execute("""
+                WITH target AS (
+                    UPDATE synthesis_jobs SET coalesced_count = coalesced_count + 1
+                    WHERE project_id = %s AND cycle_type = %s::synthesis_cycle_type
+                      AND COALESCE(escalation_item_id, project_id) = COALESCE(%s::uuid, project_id)
+                      AND status = 'queued'
+                    RETURNING id
+                )
+                UPDATE synthesis_jobs SET
+                    status = 'cancelled',
+                    completed_at = NOW(),
+                    coalesced_into = (SELECT id FROM target),
+                    locked_until = NULL,
+                    error = COALESCE(%s, error)
+                WHERE id = %s
+            """, (job["project_id"], job["cycle_type"], job["escalation_item_id"], error, job["id"]))
+
+    @staticmethod
+    def finish(cur, job: Dict, cycle_id: Optional[str]):
+        cur.execute("""
+            UPDATE synthesis_jobs SET
+                status = 'completed',
+                cycle_id = %s,
+                completed_at = NOW(),
+                locked_until = NULL
+            WHERE id = %s
+        """, (cycle_id, job["id"]))
+
+    @classmethod
+    def fail(cls, cur, job: Dict, error: str):
+        """Retry with exponential backoff, or mark failed after max_attempts."""
+        if job["attempts"] < job["max_attempts"]:
+            delay = RETRY_BACKOFF_SECONDS * (2 ** (job["attempts"] - 1))
+            cls.requeue(cur, job, delay, error=error)
+            logger.warning(
+                f"Job {job['id']} attempt {job['attempts']}/{job['max_attempts']} failed, "
+                f"retrying in {delay}s: {error}"
+            )
+            return
+        cur.execute("""
+            UPDATE synthesis_jobs SET
+                status = 'failed',
+                error = %s,
+                completed_at = NOW(),
+                locked_until = NULL
+            WHERE id = %s
+        """, (error, job["id"]))
+        logger.error(f"Job {job['id']} failed permanently after {job['attempts']} attempts: {error}")
+
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+class SynthesisWorker:
+    """Claims and runs synthesis jobs until stopped.
+
+    Each worker owns one connection for claims and the per-project advisory
+    lock (session-level, so it outlives the claim transaction); the cycle
+    itself uses the shared steelsync_db pool.
+    """
+
+    def __init__(self, name: str = None):
+        self.worker_id = name or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:6]}"
+        self.conn = None
+
+    def _connect(self):
+        if self.conn is None or self.conn.closed:
+            self.conn = psycopg2.connect(dbname=DB_NAME, user=DB_USER, host=DB_HOST, port=DB_PORT)
+
+    def _try_project_lock(self, project_id: str) -> bool:
+        with self.conn, self.conn.cursor() as cur:
+            cur.execute(
+                "SELECT pg_try_advisory_lock(%s, hashtext(%s))",
+                (ADVISORY_LOCK_NAMESPACE, str(project_id)),
+            )
+            return cur.fetchone()[0]
+
+    def _release_project_lock(self, project_id: str):
+        with self.conn, self.conn.cursor() as cur:
+            cur.execute(
+                "SELECT pg_advisory_unlock(%s, hashtext(%s))",
+                (ADVISORY_LOCK_NAMESPACE, str(project_id)),
+            )
+
+    def _acquire_slot(self) -> Optional[int]:
+        """Take one of SYNTHESIS_MAX_CONCURRENT global slots, or None if all busy."""
+        if SYNTHESIS_MAX_CONCURRENT <= 0:
+            return -1
+        with self.conn, self.conn.cursor() as cur:
+            for slot in range(SYNTHESIS_MAX_CONCURRENT):
+                cur.execute("SELECT pg_try_advisory_lock(%s, %s)", (CONCURRENCY_SLOT_NAMESPACE, slot))
+                if cur.fetchone()[0]:
+                    return slot
+        return None
+
+    def _release_slot(self, slot: int):
+        if slot < 0:
+            return
+        with self.conn, self.conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_unlock(%s, %s)", (CONCURRENCY_SLOT_NAMESPACE, slot))
+
+    def run_one(self) -> bool:
+        """Claim and run one job. Returns False if nothing was runnable."""
+        self._connect()
+        slot = self._acquire_slot()
+        if slot is None:
+            return False
+        try:
+            return self._claim_and_run()
+        finally:
+            self._release_slot(slot)
+
+    def _claim_and_run(self) -> bool:
+        with self.conn:  # transaction for the claim
+            with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                min_priority = 0
+                if SYNTHESIS_TOKEN_BUDGET_PER_HOUR > 0:
+                    used = SynthesisJobQueue.tokens_last_hour(cur)
+                    if used >= SYNTHESIS_TOKEN_BUDGET_PER_HOUR:
+                        # Budget spent: only user-initiated work runs until it rolls off
+                        min_priority = PRIORITY_SCHEDULED + 1
+                job = SynthesisJobQueue.claim(cur, self.worker_id, min_priority)
+        if not job:
+            return False
+
+        project_id = str(job["project_id"])
+        if not self._try_project_lock(project_id):
+            # Another worker is mid-cycle on this project; try again shortly
+            with self.conn:
+                with self.conn.cursor() as cur:
+                    SynthesisJobQueue.requeue(cur, job, LOCK_BUSY_DELAY_SECONDS, refund_attempt=True)
+            return True
+
+        try:
+            self._execute(job)
+        finally:
+            self._release_project_lock(project_id)
+        return True
+
+    def _execute(self, job: Dict):
+        from synthesis_engine import SynthesisEngine
+
+        project_id = str(job["project_id"])
+        escalation_item_id = str(job["escalation_item_id"]) if job["escalation_item_id"] else None
+        logger.info(
+            f"[{self.worker_id}] Running {job['cycle_type']} job {job['id']} "
+            f"for project {project_id} (attempt {job['attempts']})"
+        )
+
+        error = None
+        cycle_id = None
+        try:
+            cycle_id = SynthesisEngine.run_cycle(
+                project_id, job["cycle_type"], escalation_item_id=escalation_item_id
+            )
+            # run_cycle records its own failures on the cycle row rather than raising
+            if cycle_id:
+                with get_cursor() as cur:
+                    cur.execute("SELECT error_log FROM synthesis_cycles WHERE id = %s", (cycle_id,))
+                    row = cur.fetchone()
+                    if row and row["error_log"]:
+                        error = row["error_log"]
+        except Exception as e:
+            logger.error(f"Job {job['id']} raised: {e}", exc_info=True)
+            error = str(e)
+
+        with self.conn:
+            with self.conn.cursor() as cur:
+                if error:
+                    SynthesisJobQueue.fail(cur, job, error[:2000])
+                else:
+                    SynthesisJobQueue.finish(cur, job, cycle_id)
+
+    def run_forever(self, stop: threading.Event):
+        logger.info(f"Synthesis worker {self.worker_id} started")
+        while not stop.is_set():
+            try:
+                if not self.run_one():
+                    stop.wait(SYNTHESIS_JOB_POLL_SECONDS)
+            except psycopg2.OperationalError as e:
+                logger.error(f"Worker {self.worker_id} lost its connection: {e}")
+                self.conn = None
+                stop.wait(5)
+            except Exception as e:
+                logger.error(f"Worker {self.worker_id} error: {e}", exc_info=True)
+                stop.wait(SYNTHESIS_JOB_POLL_SECONDS)
+        if self.conn is not None:
+            self.conn.close()
+        logger.info(f"Synthesis worker {self.worker_id} stopped")
+
+
+_inprocess_stop = threading.Event()
+_inprocess_threads: List[threading.Thread] = []
+
+
+def start_inprocess_workers(count: int = None) -> int:
+    """Start worker threads inside the current (API) process. Idempotent."""
+    count = SYNTHESIS_INPROCESS_WORKERS if count is None else count
+    if _inprocess_threads or count <= 0:
+        return len(_inprocess_threads)
+    for i in range(count):
+        worker = SynthesisWorker()
+        t = threading.Thread(
+            target=worker.run_forever, args=(_inprocess_stop,),
+            name=f"synthesis-worker-{i}", daemon=True,
+        )
+        t.start()
+        _inprocess_threads.append(t)
+    return count
+
+
+def stop_inprocess_workers():
+    _inprocess_stop.set()
+
+
+# =============================================================================
+# WORKER POOL ENTRY POINT
+# =============================================================================
+
+def _worker_process(index: int):
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    SynthesisWorker(name=f"{socket.gethostname()}:{os.getpid()}:w{index}").run_forever(stop)
+
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser(description="SteelSync synthesis job worker pool")
+    ap.add_argument("--workers", type=int, default=int(os.environ.get("SYNTHESIS_WORKERS", "2")))
+    args = ap.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+
+    procs = []
+    for i in range(args.workers):
+        p = multiprocessing.Process(target=_worker_process, args=(i,), name=f"synthesis-worker-{i}")
+        p.start()
+        procs.append(p)
+    logger.info(f"Started {len(procs)} synthesis worker processes")
+
+    def _shutdown(*_):
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+    for p in procs:
+        p.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""SteelSync Synthesis Scheduler — portfolio-wide morning/midday/EOD cycles.
+
+Implements:
+- Per-project local schedules (synthesis_schedules table, env defaults)
+- Deterministic per-project jitter so a portfolio doesn't fire in one spike
+- Skip when a project has no new signals since its last completed cycle
+- Fire ledger (synthesis_schedule_runs) so each (project, cycle, local date)
+  fires once, across restarts and across multiple API processes
+
+The scheduler only enqueues; SynthesisWorker enforces the global concurrency
+slots and hourly token budget when jobs are claimed.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, time as dtime, timezone
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from steelsync_db import get_cursor, serialize_rows
+
+logger = logging.getLogger("steelsync.scheduler")
+
+SYNTHESIS_SCHEDULER_ENABLED = os.environ.get("SYNTHESIS_SCHEDULER_ENABLED", "true").lower() == "true"
+SYNTHESIS_DEFAULT_TIMEZONE = os.environ.get("SYNTHESIS_DEFAULT_TIMEZONE", "America/New_York")
+SYNTHESIS_SCHEDULE_JITTER_MINUTES = int(os.environ.get("SYNTHESIS_SCHEDULE_JITTER_MINUTES", "20"))
+# Fires missed by more than this (e.g. service was down) are recorded, not run
+SYNTHESIS_SCHEDULE_GRACE_MINUTES = int(os.environ.get("SYNTHESIS_SCHEDULE_GRACE_MINUTES", "120"))
+SCHEDULER_TICK_SECONDS = 60
+
+DEFAULT_CYCLE_TIMES = {
+    "morning_briefing": os.environ.get("SYNTHESIS_MORNING_AT", "06:30"),
+    "midday_checkpoint": os.environ.get("SYNTHESIS_MIDDAY_AT", "12:00"),
+    "end_of_day": os.environ.get("SYNTHESIS_EOD_AT", "17:00"),
+}
+
+# synthesis_schedules column holding each cycle's local time override
+CYCLE_TIME_COLUMNS = {
+    "morning_briefing": "morning_at",
+    "midday_checkpoint": "midday_at",
+    "end_of_day": "end_of_day_at",
+}
+
+
+def _parse_hhmm(value: str) -> dtime:
+    hours, minutes = value.split(":")
+    return dtime(int(hours), int(minutes))
+
+
+def _jitter_minutes(project_id: str, cycle_type: str) -> int:
+    """Stable per (project, cycle) offset in [0, SYNTHESIS_SCHEDULE_JITTER_MINUTES)."""
+    if SYNTHESIS_SCHEDULE_JITTER_MINUTES <= 0:
+        return 0
+    digest = hashlib.sha256(f"{project_id}:{cycle_type}".encode()).digest()
+    return int.from_bytes(digest[:4], "big") % SYNTHESIS_SCHEDULE_JITTER_MINUTES
+
+
+def _zone(name: Optional[str]) -> ZoneInfo:
+    try:
+        return ZoneInfo(name or SYNTHESIS_DEFAULT_TIMEZONE)
+    except ZoneInfoNotFoundError:
+        logger.warning(f"Unknown time zone '{name}', using {SYNTHESIS_DEFAULT_TIMEZONE}")
+        return ZoneInfo(SYNTHESIS_DEFAULT_TIMEZONE)
+
+
+# =============================================================================
+# SCHEDULE RESOLUTION
+# =============================================================================
+
+def _get_scheduled_projects() -> List[Dict]:
+    """Active projects joined with their (optional) schedule overrides."""
+    with get_cursor() as cur:
+        cur.execute("""
+            SELECT p.id, p.name,
+                   s.timezone, s.enabled,
+                   s.morning_at::text, s.midday_at::text, s.end_of_day_at::text
+            FROM projects p
+            LEFT JOIN synthesis_schedules s ON s.project_id = p.id
+            WHERE p.status = 'active' AND p.is_deleted = FALSE
+        """)
+        return cur.fetchall()
+
+
+def due_cycles(project: Dict, now_utc: datetime) -> List[Dict]:
+    """Cycles whose jittered local fire time for today has passed."""
+    if project.get("enabled") is False:
+        return []
+
+    tz = _zone(project.get("timezone"))
+    local_now = now_utc.astimezone(tz)
+    due = []
+    for cycle_type, default_at in DEFAULT_CYCLE_TIMES.items():
+        override = project.get(CYCLE_TIME_COLUMNS[cycle_type])
+        at = _parse_hhmm(override[:5] if override else default_at)
+        fire_local = datetime.combine(local_now.date(), at, tzinfo=tz) + timedelta(
+            minutes=_jitter_minutes(str(project["id"]), cycle_type)
+        )
+        if local_now >= fire_local:
+            due.append({
+                "cycle_type": cycle_type,
+                "local_date": local_now.date(),
+                "fire_at": fire_local.astimezone(timezone.utc),
+                "late": local_now - fire_local > timedelta(minutes=SYNTHESIS_SCHEDULE_GRACE_MINUTES),
+            })
+    return due
+
+
+def _has_new_signals(cur, project_id: str) -> bool:
+    """True if any signal was created since the project's last completed cycle."""
+    cur.execute("""
+        SELECT EXISTS (
+            SELECT 1 FROM signals
+            WHERE project_id = %s
+              AND created_at > COALESCE((
+                  SELECT MAX(started_at) FROM synthesis_cycles
+                  WHERE project_id = %s
+                    AND completed_at IS NOT NULL
+                    AND error_log IS NULL
+              ), '-infinity'::timestamptz)
+        ) AS has_new
+    """, (project_id, project_id))
+    return cur.fetchone()["has_new"]
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+class SynthesisScheduler:
+    """Ticks once a minute and enqueues due cycles at scheduled priority."""
+
+    _thread: Optional[threading.Thread] = None
+    _stop = threading.Event()
+    _last_tick: Optional[str] = None
+
+    @classmethod
+    def tick(cls, now_utc: datetime = None) -> Dict[str, int]:
+        """Evaluate every project once. Safe to call from several processes."""
+        from synthesis_jobs import SynthesisJobQueue, PRIORITY_SCHEDULED
+
+        now_utc = now_utc or datetime.now(timezone.utc)
+        counts = {"queued": 0, "skipped_no_signals": 0, "missed": 0}
+
+        for project in _get_scheduled_projects():
+            project_id = str(project["id"])
+            for due in due_cycles(project, now_utc):
+                with get_cursor() as cur:
+                    # Claim today's slot for this cycle; whoever inserts it owns the fire
+                    cur.execute("""
+                        INSERT INTO synthesis_schedule_runs
+                            (project_id, cycle_type, local_date, scheduled_for, outcome)
+                        VALUES (%s, %s::synthesis_cycle_type, %s, %s, 'pending')
+                        ON CONFLICT (project_id, cycle_type, local_date) DO NOTHING
+                        RETURNING project_id
+                    """, (project_id, due["cycle_type"], due["local_date"], due["fire_at"]))
+                    if not cur.fetchone():
+                        continue
+
+                    if due["late"]:
+                        outcome = "missed"
+                    elif not _has_new_signals(cur, project_id):
+                        outcome = "skipped_no_signals"
+                    else:
+                        outcome = "queued"
+
+                    job_id = None
+                    if outcome == "queued":
+                        # Same transaction as the ledger row: both commit or neither does
+                        job_id = SynthesisJobQueue.enqueue(
+                            project_id, due["cycle_type"],
+                            priority=PRIORITY_SCHEDULED, requested_by="scheduler", cur=cur,
+                        )["job_id"]
+
+                    cur.execute("""
+                        UPDATE synthesis_schedule_runs SET outcome = %s, job_id = %s
+                        WHERE project_id = %s AND cycle_type = %s::synthesis_cycle_type
+                          AND local_date = %s
+                    """, (outcome, job_id, project_id, due["cycle_type"], due["local_date"]))
+
+                counts[outcome] += 1
+                logger.info(f"Scheduler: {due['cycle_type']} for {project['name']} → {outcome}")
+
+        cls._last_tick = now_utc.isoformat()
+        return counts
+
+    @classmethod
+    def _run(cls):
+        logger.info("Synthesis scheduler started")
+        while not cls._stop.is_set():
+            try:
+                cls.tick()
+            except Exception as e:
+                logger.error(f"Scheduler tick failed: {e}", exc_info=True)
+            cls._stop.wait(SCHEDULER_TICK_SECONDS)
+        logger.info("Synthesis scheduler stopped")
+
+    @classmethod
+    def start(cls) -> bool:
+        if not SYNTHESIS_SCHEDULER_ENABLED:
+            logger.info("Synthesis scheduler disabled (SYNTHESIS_SCHEDULER_ENABLED=false)")
+            return False
+        if cls._thread and cls._thread.is_alive():
+            return True
+        cls._stop.clear()
+        cls._thread = threading.Thread(target=cls._run, name="synthesis-scheduler", daemon=True)
+        cls._thread.start()
+        return True
+
+    @classmethod
+    def stop(cls):
+        cls._stop.set()
+
+    @classmethod
+    def status(cls, limit: int = 50) -> Dict:
+        """Scheduler state plus the most recent fire decisions."""
+        with get_cursor() as cur:
+            cur.execute("""
+                SELECT r.project_id, p.name AS project_name, r.cycle_type::text,
+                       r.local_date, r.scheduled_for, r.outcome, r.job_id, r.created_at
+                FROM synthesis_schedule_runs r
+                JOIN projects p ON p.id = r.project_id
+                ORDER BY r.created_at DESC
+                LIMIT %s
+            """, (limit,))
+            recent = serialize_rows(cur.fetchall())
+        return {
+            "enabled": SYNTHESIS_SCHEDULER_ENABLED,
+            "running": bool(cls._thread and cls._thread.is_alive()),
+            "last_tick": cls._last_tick,
+            "default_timezone": SYNTHESIS_DEFAULT_TIMEZONE,
+            "default_times": DEFAULT_CYCLE_TIMES,
+            "jitter_minutes": SYNTHESIS_SCHEDULE_JITTER_MINUTES,
+            "recent_runs": recent,
+        }
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Benchmark EVA-00 keyword search — ranked full-text vs legacy ILIKE.
+
+Seeds a scratch database with a large synthetic project history, then times
+each database.py search function in both EVA00_SEARCH_MODE settings.
+
+Usage:
+    python3 scripts/bench-eva00-search.py [--db nerv_eva00_bench] [--rows 200000]
+    python3 scripts/bench-eva00-search.py --skip-seed --repeat 20
+
+The target database must exist (createdb nerv_eva00_bench). The EVA-00 base
+schema is applied automatically if its tables are missing. Never point this at
+the production database — seeding inserts hundreds of thousands of rows.
+"""
+
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import psycopg2
+
+WORKSPACE = Path(__file__).resolve().parent.parent
+SCHEMA_FILE = WORKSPACE / "eva-agent" / "eva-00-design" / "DATABASE-SCHEMA.sql"
+
+WORDS = [
+    "concrete", "rebar", "footing", "slab", "column", "beam", "steel", "joist",
+    "deck", "masonry", "grout", "waterproofing", "membrane", "roofing", "flashing",
+    "curtain", "glazing", "storefront", "drywall", "framing", "ceiling", "door",
+    "hardware", "paint", "flooring", "elevator", "sprinkler", "ductwork", "diffuser",
+    "chiller", "boiler", "pump", "valve", "conduit", "panel", "switchgear",
+    "transformer", "lighting", "fixture", "generator", "excavation", "backfill",
+    "paving", "curb", "drainage", "manhole", "anchor", "embed", "connection",
+    "weld", "bolt", "fireproofing", "insulation", "vapor", "barrier", "sealant",
+    "clearance", "conflict", "dimension", "elevation", "grid", "level", "north",
+    "south", "east", "west", "revised", "missing", "clarify", "coordinate",
+]
+
+# name -> (function name, kwargs)
+QUERIES = [
+    ("submittals: single term", "search_submittals", {"keyword": "waterproofing"}),
+    ("submittals: phrase", "search_submittals", {"keyword": '"curtain glazing"'}),
+    ("rfis: two terms", "search_rfis", {"keyword": "beam connection"}),
+    ("rfis: typo", "search_rfis", {"keyword": "sprinkelr"}),
+    ("drawings: ocr term", "search_drawings", {"keyword": "switchgear"}),
+    ("drawings: sheet number", "search_drawings", {"keyword": "M-4105"}),
+    ("companies: name", "search_companies", {"name": "Mechanical"}),
+    ("daily reports: term", "search_daily_reports", {"keyword": "excavation"}),
+]
+
+
+def _words_sql(count: int) -> str:
+    """SQL expression for `count` random words; `g` keeps it per-row."""
+    words = "ARRAY[" + ", ".join(f"'{w}'" for w in WORDS) + "]"
+    return (
+        f"array_to_string(ARRAY(SELECT ({words})[1 + floor(random() * {len(WORDS)})::int] "
+        f"FROM generate_series(1, {count}) WHERE g > 0), ' ')"
+    )
+
+
+def ensure_schema(conn):
+    with conn.cursor() as cur:
+        cur.execute("SELECT to_regclass('public.submittals') IS NOT NULL")
+        if cur.fetchone()[0]:
+            return
+        print(f"Applying {SCHEMA_FILE.name}...")
+        cur.execute(SCHEMA_FILE.read_text())
+    conn.commit()
+
+
+def seed(conn, rows: int):
+    """Insert `rows` submittals/RFIs/drawings plus companies and daily reports."""
+    projects = 25
+    with conn.cursor() as cur:
+        print(f"Seeding {rows:,} rows per entity across {projects} projects...")
+        started = time.time()
+        cur.execute(f"""
+            INSERT INTO projects (name, number, status, start_date)
+            SELECT 'Bench Project ' || g, 'B-' || g, 'active', DATE '2020-01-01' + g * 30
+            FROM generate_series(1, {projects}) g
+        """)
+        cur.execute(f"""
+            INSERT INTO companies (name, trade)
+            SELECT initcap({_words_sql(2)}) || ' ' ||
+                   (ARRAY['Mechanical', 'Electrical', 'Concrete', 'Steel', 'Glass'])[1 + g % 5] || ' ' || g,
+                   (ARRAY['Mechanical', 'Electrical', 'Concrete', 'Steel', 'Glazing'])[1 + g % 5]
+            FROM generate_series(1, {max(rows // 100, 50)}) g
+        """)
+        cur.execute(f"""
+            INSERT INTO submittals (project_id, number, title, description, status)
+            SELECT p.id, lpad((g % 9999)::text, 4, '0'), initcap({_words_sql(4)}), {_words_sql(40)},
+                   'submitted'
+            FROM generate_series(1, {rows}) g
+            JOIN LATERAL (SELECT id FROM projects ORDER BY id OFFSET g % {projects} LIMIT 1) p ON TRUE
+        """)
+        cur.execute(f"""
+            INSERT INTO rfis (project_id, number, subject, question, status)
+            SELECT p.id, (g % 9999)::text, initcap({_words_sql(6)}), {_words_sql(60)}, 'open'
+            FROM generate_series(1, {rows}) g
+            JOIN LATERAL (SELECT id FROM projects ORDER BY id OFFSET g % {projects} LIMIT 1) p ON TRUE
+        """)
+        cur.execute(f"""
+            INSERT INTO drawings (project_id, number, title, discipline, ocr_text)
+            SELECT p.id,
+                   (ARRAY['A', 'S', 'M', 'E', 'P'])[1 + g % 5] || '-' || (100 + g % 9900),
+                   initcap({_words_sql(3)}),
+                   (ARRAY['architectural', 'structural', 'mechanical', 'electrical', 'plumbing'])[1 + g % 5]::drawing_discipline,
+                   {_words_sql(120)}
+            FROM generate_series(1, {rows}) g
+            JOIN LATERAL (SELECT id FROM projects ORDER BY id OFFSET g % {projects} LIMIT 1) p ON TRUE
+        """)
+        cur.execute(f"""
+            INSERT INTO daily_reports (project_id, report_date, work_performed, delays, general_notes)
+            SELECT p.id, DATE '2020-01-01' + g % 2000, {_words_sql(50)}, {_words_sql(8)}, {_words_sql(20)}
+            FROM generate_series(1, {max(rows // 10, 100)}) g
+            JOIN LATERAL (SELECT id FROM projects ORDER BY id OFFSET g % {projects} LIMIT 1) p ON TRUE
+        """)
+        conn.commit()
+        conn.autocommit = True
+        cur.execute("VACUUM ANALYZE")
+        conn.autocommit = False
+        print(f"Seeded in {time.time() - started:.1f}s")
+
+
+def time_query(db, func_name: str, kwargs: dict, repeat: int):
+    func = getattr(db, func_name)
+    func(**kwargs)  # warm cache and pool
+    samples = []
+    rows = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = func(**kwargs)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    p95 = samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))]
+    return statistics.median(samples), p95, len(rows)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark EVA-00 full-text search vs ILIKE")
+    parser.add_argument("--db", default="nerv_eva00_bench", help="Scratch database to seed and query")
+    parser.add_argument("--rows", type=int, default=200000, help="Rows per large entity")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    if args.db == os.environ.get("EVA00_DB", "nerv_eva00"):
+        print(f"ERROR: refusing to seed the configured EVA-00 database ({args.db}).")
+        sys.exit(1)
+
+    # database.py reads its connection settings at import time
+    os.environ["EVA00_DB"] = args.db
+    sys.path.insert(0, str(WORKSPACE / "eva-agent" / "eva-00" / "src"))
+    import database as db
+
+    conn = psycopg2.connect(dbname=args.db, user=db.DB_USER, host=db.DB_HOST, port=db.DB_PORT)
+    try:
+        ensure_schema(conn)
+        if not args.skip_seed:
+            seed(conn, args.rows)
+    finally:
+        conn.close()
+
+    print(f"\n{'query':<28} {'mode':<6} {'p50 ms':>9} {'p95 ms':>9} {'rows':>6}")
+    print("-" * 62)
+    for label, func_name, kwargs in QUERIES:
+        results = {}
+        for mode in ("ilike", "fts"):
+            db.SEARCH_MODE = mode
+            results[mode] = time_query(db, func_name, kwargs, args.repeat)
+            p50, p95, count = results[mode]
+            print(f"{label:<28} {mode:<6} {p50:>9.1f} {p95:>9.1f} {count:>6}")
+        speedup = results["ilike"][0] / results["fts"][0] if results["fts"][0] else 0
+        print(f"{'':<28} {'x':<6} {speedup:>9.1f}")
+
+    db.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""Benchmark the EVA-00 Procore sync against the local Procore simulator.
+
+Starts scripts/procore-sim.py, points ProcoreClient at it and runs sync_agent
+passes into a scratch database:
+
+    full        first full sync of every entity
+    noop        delta pass with nothing changed upstream
+    delta       delta pass after --mutate RFIs/submittals/drawings are touched
+    reconcile   forced full listing (delete detection) over synced data
+    client      ProcoreClient.iter_all over every project's RFIs, no database
+
+For each it reports wall time, records/s, API calls (and 429s) as seen by the
+simulator, and database write volume (tuples, commits, WAL bytes).
+
+Usage:
+    python3 scripts/bench-procore-sync.py [--db nerv_eva00_simbench] [--projects 20 --rfis 100000 --submittals 100000]
+    python3 scripts/bench-procore-sync.py --save baseline.json
+    python3 scripts/bench-procore-sync.py --baseline baseline.json --tolerance 0.25   # exit 1 on regression
+
+The target database must exist (createdb nerv_eva00_simbench); the EVA-00 base
+schema is applied if missing and sync tables are truncated before the run.
+Never point this at the production database.
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+import psycopg2
+
+WORKSPACE = Path(__file__).resolve().parent.parent
+SCHEMA_FILE = WORKSPACE / "eva-agent" / "eva-00-design" / "DATABASE-SCHEMA.sql"
+SIMULATOR = WORKSPACE / "scripts" / "procore-sim.py"
+COMPANY_ID = 4281379
+PROJECT_ID_BASE = 316000  # must match procore-sim.py
+
+SYNC_TABLES = ["projects", "companies", "contacts", "sync_cursors", "sync_log", "sync_passes", "sync_changes",
+               "document_folders", "procore_webhook_events"]
+
+# Lower is better for these; everything else (records_per_s) higher is better
+LOWER_IS_BETTER = ("seconds", "api_requests", "tuples_written", "commits", "wal_bytes")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_simulator(args, port: int) -> subprocess.Popen:
+    cmd = [
+        sys.executable, str(SIMULATOR), "--port", str(port),
+        "--projects", str(args.projects), "--rfis", str(args.rfis), "--submittals", str(args.submittals),
+        "--drawings", str(args.drawings), "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+        "--rate-limit", str(args.rate_limit), "--rate-window", str(args.rate_window),
+    ]
+    if args.fixtures:
+        cmd += ["--fixtures", str(args.fixtures)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    print(proc.stdout.readline().strip())
+    return proc
+
+
+def sim_call(base: str, path: str, method: str = "GET") -> dict:
+    with urllib.request.urlopen(urllib.request.Request(base + path, method=method), timeout=30) as resp:
+        return json.loads(resp.read())
+
+
+def write_credentials(creds_dir: Path):
+    """Throwaway credentials the simulator accepts; the token is already fresh."""
+    (creds_dir / "procore.env").write_text("PROCORE_CLIENT_ID=sim\nPROCORE_CLIENT_SECRET=sim\n")
+    (creds_dir / "procore_token.json").write_text(json.dumps({
+        "access_token": "sim-bench", "refresh_token": "sim-refresh", "expires_in": 86400, "saved_at": time.time(),
+    }))
+
+
+def ensure_schema(conn):
+    with conn.cursor() as cur:
+        cur.execute("SELECT to_regclass('public.submittals') IS NOT NULL")
+        if not cur.fetchone()[0]:
+            print(f"Applying {SCHEMA_FILE.name}...")
+            cur.execute(SCHEMA_FILE.read_text())
+        cur.execute(f"TRUNCATE {', '.join(SYNC_TABLES)} CASCADE")
+    conn.commit()
+
+
+def db_counters(conn) -> dict:
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_stat_clear_snapshot()")
+        cur.execute("""
+            SELECT tup_inserted + tup_updated + tup_deleted, xact_commit, pg_current_wal_lsn()
+            FROM pg_stat_database WHERE datname = current_database()
+        """)
+        tuples, commits, lsn = cur.fetchone()
+        cur.execute("SELECT pg_wal_lsn_diff(%s, '0/0')", (lsn,))
+        wal = int(cur.fetchone()[0])
+    conn.commit()
+    return {"tuples": tuples, "commits": commits, "wal": wal}
+
+
+def measure(name: str, run, conn, sim_base: str) -> dict:
+    sim_call(sim_base, "/__sim/reset-stats", "POST")
+    # pg_stat_database is updated when backends report; give the last pass time to flush
+    time.sleep(1.0)
+    before = db_counters(conn)
+    started = time.perf_counter()
+    records = run()
+    seconds = time.perf_counter() - started
+    time.sleep(1.0)
+    after = db_counters(conn)
+    api = sim_call(sim_base, "/__sim/stats")
+    return {
+        "scenario": name,
+        "seconds": round(seconds, 2),
+        "records": records,
+        "records_per_s": round(records / seconds, 1) if seconds else 0.0,
+        "api_requests": api["requests"],
+        "api_throttled": api["throttled"],
+        "tuples_written": after["tuples"] - before["tuples"],
+        "commits": after["commits"] - before["commits"],
+        "wal_bytes": after["wal"] - before["wal"],
+    }
+
+
+def compare(results, baseline_path: Path, tolerance: float) -> list:
+    baseline = {r["scenario"]: r for r in json.loads(baseline_path.read_text())["results"]}
+    regressions = []
+    for result in results:
+        base = baseline.get(result["scenario"])
+        if not base:
+            continue
+        for metric in LOWER_IS_BETTER + ("records_per_s",):
+            old, new = base.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            worse = new > old * (1 + tolerance) if metric in LOWER_IS_BETTER else new < old * (1 - tolerance)
+            if worse:
+                regressions.append(f"{result['scenario']}.{metric}: {old} → {new}")
+    return regressions
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark sync_agent against the Procore simulator")
+    parser.add_argument("--db", default="nerv_eva00_simbench", help="Scratch database")
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--rfis", type=int, default=100000)
+    parser.add_argument("--submittals", type=int, default=100000)
+    parser.add_argument("--drawings", type=int, default=10000)
+    parser.add_argument("--fixtures", type=Path, help="Recorded fixtures directory (see procore-sim.py)")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--rate-limit", type=int, default=6000,
+                        help="Simulator requests per window (real Procore: 100 per 60s)")
+    parser.add_argument("--rate-window", type=float, default=60.0)
+    parser.add_argument("--mutate", type=int, default=1000, help="Records touched per entity before 'delta'")
+    parser.add_argument("--scenarios", default="full,noop,delta,reconcile,client")
+    parser.add_argument("--save", type=Path, help="Write results as JSON (e.g. a new baseline)")
+    parser.add_argument("--baseline", type=Path, help="Fail if any metric is worse than this run by --tolerance")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    if args.db == os.environ.get("EVA00_DB", "nerv_eva00"):
+        print(f"ERROR: refusing to benchmark into the configured EVA-00 database ({args.db}).")
+        sys.exit(1)
+
+    port = _free_port()
+    sim_base = f"http://127.0.0.1:{port}"
+    creds_dir = Path(tempfile.mkdtemp(prefix="procore-sim-creds-"))
+    write_credentials(creds_dir)
+    project_ids = ",".join(str(PROJECT_ID_BASE + p) for p in range(args.projects))
+
+    # procore_client and sync_agent read all of this at import time
+    os.environ.update({
+        "EVA00_DB": args.db,
+        "PROCORE_API_BASE": sim_base,
+        "PROCORE_AUTH_URL": f"{sim_base}/oauth/token",
+        "PROCORE_CREDS_DIR": str(creds_dir),
+        "PROCORE_COMPANY_ID": str(COMPANY_ID),
+        "PROCORE_PROJECT_IDS": project_ids,
+        "PROCORE_RATE_PER_SECOND": str(args.rate_limit / args.rate_window),
+        "PROCORE_RATE_MAX_PER_SECOND": str(args.rate_limit / args.rate_window),
+        "EVA00_EMBED_ON_SYNC": "false",
+    })
+    sys.path.insert(0, str(WORKSPACE / "eva-agent" / "eva-00" / "src"))
+
+    sim = start_simulator(args, port)
+    try:
+        import sync_agent
+        from procore_client import ProcoreClient
+
+        conn = psycopg2.connect(dbname=args.db, user=sync_agent.DB_USER, host=sync_agent.DB_HOST,
+                                port=sync_agent.DB_PORT)
+        ensure_schema(conn)
+        client = ProcoreClient(company_id=COMPANY_ID)
+        agent_conn = sync_agent.get_conn()
+
+        def sync_pass(full: bool):
+            def run():
+                totals = sync_agent.run_sync_pass(client, agent_conn, force_all=True, full=full)
+                return totals["created"] + totals["updated"] + totals["unchanged"]
+            return run
+
+        def mutate_then_sync():
+            for entity in ("rfis", "submittals", "drawing_revisions"):
+                sim_call(sim_base, f"/__sim/mutate?entity={entity}&count={args.mutate}", "POST")
+            return sync_pass(False)()
+
+        def client_listing():
+            return sum(1 for p in project_ids.split(",")
+                       for _ in client.iter_all(f"/rest/v1.0/projects/{p}/rfis"))
+
+        scenarios = {
+            "full": sync_pass(True),
+            "noop": sync_pass(False),
+            "delta": mutate_then_sync,
+            "reconcile": sync_pass(True),
+            "client": client_listing,
+        }
+        results = []
+        print(f"\n{'scenario':<10} {'sec':>8} {'rec/s':>9} {'api':>7} {'429':>5} {'tuples':>9} {'commits':>8} {'WAL MB':>8}")
+        print("-" * 72)
+        for name in args.scenarios.split(","):
+            r = measure(name, scenarios[name], conn, sim_base)
+            results.append(r)
+            print(f"{name:<10} {r['seconds']:>8.1f} {r['records_per_s']:>9.0f} {r['api_requests']:>7} "
+                  f"{r['api_throttled']:>5} {r['tuples_written']:>9} {r['commits']:>8} "
+                  f"{r['wal_bytes'] / 1e6:>8.1f}")
+
+        sync_agent.return_conn(agent_conn)
+        client.close()
+        conn.close()
+    finally:
+        sim.terminate()
+        sim.wait()
+
+    config = {k: getattr(args, k) for k in ("projects", "rfis", "submittals", "drawings", "latency_ms",
+                                            "rate_limit", "rate_window", "mutate")}
+    if args.save:
+        args.save.write_text(json.dumps({"config": config, "results": results}, indent=2))
+        print(f"\nSaved {args.save}")
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        if regressions:
+            print(f"\nREGRESSIONS (>{args.tolerance:.0%} worse than {args.baseline}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
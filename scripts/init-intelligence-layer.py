@@ -4,8 +4,9 @@
 Usage:
     python3 scripts/init-intelligence-layer.py [--verify-only]
 
-Applies INTELLIGENCE-LAYER-SCHEMA.sql to the nerv_eva00 database.
-Safely skips if tables already exist.
+Applies INTELLIGENCE-LAYER-SCHEMA.sql to the nerv_eva00 database. If the
+intelligence layer already exists, applies INTELLIGENCE-LAYER-UPGRADES.sql
+instead, which creates only the objects an older schema is missing.
 """
 
 import os
@@ -21,6 +22,7 @@ DB_HOST = os.environ.get("EVA00_DB_HOST", "localhost")
 DB_PORT = os.environ.get("EVA00_DB_PORT", "5432")
 
 SCHEMA_FILE = Path(__file__).parent.parent / "eva-agent" / "eva-00-design" / "INTELLIGENCE-LAYER-SCHEMA.sql"
+UPGRADES_FILE = SCHEMA_FILE.with_name("INTELLIGENCE-LAYER-UPGRADES.sql")
 
 EXPECTED_TABLES = [
     "signals",
@@ -32,6 +34,10 @@ EXPECTED_TABLES = [
     "radar_items",
     "radar_activity",
     "radar_document_links",
+    "synthesis_jobs",
+    "synthesis_schedules",
+    "synthesis_schedule_runs",
+    "llm_signal_cache",
 ]
 
 EXPECTED_TYPES = [
@@ -50,6 +56,7 @@ EXPECTED_TYPES = [
     "radar_status",
     "radar_activity_type",
     "radar_link_source",
+    "synthesis_job_status",
 ]
 
 
@@ -92,11 +99,7 @@ def check_types(conn):
 
 
 def apply_schema(conn):
-    """Apply the intelligence layer schema."""
-    sql = SCHEMA_FILE.read_text()
-
-    # Split into individual statements and run each one,
-    # wrapping in IF NOT EXISTS where possible
+    """Apply the intelligence layer schema, or the upgrades if it already exists."""
     with conn.cursor() as cur:
         # First check if any intelligence tables exist
         cur.execute("""
@@ -105,17 +108,21 @@ def apply_schema(conn):
                 WHERE table_name = 'signals'
             )
         """)
-        if cur.fetchone()[0]:
-            print("Intelligence layer tables already exist. Use --verify-only to check state.")
-            print("To re-apply, drop existing tables first (manual operation).")
-            return False
+        upgrade = cur.fetchone()[0]
+
+    if upgrade:
+        # Idempotent: creates only the objects an older schema is missing
+        print("Intelligence layer tables already exist. Applying upgrades.")
+        sql = UPGRADES_FILE.read_text()
+    else:
+        sql = SCHEMA_FILE.read_text()
 
-    # Apply the full schema as a single transaction
+    # Apply as a single transaction
     with conn.cursor() as cur:
         try:
             cur.execute(sql)
             conn.commit()
-            print("Schema applied successfully.")
+            print("Upgrades applied successfully." if upgrade else "Schema applied successfully.")
             return True
         except Exception as e:
             conn.rollback()
@@ -189,9 +196,10 @@ def main():
     parser.add_argument("--verify-only", action="store_true", help="Only verify, don't apply schema")
     args = parser.parse_args()
 
-    if not SCHEMA_FILE.exists():
-        print(f"Schema file not found: {SCHEMA_FILE}")
-        sys.exit(1)
+    for path in (SCHEMA_FILE, UPGRADES_FILE):
+        if not path.exists():
+            print(f"Schema file not found: {path}")
+            sys.exit(1)
 
     conn = get_conn()
 
@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""Local Procore API stand-in for load-testing the sync agent offline.
+
+Serves the endpoints sync_agent.py, procore_client.py and ingest_procore.py
+call, from synthetic fixtures (or recorded JSON), with Procore's pagination
+headers, per-request latency, a per-token rate limit (X-Rate-Limit-* headers,
+429 + Retry-After, or dropped connections like the real API) and updated_at
+filters. Records are generated on demand from their index, so 100k+ RFIs and
+submittals cost a few MB.
+
+Usage:
+    python3 scripts/procore-sim.py --port 8555 --projects 20 --rfis 100000 --submittals 100000
+    python3 scripts/procore-sim.py --fixtures recorded/ --latency-ms 120 --drop-on-limit
+
+Recorded fixtures replace synthetic data per file: <dir>/projects.json,
+<dir>/companies.json, <dir>/<project_id>/<entity>.json with entity one of
+rfis, submittals, drawing_revisions, vendors, users, documents.
+
+Control endpoints (no auth, not rate limited):
+    GET  /__sim/stats                       request counts by route, 429s, bytes
+    POST /__sim/reset-stats
+    POST /__sim/mutate?entity=rfis&count=500  touch records (new updated_at + content)
+"""
+
+import argparse
+import json
+import random
+import re
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+COMPANY_ID = 4281379
+PROJECT_ID_BASE = 316000
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+MAX_PER_PAGE = 100
+
+WORDS = [
+    "concrete", "rebar", "footing", "slab", "column", "beam", "steel", "joist",
+    "deck", "masonry", "waterproofing", "membrane", "roofing", "flashing", "curtain",
+    "glazing", "drywall", "framing", "ceiling", "door", "hardware", "elevator",
+    "sprinkler", "ductwork", "chiller", "pump", "valve", "conduit", "panel",
+    "switchgear", "anchor", "embed", "connection", "weld", "insulation", "sealant",
+]
+SPEC_SECTIONS = ["03 30 00", "05 12 00", "07 92 00", "08 44 13", "09 29 00", "23 05 00", "26 24 16"]
+DISCIPLINES = ["Architectural", "Structural", "Mechanical", "Electrical", "Plumbing"]
+# Per-project entity id blocks: project p's rfi i is (p_index * ID_STRIDE + ENTITY_OFFSET + i)
+ID_STRIDE = 10_000_000
+ENTITY_OFFSETS = {"rfis": 0, "submittals": 2_000_000, "drawing_revisions": 4_000_000,
+                  "drawings": 6_000_000, "vendors": 8_000_000, "users": 8_500_000, "documents": 9_000_000}
+
+
+def _ts(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_ts(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _words(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+class Fixtures:
+    """Synthetic records per (project, entity), optionally overridden by recorded JSON."""
+
+    def __init__(self, projects: int, rfis: int, submittals: int, drawings: int,
+                 vendors: int, users: int, folders: int, files_per_folder: int, fixtures_dir: Path = None):
+        self.project_ids = [PROJECT_ID_BASE + p for p in range(projects)]
+        projects = max(projects, 1)
+        self.counts = {
+            "rfis": rfis // projects,
+            "submittals": submittals // projects,
+            "drawing_revisions": drawings // projects * 2,  # two revisions per drawing
+            "vendors": vendors,
+            "users": users,
+            "documents": folders * (files_per_folder + 1),
+        }
+        self.folders = folders
+        self.files_per_folder = files_per_folder
+        self.lock = threading.Lock()
+        # (project_id, entity) → {index: (version, updated_at)}; untouched records are version 0
+        self.touched = {}
+        self.recorded = {}
+        if fixtures_dir:
+            self._load_recorded(Path(fixtures_dir))
+
+    def _load_recorded(self, root: Path):
+        for path in root.rglob("*.json"):
+            records = json.loads(path.read_text())
+            if path.parent == root:
+                self.recorded[(None, path.stem)] = records
+            else:
+                self.recorded[(int(path.parent.name), path.stem)] = records
+                if int(path.parent.name) not in self.project_ids:
+                    self.project_ids.append(int(path.parent.name))
+
+    def _index_id(self, project_id: int, entity: str, index: int) -> int:
+        p = self.project_ids.index(project_id) if project_id in self.project_ids else 0
+        return (p + 1) * ID_STRIDE + ENTITY_OFFSETS[entity] + index
+
+    def _state(self, project_id: int, entity: str, index: int):
+        version, updated = self.touched.get((project_id, entity), {}).get(index, (0, None))
+        if updated is None:
+            updated = EPOCH + timedelta(minutes=index)
+        return version, updated
+
+    # -------------------------------------------------------------------------
+
+    def projects(self):
+        if (None, "projects") in self.recorded:
+            return self.recorded[(None, "projects")]
+        return [{
+            "id": pid, "name": f"Sim Project {i + 1}", "project_number": f"S-{i + 1:03d}",
+            "active": True, "start_date": "2024-01-01", "completion_date": "2026-06-30",
+            "address": f"{100 + i} Main St", "city": "Burlington", "state_code": "VT", "zip": "05401",
+            "estimated_value": 1_000_000 * (i + 1), "updated_at": _ts(EPOCH),
+        } for i, pid in enumerate(self.project_ids)]
+
+    def companies(self):
+        return self.recorded.get((None, "companies"), [])
+
+    def count(self, project_id: int, entity: str) -> int:
+        recorded = self.recorded.get((project_id, entity))
+        return len(recorded) if recorded is not None else self.counts[entity]
+
+    def record(self, project_id: int, entity: str, index: int) -> dict:
+        recorded = self.recorded.get((project_id, entity))
+        if recorded is not None:
+            return recorded[index]
+        version, updated = self._state(project_id, entity, index)
+        rng = random.Random(f"{project_id}:{entity}:{index}:{version}")
+        rid = self._index_id(project_id, entity, index)
+        build = getattr(self, f"_{entity}")
+        record = build(project_id, index, rid, rng)
+        record["updated_at"] = _ts(updated)
+        if version:
+            field = {"rfis": "subject", "users": "last_name"}.get(entity, "title" if "title" in record else "name")
+            record[field] += f" (rev {version})"
+        return record
+
+    def _rfis(self, project_id, index, rid, rng):
+        answered = rng.random() < 0.5
+        return {
+            "id": rid, "number": index + 1, "full_number": f"{index + 1:04d}",
+            "subject": f"{_words(rng, 4).title()}", "status": "closed" if answered else "open",
+            "questions": [{"body": _words(rng, 40),
+                           "answers": [{"body": _words(rng, 25), "official": True}] if answered else []}],
+            "initiated_at": _ts(EPOCH + timedelta(minutes=index)),
+            "due_date": (EPOCH + timedelta(days=14 + index % 60)).date().isoformat(),
+            "cost_impact": {"status": "yes" if rng.random() < 0.1 else "no", "value": None},
+            "schedule_impact": {"status": "no", "value": None},
+            "location": {"name": f"Level {1 + index % 8}"},
+            "created_by": {"id": self._index_id(project_id, "users", index % max(self.counts["users"], 1))},
+            "attachments": [],
+        }
+
+    def _submittals(self, project_id, index, rid, rng):
+        vendor = self._index_id(project_id, "vendors", index % max(self.counts["vendors"], 1))
+        return {
+            "id": rid, "number": index + 1, "formatted_number": f"{index + 1:04d}", "revision": 0,
+            "title": _words(rng, 4).title(), "description": _words(rng, 30),
+            "specification_section": {"number": rng.choice(SPEC_SECTIONS)},
+            "type": {"name": rng.choice(["Product Data", "Shop Drawing", "Sample"])},
+            "status": {"name": rng.choice(["Open", "Approved", "Revise and Resubmit"])},
+            "responsible_contractor": {"id": vendor},
+            "created_at": _ts(EPOCH + timedelta(minutes=index)),
+            "lead_time": rng.randint(5, 90),
+            "attachments": [],
+        }
+
+    def _drawing_revisions(self, project_id, index, rid, rng):
+        drawing = index // 2
+        discipline = DISCIPLINES[drawing % len(DISCIPLINES)]
+        return {
+            "id": rid, "drawing_id": self._index_id(project_id, "drawings", drawing),
+            "number": f"{discipline[0]}-{100 + drawing}", "title": _words(rng, 3).title(),
+            "discipline": discipline, "revision_number": str(index % 2), "current": index % 2 == 1,
+            "drawing_date": (EPOCH + timedelta(days=drawing % 300)).date().isoformat(),
+            "drawing_set": {"name": "Issued for Construction" if index % 2 else "Bid Set"},
+        }
+
+    def _vendors(self, project_id, index, rid, rng):
+        return {"id": rid, "name": f"{_words(rng, 2).title()} {rng.choice(['Mechanical', 'Electric', 'Steel'])}",
+                "email_address": f"office{index}@example.com", "business_phone": "802-555-0100",
+                "address": f"{index} Industrial Ave", "city": "Williston", "state_code": "VT"}
+
+    def _users(self, project_id, index, rid, rng):
+        vendor = self._index_id(project_id, "vendors", index % max(self.counts["vendors"], 1))
+        return {"id": rid, "first_name": rng.choice(["Ana", "Ben", "Cam", "Dee"]), "last_name": f"User{index}",
+                "job_title": "Project Manager", "email_address": f"user{index}@example.com",
+                "business_phone": "802-555-0101", "mobile_phone": None, "vendor": {"id": vendor}}
+
+    def _documents(self, project_id, index, rid, rng):
+        # Folder f owns items f*(k+1) .. f*(k+1)+k: the folder itself, then its k files
+        stride = self.files_per_folder + 1
+        folder, slot = divmod(index, stride)
+        if slot == 0:
+            return {"id": rid, "name": f"Folder {folder}", "document_type": "folder",
+                    "name_with_path": f"/Folder {folder}"}
+        return {"id": rid, "name": f"{_words(rng, 2)}.pdf", "document_type": "file", "size": rng.randint(10**4, 10**7),
+                "name_with_path": f"/Folder {folder}/file{slot}.pdf",
+                "url": f"/__sim/files/{rid}"}
+
+    def document_parent(self, project_id: int, index: int):
+        """Folder tree: folder f's parent is folder (f - 1) // 4, folder 0 is at the root."""
+        stride = self.files_per_folder + 1
+        folder, slot = divmod(index, stride)
+        parent_folder = folder if slot else (folder - 1) // 4 if folder else None
+        return None if parent_folder is None else self._index_id(project_id, "documents", parent_folder * stride)
+
+    def find(self, project_id: int, entity: str, rid: int):
+        recorded = self.recorded.get((project_id, entity))
+        if recorded is not None:
+            return next((r for r in recorded if r.get("id") == rid), None)
+        index = rid - self._index_id(project_id, entity, 0)
+        return self.record(project_id, entity, index) if 0 <= index < self.counts[entity] else None
+
+    def mutate(self, entity: str, count: int, rng: random.Random) -> int:
+        now = datetime.now(timezone.utc)
+        touched = 0
+        with self.lock:
+            for _ in range(count):
+                project_id = rng.choice(self.project_ids)
+                total = self.count(project_id, entity)
+                if not total or (project_id, entity) in self.recorded:
+                    continue
+                index = rng.randrange(total)
+                state = self.touched.setdefault((project_id, entity), {})
+                state[index] = (state.get(index, (0, None))[0] + 1, now)
+                touched += 1
+        return touched
+
+
+# =============================================================================
+# RATE LIMIT + STATS
+# =============================================================================
+
+class RateWindow:
+    """Fixed-window request budget per access token, like Procore's."""
+
+    def __init__(self, limit: int, window: float):
+        self.limit, self.window = limit, window
+        self.lock = threading.Lock()
+        self.windows = {}
+
+    def take(self, token: str):
+        """Returns (allowed, remaining, reset_epoch)."""
+        now = time.time()
+        with self.lock:
+            start, used = self.windows.get(token, (now, 0))
+            if now - start >= self.window:
+                start, used = now, 0
+            used += 1
+            self.windows[token] = (start, used)
+        return used <= self.limit, max(self.limit - used, 0), start + self.window
+
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.by_route = {}
+            self.throttled = 0
+            self.dropped = 0
+            self.bytes = 0
+            self.started = time.time()
+
+    def record(self, route: str, nbytes: int, status: int):
+        with self.lock:
+            self.requests += 1
+            self.by_route[route] = self.by_route.get(route, 0) + 1
+            self.bytes += nbytes
+            if status == 429:
+                self.throttled += 1
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {"requests": self.requests, "throttled": self.throttled, "dropped": self.dropped,
+                    "bytes": self.bytes, "by_route": dict(sorted(self.by_route.items())),
+                    "seconds": round(time.time() - self.started, 3)}
+
+
+# =============================================================================
+# HTTP
+# =============================================================================
+
+PROJECT_ROUTE = re.compile(r"^/rest/v1\.[01]/projects/(\d+)/(rfis|submittals|drawing_revisions|vendors|users|documents)(?:/(\d+))?$")
+
+
+class SimHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection pooling is exercised
+    server_version = "ProcoreSim/1.0"
+    fixtures: Fixtures = None
+    rate: RateWindow = None
+    stats: Stats = None
+    latency: float = 0.0
+    jitter: float = 0.0
+    drop_on_limit = False
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send_json(self, status: int, body, headers: dict = None, route: str = None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, str(v))
+        self.end_headers()
+        self.wfile.write(data)
+        if route:
+            self.stats.record(route, len(data), status)
+
+    def _drain_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self._drain_body()
+        if url.path == "/oauth/token":
+            self._send_json(200, {"access_token": f"sim-{time.time_ns()}", "refresh_token": "sim-refresh",
+                                  "token_type": "bearer", "expires_in": 5400, "created_at": int(time.time())},
+                            route="oauth")
+        elif url.path == "/__sim/reset-stats":
+            self.stats.reset()
+            self._send_json(200, {"status": "reset"})
+        elif url.path == "/__sim/mutate":
+            q = parse_qs(url.query)
+            entity = q.get("entity", ["rfis"])[0]
+            count = int(q.get("count", ["100"])[0])
+            touched = self.fixtures.mutate(entity, count, random.Random(int(q.get("seed", ["0"])[0]) or None))
+            self._send_json(200, {"entity": entity, "touched": touched})
+        else:
+            self._send_json(404, {"error": "not found"}, route="404")
+        del body
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/__sim/stats":
+            self._send_json(200, self.stats.snapshot())
+            return
+        if url.path.startswith("/__sim/files/"):
+            self._send_file(url.path.rsplit("/", 1)[1])
+            return
+
+        token = (self.headers.get("Authorization") or "").split(" ", 1)[-1]
+        if not token:
+            self._send_json(401, {"error": "missing token"}, route="401")
+            return
+        allowed, remaining, reset = self.rate.take(token)
+        if not allowed and self.drop_on_limit:
+            # What the real API does when pushed too hard: the connection just goes away
+            with self.stats.lock:
+                self.stats.dropped += 1
+            self.close_connection = True
+            try:
+                self.connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            return
+        rate_headers = {"X-Rate-Limit-Limit": self.rate.limit, "X-Rate-Limit-Remaining": remaining,
+                        "X-Rate-Limit-Reset": int(reset)}
+        if not allowed:
+            self._send_json(429, {"error": "rate limited"},
+                            {**rate_headers, "Retry-After": max(int(reset - time.time()) + 1, 1)}, route="429")
+            return
+
+        if self.latency or self.jitter:
+            time.sleep(max(self.latency + random.uniform(-self.jitter, self.jitter), 0))
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/rest/v1.1/projects":
+            self._send_page(self.fixtures.projects(), query, rate_headers, "projects")
+            return
+        if url.path == "/rest/v1.0/companies":
+            self._send_page(self.fixtures.companies(), query, rate_headers, "companies")
+            return
+        match = PROJECT_ROUTE.match(url.path)
+        if not match or int(match.group(1)) not in self.fixtures.project_ids:
+            self._send_json(404, {"error": "not found"}, rate_headers, route="404")
+            return
+
+        project_id, entity, rid = int(match.group(1)), match.group(2), match.group(3)
+        if rid:
+            record = self.fixtures.find(project_id, entity, int(rid))
+            self._send_json(200 if record else 404, record or {"error": "not found"}, rate_headers,
+                            route=f"{entity}/:id")
+        elif entity == "documents":
+            self._send_documents(project_id, query, rate_headers)
+        else:
+            self._send_listing(project_id, entity, query, rate_headers)
+
+    def _send_page(self, records, query, headers, route):
+        per_page = min(int(query.get("per_page", MAX_PER_PAGE)), MAX_PER_PAGE)
+        page = max(int(query.get("page", 1)), 1)
+        body = records[(page - 1) * per_page: page * per_page]
+        self._send_json(200, body, {**headers, "Total": len(records), "Per-Page": per_page}, route=route)
+
+    def _send_listing(self, project_id, entity, query, headers):
+        """Paginated listing, honouring filters[updated_at]=since...until."""
+        fixtures = self.fixtures
+        total = fixtures.count(project_id, entity)
+        indices = range(total)
+        window = query.get("filters[updated_at]")
+        if window and "..." in window:
+            since, until = (_parse_ts(v) for v in window.split("...", 1))
+            if (project_id, entity) in fixtures.recorded:
+                indices = [i for i in indices
+                           if since <= _parse_ts(fixtures.record(project_id, entity, i)["updated_at"]) <= until]
+            else:
+                # Untouched record i was updated at EPOCH + i minutes; touched ones carry their own time
+                first = max(int((since - EPOCH).total_seconds() // 60), 0)
+                last = min(int((until - EPOCH).total_seconds() // 60), total - 1)
+                touched = fixtures.touched.get((project_id, entity), {})
+                base = (i for i in range(first, last + 1) if i not in touched)
+                indices = sorted(set(base) | {i for i, (_, ts) in touched.items() if since <= ts <= until})
+        per_page = min(int(query.get("per_page", MAX_PER_PAGE)), MAX_PER_PAGE)
+        page = max(int(query.get("page", 1)), 1)
+        selected = indices[(page - 1) * per_page: page * per_page]
+        body = [fixtures.record(project_id, entity, i) for i in selected]
+        self._send_json(200, body, {**headers, "Total": len(indices), "Per-Page": per_page}, route=entity)
+
+    def _send_documents(self, project_id, query, headers):
+        """Unpaginated folder listing; filters[parent_id] picks the folder."""
+        fixtures = self.fixtures
+        parent = query.get("filters[parent_id]")
+        parent = int(parent) if parent else None
+        if (project_id, "documents") in fixtures.recorded:
+            body = [d for d in fixtures.recorded[(project_id, "documents")] if d.get("parent_id") == parent]
+        else:
+            body = [fixtures.record(project_id, "documents", i) for i in range(fixtures.count(project_id, "documents"))
+                    if fixtures.document_parent(project_id, i) == parent]
+        self._send_json(200, body, headers, route="documents")
+
+    def _send_file(self, rid: str):
+        """Deterministic file body with Range support, for download tests."""
+        data = (f"%PDF-1.4 simulated file {rid}\n".encode()) * 2048
+        start = 0
+        rng = re.match(r"bytes=(\d+)-", self.headers.get("Range") or "")
+        if rng:
+            start = int(rng.group(1))
+            if start >= len(data):
+                self._send_json(416, {"error": "range not satisfiable"}, route="files")
+                return
+        chunk = data[start:]
+        self.send_response(206 if rng else 200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(chunk)))
+        if rng:
+            self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+        self.end_headers()
+        self.wfile.write(chunk)
+        self.stats.record("files", len(chunk), 206 if rng else 200)
+
+
+def build_server(args) -> ThreadingHTTPServer:
+    fixtures = Fixtures(args.projects, args.rfis, args.submittals, args.drawings, args.vendors, args.users,
+                        args.folders, args.files_per_folder, args.fixtures)
+    handler = type("Handler", (SimHandler,), {
+        "fixtures": fixtures, "rate": RateWindow(args.rate_limit, args.rate_window), "stats": Stats(),
+        "latency": args.latency_ms / 1000, "jitter": args.jitter_ms / 1000, "drop_on_limit": args.drop_on_limit,
+    })
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Local Procore API simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8555)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--rfis", type=int, default=10000, help="Total across all projects")
+    parser.add_argument("--submittals", type=int, default=10000, help="Total across all projects")
+    parser.add_argument("--drawings", type=int, default=2000, help="Total across all projects")
+    parser.add_argument("--vendors", type=int, default=40, help="Per project")
+    parser.add_argument("--users", type=int, default=60, help="Per project")
+    parser.add_argument("--folders", type=int, default=40, help="Document folders per project")
+    parser.add_argument("--files-per-folder", type=int, default=10)
+    parser.add_argument("--fixtures", type=Path, help="Directory of recorded JSON fixtures")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--rate-limit", type=int, default=100, help="Requests per window per token")
+    parser.add_argument("--rate-window", type=float, default=60.0, help="Seconds")
+    parser.add_argument("--drop-on-limit", action="store_true",
+                        help="Drop the connection instead of answering 429 (real Procore behaviour)")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    server = build_server(args)
+    print(f"Procore simulator on http://{args.host}:{args.port} — {args.projects} projects, "
+          f"{args.rfis:,} RFIs, {args.submittals:,} submittals, limit {args.rate_limit}/{args.rate_window:.0f}s",
+          flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()